@@ -1,5 +1,6 @@
 # API routes module
 from .actions import router as actions_router
 from .settings import router as settings_router
+from .admin import router as admin_router
 
-__all__ = ["actions_router", "settings_router"]
+__all__ = ["actions_router", "settings_router", "admin_router"]
@@ -1,5 +1,8 @@
 """API routes for action items and related operations."""
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query
 
 from app.models import (
     ExtractActionItemsRequest,
@@ -12,14 +15,41 @@ from app.models import (
     BulkNotificationResponse,
     ActionItem,
     JiraConfig,
+    ActionItemRecord,
+    ActionItemBatchCreateRequest,
+    ActionItemBatchUpdateRequest,
+    ActionItemBatchCompleteRequest,
+    ActionItemBatchDeleteRequest,
+    ActionItemBatchResponse,
+    ActionItemBatchResultResponse,
+    PendingActionItemPage,
+    ActionItemSearchResponse,
+    ActionItemHistoryPage,
 )
 from app.services import (
     extract_action_items_from_text,
     create_jira_tickets,
     send_slack_notification,
     send_reminders,
+    get_assignee_resolver,
+)
+from app.async_database import (
+    save_action_items,
+    update_action_items,
+    complete_action_items,
+    delete_action_items,
+    get_pending_action_item_rows,
+    search_action_item_rows,
+    get_action_item_history,
+)
+from app.row_mapping import SEARCH_RESULT_MAPPER
+from app.api.dependencies import (
+    get_action_items_store,
+    get_next_action_id,
+    decode_cursor,
+    build_pending_page,
+    build_history_page,
 )
-from app.api.dependencies import get_team_members, get_action_items_store, get_next_action_id
 
 router = APIRouter(prefix="/api", tags=["actions"])
 
@@ -168,7 +198,9 @@ async def create_tickets(request: TicketCreateRequest):
                 )
             )
 
-    result = await create_jira_tickets(action_items, request.config)
+    result = await create_jira_tickets(
+        action_items, request.config, await get_assignee_resolver()
+    )
 
     return TicketCreateResponse(
         tickets=[
@@ -193,12 +225,10 @@ async def send_notification(request: SlackNotificationRequest):
     Returns:
         Notification result.
     """
-    team_members = get_team_members()
-
     result = await send_slack_notification(
         assignee=request.assignee,
         message=request.message,
-        team_members=team_members,
+        resolver=await get_assignee_resolver(),
         ticket_key=request.ticket_key,
     )
 
@@ -228,8 +258,6 @@ async def send_reminder_notifications(request: ReminderRequest):
             detail="At least one assignee is required",
         )
 
-    team_members = get_team_members()
-
     # Build reminder message
     message = (
         "📋 *Reminder: You have pending action items*\n\n"
@@ -239,7 +267,7 @@ async def send_reminder_notifications(request: ReminderRequest):
     result = await send_reminders(
         assignees=request.assignees,
         message=message,
-        team_members=team_members,
+        resolver=await get_assignee_resolver(),
     )
 
     return BulkNotificationResponse(
@@ -247,3 +275,169 @@ async def send_reminder_notifications(request: ReminderRequest):
         total_failed=result.total_failed,
         failed_recipients=result.failed_recipients,
     )
+
+
+@router.get("/actions/pending", response_model=PendingActionItemPage)
+async def list_pending_action_items(
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+):
+    """List pending action items, newest first, one page at a time.
+
+    Args:
+        limit: Maximum number of items in the page.
+        cursor: next_cursor from the previous page, if any.
+
+    Returns:
+        A page of pending items and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    rows = await get_pending_action_item_rows(limit=limit + 1, after=after)
+    return build_pending_page(rows, limit)
+
+
+@router.get("/actions/search", response_model=ActionItemSearchResponse)
+async def search_action_items(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    assignee: str | None = Query(None, description="Only items assigned to this name"),
+    status: Literal["all", "pending", "completed"] = Query(
+        "all", description="Filter by completion status"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    offset: int = Query(0, ge=0, le=10_000, description="Ranked results to skip"),
+):
+    """Search action item titles, best matches first.
+
+    Args:
+        q: Search text; the last word matches as a prefix.
+        assignee: Optional assignee filter.
+        status: Optional completion status filter.
+        limit: Maximum number of items in the page.
+        offset: next_offset from the previous page, if any.
+
+    Returns:
+        A page of ranked matches and the offset of the next page.
+    """
+    rows = await search_action_item_rows(q, assignee, status, limit + 1, offset)
+    items = SEARCH_RESULT_MAPPER.map_rows(rows[:limit])
+    next_offset = offset + limit if len(rows) > limit else None
+    return ActionItemSearchResponse(items=items, next_offset=next_offset)
+
+
+@router.get("/actions/history", response_model=ActionItemHistoryPage)
+async def list_action_item_history(
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    assignee: str | None = Query(None, description="Only items assigned to this name"),
+    start: date | None = Query(None, alias="from", description="First completion day"),
+    end: date | None = Query(None, alias="to", description="Last completion day"),
+):
+    """List completed action items, including archived ones, most recent first.
+
+    Serves both the history view and exports, which follow next_cursor until
+    it is null.
+
+    Args:
+        limit: Maximum number of items in the page.
+        cursor: next_cursor from the previous page, if any.
+        assignee: Optional assignee filter.
+        start: Optional first completion day (inclusive).
+        end: Optional last completion day (inclusive).
+
+    Returns:
+        A page of completed items and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the cursor is malformed or the range is inverted.
+    """
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    after = decode_cursor(cursor) if cursor else None
+    rows = await get_action_item_history(
+        limit + 1,
+        after,
+        assignee,
+        start.isoformat() if start else None,
+        end.isoformat() if end else None,
+    )
+    return build_history_page(rows, limit)
+
+
+def _missing_ids(requested: list[int], found: list[int]) -> list[int]:
+    """Return requested IDs that were not found, in request order."""
+    found_set = set(found)
+    return [item_id for item_id in dict.fromkeys(requested) if item_id not in found_set]
+
+
+@router.post(
+    "/actions/items/batch", response_model=ActionItemBatchResponse, status_code=201
+)
+async def create_action_items_batch(request: ActionItemBatchCreateRequest):
+    """Persist many action items in a single transaction.
+
+    Args:
+        request: Request containing the action items to create.
+
+    Returns:
+        The stored action items, in request order.
+    """
+    rows = await save_action_items([item.model_dump() for item in request.items])
+    return ActionItemBatchResponse(items=[ActionItemRecord(**row) for row in rows])
+
+
+@router.patch("/actions/items/batch", response_model=ActionItemBatchResponse)
+async def update_action_items_batch(request: ActionItemBatchUpdateRequest):
+    """Update many action items in a single transaction.
+
+    Args:
+        request: Request containing per-item updates; unset fields are kept.
+
+    Returns:
+        The updated action items and any IDs that were not found.
+    """
+    rows = await update_action_items([update.model_dump() for update in request.updates])
+    return ActionItemBatchResponse(
+        items=[ActionItemRecord(**row) for row in rows],
+        missing=_missing_ids([u.id for u in request.updates], [row["id"] for row in rows]),
+    )
+
+
+@router.post(
+    "/actions/items/batch/complete", response_model=ActionItemBatchResultResponse
+)
+async def complete_action_items_batch(request: ActionItemBatchCompleteRequest):
+    """Mark many action items as completed in a single transaction.
+
+    Args:
+        request: Request containing item IDs and their ticket keys.
+
+    Returns:
+        IDs that were completed and any IDs that were not found.
+    """
+    completed = await complete_action_items(
+        [(item.id, item.ticket_key) for item in request.items]
+    )
+    return ActionItemBatchResultResponse(
+        succeeded=completed,
+        missing=_missing_ids([item.id for item in request.items], completed),
+    )
+
+
+@router.post("/actions/items/batch/delete", response_model=ActionItemBatchResultResponse)
+async def delete_action_items_batch(request: ActionItemBatchDeleteRequest):
+    """Delete many action items in a single transaction.
+
+    Args:
+        request: Request containing the IDs to delete.
+
+    Returns:
+        IDs that were deleted and any IDs that were not found.
+    """
+    deleted = await delete_action_items(request.ids)
+    return ActionItemBatchResultResponse(
+        succeeded=deleted,
+        missing=_missing_ids(request.ids, deleted),
+    )
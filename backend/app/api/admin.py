@@ -0,0 +1,115 @@
+"""API routes for administrative operations."""
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app import async_database as db
+from app.maintenance import MaintenanceInProgressError, get_last_report
+from app.models import (
+    SnapshotRequest,
+    SnapshotResponse,
+    DatabaseStatsResponse,
+    MaintenanceRequest,
+    MaintenanceReport,
+    CacheStats,
+)
+from app.query_stats import query_stats
+from app.services.settings_service import get_cache_stats
+from app.snapshots import SnapshotInProgressError, create_snapshot
+from app.storage import get_engine
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.post("/snapshots", response_model=SnapshotResponse, status_code=201)
+async def take_snapshot(request: SnapshotRequest | None = None):
+    """Take an online snapshot of the database.
+
+    The copy runs on a worker thread in small steps, so API writes continue
+    while it is in progress.
+
+    Args:
+        request: Optional step size and pause overrides.
+
+    Returns:
+        Where the snapshot was written, its size and how long it took.
+
+    Raises:
+        HTTPException: If storage is not SQLite or a snapshot is already running.
+    """
+    if get_engine().name != "sqlite":
+        raise HTTPException(status_code=409, detail="Snapshots require the sqlite storage engine")
+    request = request or SnapshotRequest()
+    try:
+        result = await asyncio.to_thread(
+            create_snapshot, None, request.pages_per_step, request.pause_ms
+        )
+    except SnapshotInProgressError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return SnapshotResponse(**result)
+
+
+@router.get("/db/stats", response_model=DatabaseStatsResponse)
+async def get_database_stats(limit: int = Query(50, ge=1, le=500)):
+    """Get statement latencies, the slow-query log and SQLite internals.
+
+    Args:
+        limit: Maximum number of statements, costliest (by total time) first.
+
+    Returns:
+        Latency histograms per normalized statement, recent slow queries with
+        their plans, connection pool waits and, on the sqlite engine, page
+        and WAL figures.
+    """
+    stats = query_stats.snapshot(limit)
+    if get_engine().name == "sqlite":
+        stats["sqlite"] = await db.get_sqlite_stats()
+    return DatabaseStatsResponse(**stats)
+
+
+@router.delete("/db/stats", status_code=204)
+async def reset_database_stats():
+    """Clear recorded statement latencies, slow queries and waits."""
+    query_stats.reset()
+
+
+@router.get("/maintenance", response_model=MaintenanceReport)
+async def get_maintenance_report():
+    """Get the report of the most recent database maintenance run.
+
+    Raises:
+        HTTPException: If maintenance has not run since the server started.
+    """
+    report = get_last_report()
+    if report is None:
+        raise HTTPException(status_code=404, detail="Maintenance has not run yet")
+    return MaintenanceReport(**report)
+
+
+@router.post("/maintenance", response_model=MaintenanceReport)
+async def run_maintenance(request: MaintenanceRequest | None = None):
+    """Run database maintenance now, outside the scheduled window.
+
+    Args:
+        request: Optional time budget override.
+
+    Returns:
+        What each step did, how long it took and how long it held the writer.
+
+    Raises:
+        HTTPException: If storage is not SQLite or maintenance is already running.
+    """
+    if get_engine().name != "sqlite":
+        raise HTTPException(status_code=409, detail="Maintenance requires the sqlite storage engine")
+    request = request or MaintenanceRequest()
+    try:
+        report = await db.run_maintenance(request.budget_ms)
+    except MaintenanceInProgressError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return MaintenanceReport(**report)
+
+
+@router.get("/cache", response_model=list[CacheStats])
+async def get_cache_statistics():
+    """Get hit and miss counters of the settings and team roster caches."""
+    return [CacheStats(**stats) for stats in get_cache_stats()]
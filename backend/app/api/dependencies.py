@@ -1,7 +1,16 @@
 """Shared dependencies for API routes."""
+import base64
+import binascii
 import itertools
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
 
-from app.models import TeamMember, ActionItem
+from fastapi import HTTPException
+
+from app.async_database import read_session
+from app.models import ActionItem, PendingActionItemPage, ActionItemHistoryPage
+from app.row_mapping import PENDING_ITEM_MAPPER, HISTORY_ITEM_MAPPER, HISTORY_ITEM_COLUMNS
 
 # In-memory store for action items (would be a database in production)
 _action_items_store: dict[int, ActionItem] = {}
@@ -9,56 +18,6 @@ _action_items_store: dict[int, ActionItem] = {}
 # Counter for unique action item IDs
 _action_id_counter = itertools.count(1)
 
-# Default team members (would come from database in production)
-_team_members: list[TeamMember] = [
-    TeamMember(
-        id=1,
-        name="John Smith",
-        initials="JS",
-        slack_id="U123JS",
-        jira_account_id="john.smith",
-        email="john.smith@example.com",
-    ),
-    TeamMember(
-        id=2,
-        name="Sarah Lee",
-        initials="SL",
-        slack_id="U456SL",
-        jira_account_id="sarah.lee",
-        email="sarah.lee@example.com",
-    ),
-    TeamMember(
-        id=3,
-        name="Muthu K",
-        initials="MK",
-        slack_id="U789MK",
-        jira_account_id="muthu.k",
-        email="muthu.k@example.com",
-    ),
-    TeamMember(
-        id=4,
-        name="Anita Patel",
-        initials="AP",
-        slack_id="U012AP",
-        jira_account_id="anita.patel",
-        email="anita.patel@example.com",
-    ),
-    TeamMember(
-        id=5,
-        name="Raj Kumar",
-        initials="RK",
-        slack_id="U345RK",
-        jira_account_id="raj.kumar",
-        email="raj.kumar@example.com",
-    ),
-]
-
-
-def get_team_members() -> list[TeamMember]:
-    """Get the list of team members."""
-    return _team_members
-
-
 def get_action_items_store() -> dict[int, ActionItem]:
     """Get the action items store."""
     return _action_items_store
@@ -72,3 +31,75 @@ def clear_action_items_store():
 def get_next_action_id() -> int:
     """Get the next unique action item ID."""
     return next(_action_id_counter)
+
+
+async def get_read_session() -> AsyncGenerator[Any, None]:
+    """Provide one read session per request.
+
+    Every read a route passes the session to runs on the same pooled
+    connection, inside one read transaction, so a response assembled from
+    several queries reflects a single snapshot. The session closes once the
+    route returns; on engines without transactions it is None.
+    """
+    async with read_session() as session:
+        yield session
+
+
+def encode_cursor(sort_key: int, item_id: int) -> str:
+    """Encode a (sort key, id) keyset position as an opaque cursor."""
+    raw = json.dumps([sort_key, item_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """Decode a cursor back to its (sort key, id) keyset position.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_key, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return int(sort_key), int(item_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def build_pending_page(rows: list[tuple], limit: int) -> PendingActionItemPage:
+    """Build a page of pending items from up to limit + 1 row tuples.
+
+    Rows come from get_pending_action_item_rows: PENDING_ITEM_COLUMNS followed
+    by created_at. The extra row, when present, only signals that another
+    page exists.
+    """
+    page_rows = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and page_rows:
+        last = page_rows[-1]
+        next_cursor = encode_cursor(last[-1], last[0])
+
+    return PendingActionItemPage(
+        items=PENDING_ITEM_MAPPER.map_rows(page_rows),
+        next_cursor=next_cursor,
+    )
+
+
+_HISTORY_COMPLETED_AT = HISTORY_ITEM_COLUMNS.index("completed_at")
+
+
+def build_history_page(rows: list[tuple], limit: int) -> ActionItemHistoryPage:
+    """Build a page of completed items from up to limit + 1 history rows.
+
+    Rows come from get_action_item_history; the cursor holds the
+    (completed_at, id) position of the last item on the page.
+    """
+    page_rows = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and page_rows:
+        last = page_rows[-1]
+        next_cursor = encode_cursor(last[_HISTORY_COMPLETED_AT], last[0])
+
+    return ActionItemHistoryPage(
+        items=HISTORY_ITEM_MAPPER.map_rows(page_rows),
+        next_cursor=next_cursor,
+    )
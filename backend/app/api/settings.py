@@ -1,5 +1,8 @@
 """API routes for settings and team management."""
-from fastapi import APIRouter, HTTPException
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from app.models import (
     TeamMember,
@@ -10,15 +13,20 @@ from app.models import (
     AnalyticsResponse,
     AnalyticsStats,
     TeamMemberStats,
-    PendingActionItem,
     WeeklyTrend,
 )
-from app.database import get_pending_action_items, get_all_team_members, get_analytics_data
+from app.api.dependencies import build_pending_page, get_read_session
+from app.async_database import (
+    get_pending_action_item_rows,
+    get_analytics_data,
+    get_daily_completions,
+)
 from app.services import (
     get_settings as service_get_settings,
     update_settings as service_update_settings,
     get_team_members as service_get_team_members,
     get_team_member as service_get_team_member,
+    suggest_team_members as service_suggest_team_members,
     add_team_member as service_add_team_member,
     update_team_member as service_update_team_member,
     delete_team_member as service_delete_team_member,
@@ -35,7 +43,7 @@ async def get_settings():
     Returns:
         Current UserSettings.
     """
-    return service_get_settings()
+    return await service_get_settings()
 
 
 @router.put("/settings", response_model=UserSettings)
@@ -48,7 +56,7 @@ async def update_settings(settings: UserSettings):
     Returns:
         Updated UserSettings.
     """
-    return service_update_settings(settings)
+    return await service_update_settings(settings)
 
 
 @router.get("/team", response_model=list[TeamMember])
@@ -58,7 +66,25 @@ async def get_team_members():
     Returns:
         List of TeamMember objects.
     """
-    return service_get_team_members()
+    return await service_get_team_members()
+
+
+# Declared before /team/{member_id} so "suggest" is not taken for an ID
+@router.get("/team/suggest", response_model=list[TeamMember])
+async def suggest_team_members(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+):
+    """Suggest team members for an assignee picker.
+
+    Args:
+        prefix: Start of a name, name part, initials or Slack handle.
+        limit: Maximum number of suggestions.
+
+    Returns:
+        Matching team members, full-name matches first.
+    """
+    return await service_suggest_team_members(prefix, limit)
 
 
 @router.get("/team/{member_id}", response_model=TeamMember)
@@ -74,7 +100,7 @@ async def get_team_member(member_id: int):
     Raises:
         HTTPException: If member not found.
     """
-    member = service_get_team_member(member_id)
+    member = await service_get_team_member(member_id)
 
     if not member:
         raise HTTPException(status_code=404, detail="Team member not found")
@@ -92,7 +118,7 @@ async def create_team_member(member: TeamMemberCreate):
     Returns:
         Created TeamMember.
     """
-    return service_add_team_member(member)
+    return await service_add_team_member(member)
 
 
 @router.patch("/team/{member_id}", response_model=TeamMember)
@@ -109,7 +135,7 @@ async def update_team_member(member_id: int, data: TeamMemberUpdate):
     Raises:
         HTTPException: If member not found.
     """
-    result = service_update_team_member(member_id, data)
+    result = await service_update_team_member(member_id, data)
 
     if not result:
         raise HTTPException(status_code=404, detail="Team member not found")
@@ -127,7 +153,7 @@ async def delete_team_member(member_id: int):
     Raises:
         HTTPException: If member not found.
     """
-    if not service_delete_team_member(member_id):
+    if not await service_delete_team_member(member_id):
         raise HTTPException(status_code=404, detail="Team member not found")
 
     return None
@@ -143,33 +169,12 @@ async def get_integration_status():
     return service_get_integration_status()
 
 
-def _get_initials(name: str) -> str:
-    """Extract initials from a name."""
-    return "".join(p[0].upper() for p in name.split() if p)[:2]
-
-
-def _build_pending_items(items_data: list[dict]) -> list[PendingActionItem]:
-    """Convert raw pending items data to PendingActionItem models."""
-    return [
-        PendingActionItem(
-            id=item["id"],
-            title=item["title"],
-            assignee=item["assignee"],
-            due_date=item["due_date"],
-            overdue=bool(item["overdue"]),
-        )
-        for item in items_data
-    ]
-
-
-def _build_leaderboard(
-    team_stats: list[dict], team_member_map: dict[str, str]
-) -> list[TeamMemberStats]:
-    """Build leaderboard from team stats with initials lookup."""
+def _build_leaderboard(team_stats: list[dict]) -> list[TeamMemberStats]:
+    """Build leaderboard from team stats, which carry each member's initials."""
     return [
         TeamMemberStats(
             name=stat["assignee"],
-            initials=team_member_map.get(stat["assignee"], _get_initials(stat["assignee"])),
+            initials=stat["initials"],
             completed=stat["completed_this_week"],
             total=stat["total"],
             completion_percentage=float(stat["completion_rate"]),
@@ -178,38 +183,96 @@ def _build_leaderboard(
     ]
 
 
-# Placeholder weekly trend data (would be computed from historical data in production)
-WEEKLY_TREND_PLACEHOLDER = [
-    WeeklyTrend(week="Mon", completed=4),
-    WeeklyTrend(week="Tue", completed=6),
-    WeeklyTrend(week="Wed", completed=5),
-    WeeklyTrend(week="Thu", completed=8),
-    WeeklyTrend(week="Fri", completed=10),
-    WeeklyTrend(week="Sat", completed=2),
-    WeeklyTrend(week="Sun", completed=1),
-]
+# Pending items embedded in the analytics response; the rest are paged
+ANALYTICS_PENDING_PAGE_SIZE = 50
+
+WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+def _build_trend(
+    daily: dict[str, int], start: date, end: date, bucket: str, weekday_labels: bool
+) -> list[WeeklyTrend]:
+    """Bucket daily completion counts into trend points.
+
+    Args:
+        daily: Completions keyed by ISO day.
+        start: First day of the window.
+        end: Last day of the window.
+        bucket: "day" or "week" (weeks start on Monday).
+        weekday_labels: Label day buckets "Mon".."Sun" instead of "Jan 15".
+    """
+    step = timedelta(days=7 if bucket == "week" else 1)
+    bucket_start = start - timedelta(days=start.weekday()) if bucket == "week" else start
+
+    trend = []
+    while bucket_start <= end:
+        days = (bucket_start + timedelta(days=offset) for offset in range(step.days))
+        completed = sum(daily.get(day.isoformat(), 0) for day in days)
+        if weekday_labels and bucket == "day":
+            label = WEEKDAY_LABELS[bucket_start.weekday()]
+        else:
+            label = f"{bucket_start:%b} {bucket_start.day}"
+        trend.append(WeeklyTrend(week=label, completed=completed))
+        bucket_start += step
+    return trend
 
 
 @router.get("/analytics", response_model=AnalyticsResponse)
-async def get_analytics():
+async def get_analytics(
+    from_date: date | None = Query(None, alias="from", description="Window start (ISO date)"),
+    to_date: date | None = Query(None, alias="to", description="Window end (ISO date)"),
+    bucket: Literal["day", "week"] = Query("day", description="Trend bucket size"),
+    session: Any = Depends(get_read_session),
+):
     """Get analytics data for dashboard.
 
+    Without a window, the trend covers the current Monday-Sunday week and the
+    leaderboard counts the last seven days. With ``from``/``to``, both are
+    served from the daily rollup for that window. All reads share one read
+    session, so the stats, pending items and trend come from one snapshot.
+
+    Args:
+        from_date: Optional first day of the window.
+        to_date: Optional last day of the window.
+        bucket: Trend granularity, "day" or "week".
+        session: Request read session.
+
     Returns:
-        AnalyticsResponse with stats, pending items, and leaderboard.
+        AnalyticsResponse with stats, pending items, leaderboard and trend.
+
+    Raises:
+        HTTPException: If the window is inverted.
     """
-    pending_items = _build_pending_items(get_pending_action_items())
-    team_members = get_all_team_members()
-    team_member_map = {m["name"]: m["initials"] for m in team_members}
-    analytics = get_analytics_data()
+    today = datetime.now(UTC).date()
+    windowed = from_date is not None or to_date is not None
+    if windowed:
+        end = to_date or today
+        start = from_date or end - timedelta(days=6)
+        if start > end:
+            raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    else:
+        start = today - timedelta(days=today.weekday())
+        end = start + timedelta(days=6)
+
+    pending_page = build_pending_page(
+        await get_pending_action_item_rows(ANALYTICS_PENDING_PAGE_SIZE + 1, None, session),
+        ANALYTICS_PENDING_PAGE_SIZE,
+    )
+    if windowed:
+        analytics = await get_analytics_data(start.isoformat(), end.isoformat(), session)
+    else:
+        analytics = await get_analytics_data(session=session)
+    daily = await get_daily_completions(start.isoformat(), end.isoformat(), session)
 
     return AnalyticsResponse(
         stats=AnalyticsStats(
             completed_this_week=analytics.get("completed_this_week", 0),
-            pending_actions=len(pending_items),
-            overdue_count=sum(1 for item in pending_items if item.overdue),
-            active_team_members=analytics.get("active_members", len(team_members)),
+            pending_actions=analytics.get("pending_count", 0),
+            overdue_count=analytics.get("overdue_count", 0),
+            active_team_members=analytics.get("active_members", 0),
         ),
-        pending_items=pending_items,
-        leaderboard=_build_leaderboard(analytics.get("team_stats", []), team_member_map),
-        weekly_trend=WEEKLY_TREND_PLACEHOLDER,
+        pending_items=pending_page.items,
+        pending_next_cursor=pending_page.next_cursor,
+        leaderboard=_build_leaderboard(analytics.get("team_stats", [])),
+        weekly_trend=_build_trend(daily, start, end, bucket, weekday_labels=not windowed),
     )
@@ -0,0 +1,179 @@
+"""Resolution of free-form assignee names to team members.
+
+Claude extracts assignees as they appear in meeting notes: "John Smith",
+"john", "J. Smith", "JS" or an email address. A resolver precomputes every
+key a member can be referred to by, so most names resolve with one dict
+lookup. Names matching no key fall back to character trigram similarity,
+which catches typos such as "Jon Smith"; those results are remembered as
+learned aliases. Ambiguous names (two Johns) resolve to no one rather than
+the wrong person.
+
+Resolvers are immutable apart from learned aliases, so an index is only
+rebuilt when the roster changes. SettingsService keeps the resolver of the
+stored roster with the roster's data version; resolver_for() serves rosters
+passed around as plain lists.
+"""
+import unicodedata
+from collections.abc import Iterable
+
+from app.models import TeamMember
+
+# Minimum Dice coefficient of trigram sets for a fuzzy match
+FUZZY_THRESHOLD = 0.5
+
+# Learned aliases kept per resolver, including remembered misses
+_MAX_LEARNED = 1024
+
+# Resolvers kept by resolver_for(), one per distinct roster
+_MAX_RESOLVERS = 8
+
+# Marks a key shared by several members
+_AMBIGUOUS = -1
+
+
+def normalize_name(text: str) -> str:
+    """Case- and accent-fold a name, keeping only words separated by single spaces."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    kept = "".join(
+        c if c.isalnum() else " " for c in decomposed if not unicodedata.combining(c)
+    )
+    return " ".join(kept.split())
+
+
+def _trigrams(key: str) -> set[str]:
+    """Character trigrams of a normalized name, padded at both ends."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _member_keys(member: TeamMember) -> list[list[str]]:
+    """Keys a member can be referred to by, in decreasing order of priority."""
+    name = normalize_name(member.name)
+    tokens = name.split()
+    handles = []
+    if member.email:
+        handles.append(normalize_name(member.email.split("@")[0]))
+    if member.slack_id:
+        # "@john.smith" handles fold to "john smith"; "U123" ids stay as they are
+        handles.append(normalize_name(member.slack_id))
+    short_forms = []
+    if len(tokens) > 1:
+        short_forms = [f"{tokens[0][0]} {tokens[-1]}", f"{tokens[0]} {tokens[-1][0]}"]
+    return [
+        [name],
+        handles,
+        [normalize_name(member.initials)] if member.initials else [],
+        short_forms,
+        tokens,
+    ]
+
+
+class AssigneeResolver:
+    """Index of a team roster for resolving assignee names.
+
+    Keys, by priority: full name, email local part and Slack handle,
+    initials, short forms ("j smith", "john s"), then single name tokens.
+    A key claimed at a higher priority is not reused at a lower one.
+    """
+
+    def __init__(self, members: Iterable[TeamMember]):
+        """Build the index.
+
+        Args:
+            members: The team roster.
+        """
+        self._members: dict[int, TeamMember] = {}
+        self._keys: dict[str, int] = {}
+        self._grams: dict[str, list[int]] = {}
+        self._gram_counts: dict[int, int] = {}
+        self._learned: dict[str, int | None] = {}
+
+        levels: list[dict[str, set[int]]] = []
+        for member in members:
+            self._members[member.id] = member
+            for priority, keys in enumerate(_member_keys(member)):
+                if priority == len(levels):
+                    levels.append({})
+                for key in keys:
+                    levels[priority].setdefault(key, set()).add(member.id)
+            grams = _trigrams(normalize_name(member.name))
+            self._gram_counts[member.id] = len(grams)
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(member.id)
+
+        for level in levels:
+            for key, ids in level.items():
+                if key and key not in self._keys:
+                    self._keys[key] = next(iter(ids)) if len(ids) == 1 else _AMBIGUOUS
+
+    def __len__(self) -> int:
+        """Number of members indexed."""
+        return len(self._members)
+
+    def resolve(self, name: str | None) -> TeamMember | None:
+        """Find the team member a name refers to.
+
+        Args:
+            name: Assignee name as extracted, e.g. "J. Smith".
+
+        Returns:
+            The member, or None if no member or several members match.
+        """
+        if not name:
+            return None
+        key = normalize_name(name)
+        member_id = self._keys.get(key)
+        if member_id is None:
+            if key in self._learned:
+                member_id = self._learned[key]
+            else:
+                member_id = self._fuzzy_match(key)
+                if len(self._learned) < _MAX_LEARNED:
+                    self._learned[key] = member_id
+        if member_id is None or member_id == _AMBIGUOUS:
+            return None
+        return self._members[member_id]
+
+    def _fuzzy_match(self, key: str) -> int | None:
+        """Member whose name shares the most trigrams with the key, if clearly best."""
+        grams = _trigrams(key)
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for member_id in self._grams.get(gram, ()):
+                shared[member_id] = shared.get(member_id, 0) + 1
+        scores = sorted(
+            (2 * count / (len(grams) + self._gram_counts[member_id]), member_id)
+            for member_id, count in shared.items()
+        )
+        if not scores or scores[-1][0] < FUZZY_THRESHOLD:
+            return None
+        if len(scores) > 1 and scores[-2][0] == scores[-1][0]:
+            return None
+        return scores[-1][1]
+
+
+_resolvers: dict[tuple, AssigneeResolver] = {}
+
+
+def resolver_for(members: list[TeamMember]) -> AssigneeResolver:
+    """Get the resolver for a roster, building it only if the roster is new.
+
+    Recognizing a roster compares every member, O(n) per call; callers with
+    the stored roster use SettingsService.get_assignee_resolver() instead,
+    which keys its resolver on the roster's data version.
+
+    Args:
+        members: The team roster.
+
+    Returns:
+        A resolver shared by every caller passing an identical roster.
+    """
+    fingerprint = tuple(
+        (m.id, m.name, m.initials, m.email, m.slack_id) for m in members
+    )
+    resolver = _resolvers.get(fingerprint)
+    if resolver is None:
+        if len(_resolvers) >= _MAX_RESOLVERS:
+            del _resolvers[next(iter(_resolvers))]
+        resolver = _resolvers[fingerprint] = AssigneeResolver(members)
+    return resolver
@@ -0,0 +1,343 @@
+"""Async counterparts of the app.database operations.
+
+Each operation runs against the configured storage engine (see
+app.storage). Engine calls are blocking, so they are dispatched to a small
+set of dedicated database threads. Async routes await the result instead of
+stalling the event loop while a query runs. Action item writes additionally
+go through a group-commit queue, so concurrent writes share one commit.
+"""
+import asyncio
+import functools
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Any, TypeVar
+
+from app import database, maintenance
+from app.assignee_resolver import AssigneeResolver
+from app.config import settings as app_settings
+from app.storage import get_engine
+from app.write_queue import GroupCommitQueue
+
+T = TypeVar("T")
+
+
+class DatabaseExecutor:
+    """Runs blocking database calls on dedicated worker threads.
+
+    The worker count matches the connection pool (one writer plus the
+    readers). Calls borrow a connection only for their own duration, so a
+    thread waiting for a reader always waits on another running call, never
+    on an await. Read sessions, which keep a reader across awaits, are
+    capped below the reader count (see read_session), so at least one
+    reader is always left for calls and queued calls cannot stall for good.
+    """
+
+    def __init__(self, workers: int):
+        """Create the executor with a fixed number of database threads."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="sanas-db"
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking database function and await its result."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued calls finish."""
+        self._executor.shutdown(wait=True)
+
+
+_executor: DatabaseExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> DatabaseExecutor:
+    """Get the shared database executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = DatabaseExecutor(workers=app_settings.db_pool_readers + 1)
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the shared database executor, if one is running."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run any blocking database callable on the database threads."""
+    return await get_executor().run(func, *args, **kwargs)
+
+
+_write_queue: GroupCommitQueue | None = None
+
+
+def get_write_queue() -> GroupCommitQueue:
+    """Get the shared group-commit queue for action item writes."""
+    global _write_queue
+    with _executor_lock:
+        if _write_queue is None:
+            _write_queue = GroupCommitQueue(
+                max_batch_size=app_settings.write_batch_max_size,
+                max_latency_ms=app_settings.write_batch_max_latency_ms,
+                run_batch=lambda calls: run_db(get_engine().run_write_batch, calls),
+            )
+        return _write_queue
+
+
+async def run_write(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database write through the group-commit queue."""
+    return await get_write_queue().submit(func, *args, **kwargs)
+
+
+# Open read sessions per event loop, at most db_pool_readers - 1 at a time
+_session_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_session_slots() -> asyncio.Semaphore | None:
+    """The running loop's read session semaphore; None if no reader can be spared."""
+    slots = app_settings.db_pool_readers - 1
+    if slots < 1:
+        return None
+    loop = asyncio.get_running_loop()
+    semaphore = _session_slots.get(loop)
+    if semaphore is None:
+        semaphore = _session_slots[loop] = asyncio.Semaphore(slots)
+    return semaphore
+
+
+@asynccontextmanager
+async def read_session() -> AsyncGenerator[Any, None]:
+    """Open a read session for the duration of the block.
+
+    Reads passed the session share one connection and one snapshot. A
+    session holds its reader across awaits, so sessions wait on the event
+    loop for one of db_pool_readers - 1 slots before a reader is borrowed;
+    the remaining reader keeps plain reads, and with them the database
+    threads, moving. With a single reader there is no slot to spare and the
+    block gets None: its reads run unshared.
+    """
+    slots = _get_session_slots()
+    if slots is None:
+        yield None
+        return
+    async with slots:
+        session = await run_db(get_engine().open_read_session)
+        try:
+            yield session
+        finally:
+            if session is not None:
+                await run_db(session.close)
+
+
+# Team members operations
+async def get_all_team_members(session: Any = None) -> list[dict]:
+    """Get all team members from database."""
+    return await run_db(get_engine().get_all_team_members, session)
+
+
+async def get_team_member_rows(session: Any = None) -> list[tuple]:
+    """Get all team members as plain tuples in TEAM_MEMBER_COLUMNS order."""
+    return await run_db(get_engine().get_team_member_rows, session)
+
+
+async def get_team_member_by_id(member_id: int, session: Any = None) -> dict | None:
+    """Get a team member by ID."""
+    return await run_db(get_engine().get_team_member_by_id, member_id, session)
+
+
+async def create_team_member(name: str, initials: str | None, slack_id: str | None,
+                             jira_account_id: str | None, email: str | None) -> dict:
+    """Create a new team member."""
+    return await run_db(
+        get_engine().create_team_member, name, initials, slack_id, jira_account_id, email
+    )
+
+
+async def update_team_member(member_id: int, **updates) -> dict | None:
+    """Update a team member."""
+    return await run_db(get_engine().update_team_member, member_id, **updates)
+
+
+async def delete_team_member(member_id: int) -> bool:
+    """Delete a team member."""
+    return await run_db(get_engine().delete_team_member, member_id)
+
+
+# Settings operations
+async def get_user_settings(session: Any = None) -> dict:
+    """Get user settings from database."""
+    return await run_db(get_engine().get_user_settings, session)
+
+
+async def save_user_settings(settings: dict) -> dict:
+    """Save user settings to database."""
+    return await run_db(get_engine().save_user_settings, settings)
+
+
+async def get_data_versions() -> dict[str, int]:
+    """Get the write counters of the settings and team_members tables."""
+    return await run_db(get_engine().get_data_versions)
+
+
+# Where item writes get the roster resolver from (see set_assignee_resolver)
+_get_assignee_resolver: Callable[[], Awaitable[AssigneeResolver]] | None = None
+
+
+def set_assignee_resolver(
+    get_resolver: Callable[[], Awaitable[AssigneeResolver]] | None,
+) -> None:
+    """Set where action item writes get the roster resolver from.
+
+    app.services.settings_service registers its cached resolver when it is
+    imported; it reads through this module, so this module cannot import
+    it. Until a resolver is set, assignee names are stored as given.
+    """
+    global _get_assignee_resolver
+    _get_assignee_resolver = get_resolver
+
+
+async def _canonical_assignees(items: list[dict]) -> list[dict]:
+    """Replace assignee names that resolve to a team member with the member's name.
+
+    Stored names then link to the member (assignee_id), so items saved as
+    "John" or "J. Smith" count towards that member in analytics. The items
+    passed in are not modified.
+    """
+    if _get_assignee_resolver is None:
+        return items
+    resolver = await _get_assignee_resolver()
+    canonical = []
+    for item in items:
+        member = resolver.resolve(item.get("assignee"))
+        canonical.append({**item, "assignee": member.name} if member else item)
+    return canonical
+
+
+# Action items operations
+async def save_action_item(title: str, assignee: str | None, due_date: str | None,
+                           selected: bool = True, overdue: bool = False) -> dict:
+    """Save an action item to database, storing the canonical assignee name."""
+    [item] = await _canonical_assignees([{"assignee": assignee}])
+    return await run_write(
+        get_engine().save_action_item, title, item["assignee"], due_date, selected, overdue
+    )
+
+
+async def save_action_items(items: list[dict]) -> list[dict]:
+    """Save many action items in one statement, storing canonical assignee names."""
+    return await run_write(get_engine().save_action_items, await _canonical_assignees(items))
+
+
+async def update_action_items(updates: list[dict]) -> list[dict]:
+    """Update many action items in one statement, storing canonical assignee names."""
+    return await run_write(get_engine().update_action_items, await _canonical_assignees(updates))
+
+
+async def get_pending_action_items(limit: int | None = None,
+                                   after: tuple[int, int] | None = None,
+                                   session: Any = None) -> list[dict]:
+    """Get pending (not completed) action items, newest first."""
+    return await run_db(get_engine().get_pending_action_items, limit, after, session)
+
+
+async def get_pending_action_item_rows(limit: int | None = None,
+                                       after: tuple[int, int] | None = None,
+                                       session: Any = None) -> list[tuple]:
+    """Get pending action items as plain tuples, newest first."""
+    return await run_db(get_engine().get_pending_action_item_rows, limit, after, session)
+
+
+async def mark_action_item_completed(item_id: int, ticket_key: str | None = None) -> bool:
+    """Mark an action item as completed."""
+    return await run_write(get_engine().mark_action_item_completed, item_id, ticket_key)
+
+
+async def complete_action_items(completions: list[tuple[int, str | None]]) -> list[int]:
+    """Mark many action items as completed in one statement."""
+    return await run_write(get_engine().complete_action_items, completions)
+
+
+async def delete_action_items(item_ids: list[int]) -> list[int]:
+    """Delete many action items in one statement."""
+    return await run_write(get_engine().delete_action_items, item_ids)
+
+
+async def sweep_overdue_action_items(today: date | None = None) -> int:
+    """Flag pending items whose due date has passed as overdue."""
+    return await run_db(get_engine().sweep_overdue_action_items, today)
+
+
+async def search_action_item_rows(query: str, assignee: str | None = None,
+                                  status: str = "all", limit: int = 20,
+                                  offset: int = 0, session: Any = None) -> list[tuple]:
+    """Search action item titles, best matches first."""
+    return await run_db(
+        get_engine().search_action_item_rows, query, assignee, status, limit, offset, session
+    )
+
+
+async def archive_completed_action_items(older_than_days: int | None = None,
+                                         batch_size: int | None = None) -> int:
+    """Move completed items older than the retention age into the archive.
+
+    Each batch is a separate call on the database threads, so queued reads
+    and writes run between batches.
+    """
+    cutoff = database.archive_cutoff(older_than_days)
+    batch_size = batch_size or app_settings.archive_batch_size
+    archived = 0
+    while moved := await run_db(
+        get_engine().archive_completed_action_items_batch, cutoff, batch_size
+    ):
+        archived += moved
+    return archived
+
+
+async def get_action_item_history(limit: int, after: tuple[int, int] | None = None,
+                                  assignee: str | None = None, start: str | None = None,
+                                  end: str | None = None,
+                                  session: Any = None) -> list[tuple]:
+    """Get completed action items, hot and archived, most recent first."""
+    return await run_db(
+        get_engine().get_action_item_history, limit, after, assignee, start, end, session
+    )
+
+
+async def get_daily_completions(start: str, end: str, session: Any = None) -> dict[str, int]:
+    """Get completions per day from the daily rollup."""
+    return await run_db(get_engine().get_daily_completions, start, end, session)
+
+
+async def get_analytics_data(start: str | None = None, end: str | None = None,
+                             session: Any = None) -> dict:
+    """Get analytics data for dashboard."""
+    return await run_db(get_engine().get_analytics_data, start, end, session)
+
+
+async def get_sqlite_stats() -> dict:
+    """Get SQLite storage internals; only meaningful on the sqlite engine."""
+    return await run_db(database.get_sqlite_stats)
+
+
+async def run_scheduled_maintenance() -> dict | None:
+    """Run database maintenance if inside the maintenance window."""
+    return await run_db(maintenance.run_scheduled_maintenance)
+
+
+async def run_maintenance(budget_ms: float | None = None) -> dict:
+    """Run database maintenance now, regardless of the window."""
+    return await run_db(maintenance.run_maintenance, budget_ms)
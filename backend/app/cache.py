@@ -0,0 +1,98 @@
+"""Read-through caching for data that is read often and written rarely."""
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ReadThroughCache:
+    """Values loaded on first use and kept until a write path invalidates them.
+
+    A load that overlaps an invalidation is returned to its caller but not
+    stored, so a value read before a write never outlives the write. Cached
+    values are shared between callers and must not be mutated.
+
+    Caches of data other processes may write are kept coherent through a
+    version number of the underlying data, which the owner passes to sync()
+    before each read. A changed version drops the cached values.
+
+    The cache is used from the event loop only, so it needs no locking.
+    """
+
+    def __init__(self, name: str):
+        """Create an empty cache.
+
+        Args:
+            name: Label used in statistics.
+        """
+        self.name = name
+        self._values: dict[Hashable, Any] = {}
+        self._generation = 0
+        # Data version the cached values are at least as new as
+        self._version: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Get a cached value, loading and storing it on a miss.
+
+        Args:
+            key: Cache key.
+            load: Coroutine function producing the value.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        if key in self._values:
+            self.hits += 1
+            return self._values[key]
+        self.misses += 1
+        generation = self._generation
+        value = await load()
+        if generation == self._generation:
+            self._values[key] = value
+        return value
+
+    @property
+    def version(self) -> int | None:
+        """Data version of the cached values; None until the first sync after a write."""
+        return self._version
+
+    def sync(self, version: int) -> None:
+        """Drop cached values if the data has changed since the last sync.
+
+        Read the version before loading, never after: values loaded later
+        are then at least as new as the version recorded here.
+
+        Args:
+            version: Current version of the underlying data.
+        """
+        if self._version is not None and version != self._version:
+            self.invalidate()
+        self._version = version
+
+    def invalidate(self) -> None:
+        """Drop every cached value, and any load still in flight."""
+        self._generation += 1
+        self._version = None
+        self._values.clear()
+        self.invalidations += 1
+
+    def reset(self) -> None:
+        """Drop every cached value and zero the counters."""
+        self.invalidate()
+        self.hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """Hit, miss and invalidation counts and the number of cached entries."""
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "entries": len(self._values),
+            "version": self._version,
+        }
@@ -1,4 +1,6 @@
 """Application configuration."""
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,6 +26,50 @@ class Settings(BaseSettings):
     slack_bot_token: str = ""
     slack_webhook_url: str = ""
 
+    # Storage engine: "sqlite" (the database file) or "memory" (no persistence)
+    storage_engine: Literal["sqlite", "memory"] = "sqlite"
+
+    # SQLite connection pool
+    db_pool_readers: int = 4
+    db_busy_timeout_ms: int = 5000
+    db_mmap_size: int = 256 * 1024 * 1024
+    db_cache_size_kib: int = 16 * 1024
+
+    # SQL instrumentation (statement histograms and slow-query log)
+    sql_stats_enabled: bool = True
+    slow_query_ms: float = 100.0
+    slow_query_log_size: int = 100
+
+    # Group commit for action item writes
+    write_batch_max_size: int = 64
+    write_batch_max_latency_ms: float = 2.0
+
+    # Background jobs (seconds between runs; 0 disables)
+    overdue_sweep_interval_seconds: int = 3600
+    archive_interval_seconds: int = 86400
+
+    # Archival of completed action items
+    archive_after_days: int = 90
+    archive_batch_size: int = 500
+
+    # Schema migration backfills (rows per transaction, pause between them)
+    migration_batch_size: int = 1000
+    migration_pause_ms: float = 1.0
+
+    # Online snapshots (empty snapshot_dir means data/snapshots next to the database)
+    snapshot_dir: str = ""
+    snapshot_pages_per_step: int = 256
+    snapshot_pause_ms: float = 5.0
+
+    # Database maintenance (ANALYZE, optimize, incremental vacuum) within a UTC
+    # hour window; equal start and end hours mean any time
+    maintenance_interval_seconds: int = 3600
+    maintenance_window_start_hour: int = 2
+    maintenance_window_end_hour: int = 5
+    maintenance_budget_ms: float = 2000.0
+    maintenance_vacuum_step_pages: int = 128
+    maintenance_analysis_limit: int = 1000
+
     # CORS
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:3000"]
 
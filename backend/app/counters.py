@@ -0,0 +1,98 @@
+"""Verification and rebuild of the trigger-maintained analytics counters.
+
+analytics_counters, assignee_counters and daily_completions are kept
+current by triggers on action_items and action_items_archive. A bug in a
+trigger, or a write made with triggers disabled, leaves them drifting from
+the items they summarize. Verifying recomputes every counter from the
+items and reports the rows that differ, without writing; rebuilding
+replaces the counters with the recomputed values in one transaction:
+    uv run python -m app.counters            # report drift only
+    uv run python -m app.counters --rebuild  # report, then rebuild on drift
+"""
+import argparse
+import json
+import logging
+import sys
+
+from app import database
+
+logger = logging.getLogger(__name__)
+
+
+def verify_counters() -> dict:
+    """Recompute the counters from the items and compare them with the stored rows.
+
+    Returns:
+        Report with the drifting rows per counter table and whether there
+        is any drift.
+    """
+    with database.get_read_db() as conn:
+        # One read transaction, so the items and counters are from one snapshot
+        conn.execute("BEGIN")
+        try:
+            tables = database.verify_analytics_counters(conn.cursor())
+        finally:
+            conn.rollback()
+    return {
+        "drift": any(tables.values()),
+        "tables": tables,
+    }
+
+
+def rebuild_counters(only_on_drift: bool = True) -> dict:
+    """Verify the counters, then rebuild them from the items.
+
+    Verification and rebuild run in one write transaction, so no write
+    lands between the report and the rebuild.
+
+    Args:
+        only_on_drift: Leave the counters untouched when nothing drifted.
+
+    Returns:
+        The verification report, with whether the counters were rebuilt.
+    """
+    with database.get_db() as conn:
+        cursor = conn.cursor()
+        tables = database.verify_analytics_counters(cursor)
+        drift = any(tables.values())
+        rebuilt = drift or not only_on_drift
+        if rebuilt:
+            database.rebuild_analytics_counters(cursor)
+    if drift:
+        logger.warning("Analytics counters drifted: %s", tables)
+    return {
+        "drift": drift,
+        "tables": tables,
+        "rebuilt": rebuilt,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Verify, and optionally rebuild, the counters from the command line.
+
+    Returns:
+        Exit status: 1 if drift was found and left in place, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(
+        description="Verify the Sanas analytics counters against the action items."
+    )
+    parser.add_argument(
+        "--rebuild", action="store_true",
+        help="Rebuild the counters from the action items if they drifted",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="With --rebuild, rebuild even when nothing drifted",
+    )
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        report = rebuild_counters(only_on_drift=not args.force)
+    else:
+        report = verify_counters()
+    print(json.dumps(report, indent=2))
+    return int(report["drift"] and not report.get("rebuilt", False))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,31 @@
 """SQLite database setup and operations."""
 import sqlite3
+import functools
 import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+import uuid
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Generator
+from datetime import UTC, date, datetime
+from collections.abc import Callable
+from typing import Any, Generator
+
+from app.config import settings as app_settings
+from app.due_dates import parse_due_date
+from app.query_stats import InstrumentedConnection, query_stats
+from app.row_mapping import (
+    TEAM_MEMBER_COLUMNS,
+    PENDING_ITEM_COLUMNS,
+    SEARCH_RESULT_COLUMNS,
+    HISTORY_ITEM_COLUMNS,
+)
+
+logger = logging.getLogger(__name__)
 
 # Database file path
 DB_PATH = Path(__file__).parent.parent / "data" / "sanas.db"
@@ -26,6 +48,17 @@ DEFAULT_SETTINGS = {
     }
 }
 
+# Tables whose changes bump a row in data_versions. Caches of their data
+# compare versions to notice writes made by other processes.
+VERSIONED_TABLES = ("settings", "team_members")
+
+# A worker's claim on a migration lapses this long after its last batch, so
+# another worker can take over a backfill whose worker died
+MIGRATION_CLAIM_TIMEOUT_SECONDS = 120
+
+# Identifies this process's migration claims
+_MIGRATION_OWNER = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
 # Default team members for initial setup
 DEFAULT_TEAM_MEMBERS = [
     ("John Smith", "JS", "@john.smith", "JIRA-123", "john.smith@example.com"),
@@ -35,31 +68,368 @@ DEFAULT_TEAM_MEMBERS = [
 ]
 
 
-def ensure_db_directory():
-    """Ensure the database directory exists."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+def _connection_pragmas() -> list[str]:
+    """Build the tuning pragmas applied once to every new connection."""
+    return [
+        # Must precede journal_mode: it only applies to a database with no tables yet
+        "PRAGMA auto_vacuum = INCREMENTAL",
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA foreign_keys = ON",
+        f"PRAGMA mmap_size = {int(app_settings.db_mmap_size)}",
+        f"PRAGMA cache_size = {-int(app_settings.db_cache_size_kib)}",
+        f"PRAGMA busy_timeout = {int(app_settings.db_busy_timeout_ms)}",
+    ]
+
 
+def get_connection(db_path: Path | None = None) -> sqlite3.Connection:
+    """Open a new tuned database connection with row factory.
 
-def get_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory."""
-    ensure_db_directory()
-    conn = sqlite3.connect(str(DB_PATH))
+    Connections may be handed between threads by the pool, so the
+    same-thread check is disabled; the pool guarantees exclusive use.
+    Unless sql_stats_enabled is off, statements are timed into
+    app.query_stats.
+    """
+    path = db_path or DB_PATH
+    factory = InstrumentedConnection if app_settings.sql_stats_enabled else sqlite3.Connection
+    conn = sqlite3.connect(str(path), check_same_thread=False, factory=factory)
     conn.row_factory = sqlite3.Row
+    for pragma in _connection_pragmas():
+        conn.execute(pragma)
     return conn
 
 
+class ConnectionPool:
+    """Pool of tuned SQLite connections for a single database file.
+
+    A single writer connection is serialized behind a lock, while a
+    separate set of reader connections serves queries concurrently. In WAL
+    mode readers never wait for the writer, so analytics reads do not queue
+    behind inserts.
+
+    Writes may also be grouped with batch(): the thread holding a batch
+    gets the same writer connection from writer(), each use wrapped in a
+    savepoint, and the whole batch commits once.
+    """
+
+    def __init__(self, db_path: Path, readers: int = 4):
+        """Create the pool, opening the writer connection eagerly."""
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._writer = get_connection(db_path)
+        self._writer_lock = threading.Lock()
+        self._batch = threading.local()
+
+        # Reader slots start empty and are filled with connections on demand
+        self._readers: queue.LifoQueue[sqlite3.Connection | None] = queue.LifoQueue()
+        for _ in range(max(readers, 1)):
+            self._readers.put(None)
+        self._open_readers: list[sqlite3.Connection] = []
+        self._closed = False
+
+    def _new_reader(self) -> sqlite3.Connection:
+        """Open a reader connection that refuses writes."""
+        conn = get_connection(self.db_path)
+        conn.execute("PRAGMA query_only = ON")
+        self._open_readers.append(conn)
+        return conn
+
+    @contextmanager
+    def writer(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow the writer connection; commits on success, rolls back on error.
+
+        Inside batch() on the same thread, the work runs in a savepoint
+        instead: an error undoes only this unit, and nothing commits until
+        the batch does.
+        """
+        if getattr(self._batch, "depth", None) is not None:
+            with self._savepoint() as conn:
+                yield conn
+            return
+
+        started = time.perf_counter()
+        with self._writer_lock:
+            query_stats.record_wait("writer", time.perf_counter() - started)
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def batch(self) -> Generator[sqlite3.Connection, None, None]:
+        """Hold the writer for a group of writes committed as one transaction."""
+        started = time.perf_counter()
+        with self._writer_lock:
+            query_stats.record_wait("writer", time.perf_counter() - started)
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            self._batch.depth = 0
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._batch.depth = None
+
+    @contextmanager
+    def _savepoint(self) -> Generator[sqlite3.Connection, None, None]:
+        """Run one unit of a batch inside its own savepoint."""
+        conn = self._writer
+        self._batch.depth += 1
+        name = f"batch_write_{self._batch.depth}"
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield conn
+        except Exception:
+            conn.execute(f"ROLLBACK TO {name}")
+            raise
+        finally:
+            conn.execute(f"RELEASE {name}")
+            self._batch.depth -= 1
+
+    @contextmanager
+    def reader(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow a reader connection, blocking while all readers are busy."""
+        conn = self.acquire_reader()
+        try:
+            yield conn
+        finally:
+            self.release_reader(conn)
+
+    def acquire_reader(self) -> sqlite3.Connection:
+        """Take a reader connection out of the pool; pair with release_reader()."""
+        started = time.perf_counter()
+        conn = self._readers.get()
+        query_stats.record_wait("reader", time.perf_counter() - started)
+        if conn is None:
+            try:
+                conn = self._new_reader()
+            except Exception:
+                self._readers.put(None)
+                raise
+        return conn
+
+    def release_reader(self, conn: sqlite3.Connection) -> None:
+        """Return a reader connection, ending any read transaction it holds."""
+        if conn.in_transaction:
+            conn.rollback()
+        self._readers.put(conn)
+
+    def close(self) -> None:
+        """Close every connection owned by the pool."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._writer_lock:
+            self._writer.close()
+        for conn in self._open_readers:
+            conn.close()
+        self._open_readers.clear()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Get the connection pool for DB_PATH, creating it on first use."""
+    global _pool
+    pool = _pool
+    if pool is not None and pool.db_path == DB_PATH:
+        return pool
+
+    with _pool_lock:
+        if _pool is None or _pool.db_path != DB_PATH:
+            if _pool is not None:
+                _pool.close()
+            _pool = ConnectionPool(DB_PATH, readers=app_settings.db_pool_readers)
+        return _pool
+
+
+def close_pool() -> None:
+    """Close the shared connection pool, if one is open."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
 @contextmanager
 def get_db() -> Generator[sqlite3.Connection, None, None]:
-    """Context manager for database connections."""
-    conn = get_connection()
-    try:
+    """Context manager for the pooled writer connection."""
+    with get_pool().writer() as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
+
+
+def run_write_batch(calls: list[Callable[[], Any]]) -> list[tuple[bool, Any]]:
+    """Run write operations as one transaction, isolating each in a savepoint.
+
+    Every call uses get_db() as usual; within the batch those blocks share
+    the writer connection and a single commit. A failing call is rolled back
+    to its savepoint without affecting the others.
+
+    Args:
+        calls: Zero-argument callables performing database writes.
+
+    Returns:
+        (succeeded, result or exception) for each call, in order.
+    """
+    outcomes: list[tuple[bool, Any]] = []
+    with get_pool().batch():
+        for call in calls:
+            try:
+                outcomes.append((True, call()))
+            except Exception as exc:
+                outcomes.append((False, exc))
+    return outcomes
+
+
+class ReadSession:
+    """One pooled reader connection holding a single read transaction.
+
+    Reads passed the session share its connection and see the same snapshot
+    of the database: the transaction starts with the first read and lasts
+    until close(). Calls may come from different threads, one at a time.
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        """Borrow a reader from the pool and open a read transaction on it."""
+        self._pool = pool
+        self._conn: sqlite3.Connection | None = pool.acquire_reader()
+        self._lock = threading.Lock()
+        self._conn.execute("BEGIN")
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Use the session's connection.
+
+        Raises:
+            RuntimeError: If the session is closed.
+        """
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("Read session is closed")
+            yield self._conn
+
+    def close(self) -> None:
+        """End the read transaction and return the connection to the pool."""
+        with self._lock:
+            if self._conn is not None:
+                self._pool.release_reader(self._conn)
+                self._conn = None
+
+
+def open_read_session() -> ReadSession:
+    """Open a read session on the pool; the caller must close() it."""
+    return ReadSession(get_pool())
+
+
+@contextmanager
+def read_session() -> Generator[ReadSession, None, None]:
+    """Context manager for a read session."""
+    session = open_read_session()
+    try:
+        yield session
     finally:
-        conn.close()
+        session.close()
+
+
+@contextmanager
+def get_read_db(session: ReadSession | None = None) -> Generator[sqlite3.Connection, None, None]:
+    """Context manager for a read-only connection: the session's, or a pooled one."""
+    if session is not None:
+        with session.connection() as conn:
+            yield conn
+        return
+    with get_pool().reader() as conn:
+        yield conn
+
+
+def get_sqlite_stats() -> dict:
+    """Report SQLite storage internals for the stats endpoint.
+
+    WAL frames are derived from the -wal file size, so reading them never
+    triggers a checkpoint.
+
+    Returns:
+        Dict of page, cache, mmap, freelist and WAL figures.
+    """
+    with get_read_db() as conn:
+        values = {
+            pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+            for pragma in (
+                "page_size", "page_count", "freelist_count", "cache_size",
+                "mmap_size", "journal_mode", "wal_autocheckpoint", "busy_timeout",
+            )
+        }
+    wal_path = DB_PATH.with_name(DB_PATH.name + "-wal")
+    wal_size = wal_path.stat().st_size if wal_path.exists() else 0
+    page_size = values["page_size"]
+    # Negative cache_size is a KiB budget; positive is a page count
+    cache_size = values["cache_size"]
+    return {
+        **values,
+        "cache_size_kib": -cache_size if cache_size < 0 else cache_size * page_size // 1024,
+        "database_size_bytes": page_size * values["page_count"],
+        "wal_size_bytes": wal_size,
+        # 32-byte WAL header, then a 24-byte header per frame
+        "wal_frames": max(wal_size - 32, 0) // (page_size + 24),
+    }
+
+
+# Current time as integer epoch seconds, usable in defaults and statements
+NOW_EPOCH_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+# created_at/completed_at are integer epoch seconds (UTC); due_on is the
+# ISO date parsed from the free-form due_date. assignee_id is the team member
+# the assignee name resolved to (NULL if unassigned or not on the roster);
+# assignee keeps the display name and follows renames of that member.
+ACTION_ITEMS_COLUMNS = f"""
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    assignee TEXT,
+    due_date TEXT,
+    due_on TEXT,
+    selected INTEGER DEFAULT 1,
+    overdue INTEGER DEFAULT 0,
+    ticket_key TEXT,
+    created_at INTEGER NOT NULL DEFAULT ({NOW_EPOCH_SQL}),
+    completed_at INTEGER,
+    assignee_id INTEGER REFERENCES team_members (id) ON DELETE SET NULL
+"""
+
+# Completed items moved out of action_items by the archival job; ids are
+# kept, and are never reused because action_items ids are AUTOINCREMENT
+ACTION_ITEMS_ARCHIVE_COLUMNS = f"""
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    assignee TEXT,
+    due_date TEXT,
+    due_on TEXT,
+    selected INTEGER DEFAULT 1,
+    overdue INTEGER DEFAULT 0,
+    ticket_key TEXT,
+    created_at INTEGER NOT NULL,
+    completed_at INTEGER NOT NULL,
+    archived_at INTEGER NOT NULL DEFAULT ({NOW_EPOCH_SQL}),
+    assignee_id INTEGER REFERENCES team_members (id) ON DELETE SET NULL
+"""
+
+# Columns copied from action_items into the archive
+ARCHIVED_COLUMNS = (
+    "id", "title", "assignee", "assignee_id", "due_date", "due_on", "selected",
+    "overdue", "ticket_key", "created_at", "completed_at",
+)
+
+# Team member id for an assignee name: case-insensitive, lowest id on duplicates
+RESOLVE_ASSIGNEE_SQL = "(SELECT MIN(id) FROM team_members WHERE name = {} COLLATE NOCASE)"
 
 
 def _create_tables(cursor: sqlite3.Cursor) -> None:
@@ -74,6 +444,10 @@ def _create_tables(cursor: sqlite3.Cursor) -> None:
             email TEXT
         )
     """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_team_members_name
+        ON team_members (name COLLATE NOCASE)
+    """)
 
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS settings (
@@ -82,19 +456,813 @@ def _create_tables(cursor: sqlite3.Cursor) -> None:
         )
     """)
 
+    # One counter per table in VERSIONED_TABLES, bumped by triggers on write
     cursor.execute("""
-        CREATE TABLE IF NOT EXISTS action_items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            assignee TEXT,
-            due_date TEXT,
-            selected INTEGER DEFAULT 1,
-            overdue INTEGER DEFAULT 0,
-            ticket_key TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            completed_at TIMESTAMP
+        CREATE TABLE IF NOT EXISTS data_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    """)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO data_versions (name) VALUES (?)",
+        [(table,) for table in VERSIONED_TABLES],
+    )
+
+    # Which worker is running each pending migration's backfill
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS migration_claims (
+            version INTEGER PRIMARY KEY,
+            owner TEXT NOT NULL,
+            heartbeat INTEGER NOT NULL
+        )
+    """)
+
+    cursor.execute(f"CREATE TABLE IF NOT EXISTS action_items ({ACTION_ITEMS_COLUMNS})")
+
+    cursor.execute(
+        f"CREATE TABLE IF NOT EXISTS action_items_archive ({ACTION_ITEMS_ARCHIVE_COLUMNS})"
+    )
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_action_items_archive_completed_at
+        ON action_items_archive (completed_at)
+    """)
+
+    _create_counter_tables(cursor)
+
+
+def _create_counter_tables(cursor: sqlite3.Cursor) -> None:
+    """Create the trigger-maintained counter and rollup tables."""
+    # Dashboard counters kept current by the action_items triggers
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS analytics_counters (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total INTEGER NOT NULL DEFAULT 0,
+            pending INTEGER NOT NULL DEFAULT 0,
+            overdue INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    # Per assignee, keyed as _assignee_key_sql() describes
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS assignee_counters (
+            assignee_id INTEGER NOT NULL,
+            assignee TEXT NOT NULL,
+            total INTEGER NOT NULL DEFAULT 0,
+            pending INTEGER NOT NULL DEFAULT 0,
+            overdue INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (assignee_id, assignee)
+        ) WITHOUT ROWID
+    """)
+
+    # Completions per day and assignee key ((0, '') for unassigned), for trends
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS daily_completions (
+            day TEXT NOT NULL,
+            assignee_id INTEGER NOT NULL,
+            assignee TEXT NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, assignee_id, assignee)
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("INSERT OR IGNORE INTO analytics_counters (id) VALUES (1)")
+
+
+# Managed secondary indexes on action_items, keyed by name and designed from
+# the pending listing, the completed-this-week range and the leaderboard.
+ACTION_ITEM_INDEX_PREFIX = "idx_action_items_"
+ACTION_ITEM_INDEXES = {
+    # Pending rows only, in listing order
+    "idx_action_items_pending": (
+        "CREATE INDEX IF NOT EXISTS idx_action_items_pending "
+        "ON action_items (created_at, id) WHERE completed_at IS NULL"
+    ),
+    # Completed rows only, for completion date ranges
+    "idx_action_items_completed_at": (
+        "CREATE INDEX IF NOT EXISTS idx_action_items_completed_at "
+        "ON action_items (completed_at) WHERE completed_at IS NOT NULL"
+    ),
+    # Pending rows by due date, for the overdue sweep
+    "idx_action_items_due_on": (
+        "CREATE INDEX IF NOT EXISTS idx_action_items_due_on "
+        "ON action_items (due_on) WHERE completed_at IS NULL"
+    ),
+    # Covers per-assignee aggregation (counter rebuilds) without touching the
+    # table; also serves renames and ON DELETE SET NULL by assignee_id
+    "idx_action_items_assignee_id_status": (
+        "CREATE INDEX IF NOT EXISTS idx_action_items_assignee_id_status "
+        "ON action_items (assignee_id, completed_at, overdue)"
+    ),
+    # Names not (yet) on the roster, resolved when a matching member is added
+    "idx_action_items_unresolved_assignee": (
+        "CREATE INDEX IF NOT EXISTS idx_action_items_unresolved_assignee "
+        "ON action_items (assignee COLLATE NOCASE) "
+        "WHERE assignee_id IS NULL AND assignee IS NOT NULL"
+    ),
+}
+
+# Full-text search over titles: case- and accent-insensitive words, with
+# prefix indexes so type-ahead queries ("bud*") avoid a full term scan.
+SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+SEARCH_PREFIX_LENGTHS = "2 3"
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+def _create_search_index(cursor: sqlite3.Cursor) -> bool:
+    """Create the FTS5 index over action item titles, archived ones included.
+
+    The index stores no copy of the text: its content is the
+    action_items_titles view over the live and archive tables, and triggers
+    keep its postings in step. An index created on a database that already
+    has items starts empty; the search_index backfill fills it.
+
+    Returns:
+        Whether the index was created.
+    """
+    cursor.execute("""
+        CREATE VIEW IF NOT EXISTS action_items_titles AS
+        SELECT id, title FROM action_items
+        UNION ALL
+        SELECT id, title FROM action_items_archive
+    """)
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'action_items_fts'"
+    )
+    exists = cursor.fetchone() is not None
+    cursor.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS action_items_fts USING fts5(
+            title,
+            content='action_items_titles',
+            content_rowid='id',
+            tokenize='{SEARCH_TOKENIZER}',
+            prefix='{SEARCH_PREFIX_LENGTHS}'
         )
     """)
+    return not exists
+
+
+def _create_indexes(cursor: sqlite3.Cursor) -> None:
+    """Create the managed action_items indexes and drop retired ones.
+
+    The archive's assignee_id index is created here as well, since older
+    archive tables only gain that column during migration.
+    """
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'action_items' "
+        "AND name LIKE ?",
+        (ACTION_ITEM_INDEX_PREFIX + "%",),
+    )
+    for (name,) in cursor.fetchall():
+        if name not in ACTION_ITEM_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+    for statement in ACTION_ITEM_INDEXES.values():
+        cursor.execute(statement)
+
+    # Archived rows are renamed and unlinked by assignee_id too
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_action_items_archive_assignee_id
+        ON action_items_archive (assignee_id)
+    """)
+
+
+def _assignee_key_sql(row: str = "") -> tuple[str, str]:
+    """SQL for the (assignee_id, assignee) counter key of an action_items row.
+
+    Items linked to a team member are keyed by assignee_id with an empty
+    name, so renames never move them. Items whose name is not on the roster
+    are keyed by the name with assignee_id 0, and unassigned items by (0, '').
+
+    Args:
+        row: Trigger row alias, "NEW" or "OLD", or empty for a plain column.
+    """
+    prefix = f"{row}." if row else ""
+    return (
+        f"COALESCE({prefix}assignee_id, 0)",
+        f"CASE WHEN {prefix}assignee_id IS NULL THEN COALESCE({prefix}assignee, '') ELSE '' END",
+    )
+
+
+def _counter_delta_sql(row: str, sign: str) -> list[str]:
+    """Build statements applying one action_items row to the counters.
+
+    Args:
+        row: Trigger row alias, either "NEW" or "OLD".
+        sign: "+" to add the row, "-" to remove it.
+    """
+    pending = f"({row}.completed_at IS NULL)"
+    overdue = f"({row}.completed_at IS NULL AND {row}.overdue = 1)"
+    assignee_id, assignee = _assignee_key_sql(row)
+    return [
+        f"""UPDATE analytics_counters
+            SET total = total {sign} 1,
+                pending = pending {sign} {pending},
+                overdue = overdue {sign} {overdue}
+            WHERE id = 1;""",
+        f"""INSERT INTO assignee_counters (assignee_id, assignee, total, pending, overdue)
+            SELECT {assignee_id}, {assignee}, {sign}1, {sign}{pending}, {sign}{overdue}
+            WHERE {row}.assignee_id IS NOT NULL OR {row}.assignee IS NOT NULL
+            ON CONFLICT (assignee_id, assignee) DO UPDATE SET
+                total = total + excluded.total,
+                pending = pending + excluded.pending,
+                overdue = overdue + excluded.overdue;""",
+    ]
+
+
+def _rollup_delta_sql(row: str, sign: str) -> list[str]:
+    """Build the statement applying one action_items row to the daily rollup.
+
+    Args:
+        row: Trigger row alias, either "NEW" or "OLD".
+        sign: "+" to add the row, "-" to remove it.
+    """
+    assignee_id, assignee = _assignee_key_sql(row)
+    return [
+        f"""INSERT INTO daily_completions (day, assignee_id, assignee, completed)
+            SELECT date({row}.completed_at, 'unixepoch'), {assignee_id}, {assignee}, {sign}1
+            WHERE {row}.completed_at IS NOT NULL
+            ON CONFLICT (day, assignee_id, assignee) DO UPDATE SET
+                completed = completed + excluded.completed;""",
+    ]
+
+
+def _search_delta_sql(row: str, sign: str) -> list[str]:
+    """Build the statement applying one action_items row to the search index.
+
+    The index is external-content, so removals must repeat the indexed
+    values; FTS5 uses them to find the postings to delete. Rows the
+    search_index backfill has not reached yet have no postings (no
+    action_items_fts_docsize row), so nothing is removed for them.
+
+    Args:
+        row: Trigger row alias, either "NEW" or "OLD".
+        sign: "+" to add the row, "-" to remove it.
+    """
+    if sign == "+":
+        return [
+            f"""INSERT INTO action_items_fts (rowid, title)
+                VALUES ({row}.id, {row}.title);""",
+        ]
+    return [
+        f"""INSERT INTO action_items_fts (action_items_fts, rowid, title)
+            SELECT 'delete', {row}.id, {row}.title
+            WHERE EXISTS (SELECT 1 FROM action_items_fts_docsize WHERE id = {row}.id);""",
+    ]
+
+
+def _create_triggers(cursor: sqlite3.Cursor) -> None:
+    """Create triggers that keep counters and rollups in step with action_items.
+
+    Rows deleted because they were moved to action_items_archive keep
+    counting towards the counters and rollups, and keep their search
+    postings, so archiving never changes analytics or search. Team member triggers keep assignee_id and the denormalized
+    assignee name in step with the roster; archived items are only renamed,
+    never re-resolved, so their counter contributions stay fixed. Any write
+    to a table in VERSIONED_TABLES bumps its data_versions row. Triggers are
+    dropped and recreated so that existing databases pick up changes to
+    their bodies.
+    """
+    triggers = {
+        "trg_action_items_counters_insert": (
+            "AFTER INSERT ON action_items",
+            _counter_delta_sql("NEW", "+") + _rollup_delta_sql("NEW", "+"),
+        ),
+        "trg_action_items_counters_delete": (
+            "AFTER DELETE ON action_items "
+            "WHEN NOT EXISTS (SELECT 1 FROM action_items_archive WHERE id = OLD.id)",
+            _counter_delta_sql("OLD", "-") + _rollup_delta_sql("OLD", "-"),
+        ),
+        "trg_action_items_counters_update": (
+            "AFTER UPDATE OF assignee_id, assignee, completed_at, overdue ON action_items",
+            _counter_delta_sql("OLD", "-") + _rollup_delta_sql("OLD", "-")
+            + _counter_delta_sql("NEW", "+") + _rollup_delta_sql("NEW", "+"),
+        ),
+        "trg_action_items_fts_insert": (
+            "AFTER INSERT ON action_items",
+            _search_delta_sql("NEW", "+"),
+        ),
+        "trg_action_items_fts_delete": (
+            "AFTER DELETE ON action_items "
+            "WHEN NOT EXISTS (SELECT 1 FROM action_items_archive WHERE id = OLD.id)",
+            _search_delta_sql("OLD", "-"),
+        ),
+        "trg_action_items_fts_update": (
+            "AFTER UPDATE OF title ON action_items",
+            _search_delta_sql("OLD", "-") + _search_delta_sql("NEW", "+"),
+        ),
+        # A new member claims live items already assigned to their name
+        "trg_team_members_resolve": (
+            "AFTER INSERT ON team_members",
+            ["""UPDATE action_items SET assignee_id = NEW.id
+                WHERE assignee_id IS NULL AND assignee = NEW.name COLLATE NOCASE;"""],
+        ),
+        # Renames carry over to every item, archived ones included
+        "trg_team_members_rename": (
+            "AFTER UPDATE OF name ON team_members",
+            [
+                "UPDATE action_items SET assignee = NEW.name WHERE assignee_id = NEW.id;",
+                "UPDATE action_items_archive SET assignee = NEW.name WHERE assignee_id = NEW.id;",
+            ],
+        ),
+    }
+    for table in VERSIONED_TABLES:
+        bump = f"UPDATE data_versions SET version = version + 1 WHERE name = '{table}';"
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            triggers[f"trg_{table}_version_{event.lower()}"] = (f"AFTER {event} ON {table}", [bump])
+    for name, (event, statements) in triggers.items():
+        body = "\n".join(statements)
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(f"CREATE TRIGGER {name} {event} BEGIN {body} END")
+
+
+# Every item ever recorded, hot or archived, for counter rebuilds
+_ALL_ITEMS_SQL = """(
+    SELECT assignee_id, assignee, overdue, completed_at FROM action_items
+    UNION ALL
+    SELECT assignee_id, assignee, overdue, completed_at FROM action_items_archive
+)"""
+
+_ASSIGNEE_KEY = ", ".join(_assignee_key_sql())
+
+
+# Counter tables: key columns, value columns, and the query deriving their rows
+_COUNTER_TABLES = {
+    "analytics_counters": (("id",), ("total", "pending", "overdue"), f"""
+        SELECT 1,
+               COUNT(*),
+               COALESCE(SUM(completed_at IS NULL), 0),
+               COALESCE(SUM(completed_at IS NULL AND overdue = 1), 0)
+        FROM {_ALL_ITEMS_SQL}
+    """),
+    "assignee_counters": (("assignee_id", "assignee"), ("total", "pending", "overdue"), f"""
+        SELECT {_ASSIGNEE_KEY},
+               COUNT(*),
+               SUM(completed_at IS NULL),
+               SUM(completed_at IS NULL AND overdue = 1)
+        FROM {_ALL_ITEMS_SQL}
+        WHERE assignee_id IS NOT NULL OR assignee IS NOT NULL
+        GROUP BY 1, 2
+    """),
+    "daily_completions": (("day", "assignee_id", "assignee"), ("completed",), f"""
+        SELECT date(completed_at, 'unixepoch'), {_ASSIGNEE_KEY}, COUNT(*)
+        FROM {_ALL_ITEMS_SQL}
+        WHERE completed_at IS NOT NULL
+        GROUP BY 1, 2, 3
+    """),
+}
+
+
+def rebuild_analytics_counters(cursor: sqlite3.Cursor) -> None:
+    """Recompute the analytics counters and daily rollups from all items.
+
+    Archived items are included, matching what the triggers maintain.
+    """
+    for table, (keys, values, query) in _COUNTER_TABLES.items():
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.execute(f"INSERT INTO {table} ({', '.join(keys + values)}) {query}")
+
+
+def verify_analytics_counters(cursor: sqlite3.Cursor) -> dict[str, list[dict]]:
+    """Compare the stored counters and daily rollups with a recomputation.
+
+    Nothing is written. A row absent on one side counts as all zeros, so
+    the zero rows triggers leave behind are not drift.
+
+    Returns:
+        Per counter table, the rows whose stored values differ from the
+        recomputed ones, each with its key, "stored" and "expected" values.
+    """
+    drift = {}
+    for table, (keys, values, query) in _COUNTER_TABLES.items():
+        width = len(keys)
+        stored = {
+            row[:width]: row[width:]
+            for row in cursor.execute(f"SELECT {', '.join(keys + values)} FROM {table}")
+        }
+        expected = {row[:width]: row[width:] for row in cursor.execute(query)}
+        zeros = (0,) * len(values)
+        rows = []
+        for key in sorted(stored.keys() | expected.keys()):
+            have, want = stored.get(key, zeros), expected.get(key, zeros)
+            if have != want:
+                rows.append({
+                    **dict(zip(keys, key)),
+                    "stored": dict(zip(values, have)),
+                    "expected": dict(zip(values, want)),
+                })
+        drift[table] = rows
+    return drift
+
+
+def _epoch_sql(value: str) -> str:
+    """SQL converting a legacy text timestamp to epoch seconds; integers pass through."""
+    return (
+        f"CASE WHEN typeof({value}) = 'integer' THEN {value} "
+        f"ELSE CAST(strftime('%s', {value}) AS INTEGER) END"
+    )
+
+
+def _has_text_timestamps(cursor: sqlite3.Cursor) -> bool:
+    """Whether action_items still has the legacy text timestamp columns."""
+    cursor.execute("PRAGMA table_info(action_items)")
+    return {row[1]: row[2].upper() for row in cursor.fetchall()}.get("created_at") != "INTEGER"
+
+
+def _epoch_copy_sql(row: str = "") -> tuple[str, str]:
+    """Column list and values copying an action_items row into action_items_migrating.
+
+    Args:
+        row: Trigger row alias, "NEW", or empty to select from action_items.
+    """
+    prefix = f"{row}." if row else ""
+    columns = [
+        "id", "title", "assignee", "assignee_id", "due_date", "due_on", "selected",
+        "overdue", "ticket_key",
+    ]
+    values = [prefix + column for column in columns] + [
+        f"COALESCE({_epoch_sql(prefix + 'created_at')}, {NOW_EPOCH_SQL})",
+        _epoch_sql(prefix + "completed_at"),
+    ]
+    return ", ".join(columns + ["created_at", "completed_at"]), ", ".join(values)
+
+
+def _start_epoch_copy(cursor: sqlite3.Cursor) -> None:
+    """Create action_items_migrating and the triggers mirroring writes into it.
+
+    Older databases stored CURRENT_TIMESTAMP text with a text default. SQLite
+    cannot change a column default in place, so the rows are copied into a
+    table with the current definition, converting timestamps on the way.
+    Both are created in one transaction, so every row is in the copy either
+    because a batch copied it or because a trigger mirrored its last write.
+    A copy left by an interrupted run is resumed as it is.
+    """
+    columns, values = _epoch_copy_sql("NEW")
+    cursor.execute(f"CREATE TABLE IF NOT EXISTS action_items_migrating ({ACTION_ITEMS_COLUMNS})")
+    for event in ("INSERT", "UPDATE"):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_action_items_migrating_{event.lower()}
+            AFTER {event} ON action_items BEGIN
+                INSERT OR REPLACE INTO action_items_migrating ({columns}) VALUES ({values});
+            END
+        """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_action_items_migrating_delete
+        AFTER DELETE ON action_items BEGIN
+            DELETE FROM action_items_migrating WHERE id = OLD.id;
+        END
+    """)
+
+
+def _copy_epoch_batch(cursor: sqlite3.Cursor, after_id: int, last_id: int) -> int:
+    """Copy one id range of action_items into action_items_migrating."""
+    columns, values = _epoch_copy_sql()
+    cursor.execute(f"""
+        INSERT OR REPLACE INTO action_items_migrating ({columns})
+        SELECT {values} FROM action_items WHERE id > ? AND id <= ?
+    """, (after_id, last_id))
+    return cursor.rowcount
+
+
+def _swap_epoch_copy(cursor: sqlite3.Cursor) -> None:
+    """Replace action_items with its converted copy.
+
+    The view and the triggers naming action_items are dropped first, as
+    SQLite refuses a rename while any of them would be left dangling, and
+    recreated after. The AUTOINCREMENT sequence carries over, so ids of
+    deleted items are not reused. Indexes are created by run_migrations
+    once the backfills are done.
+    """
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'action_items'")
+    row = cursor.fetchone()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    for (name,) in cursor.fetchall():
+        cursor.execute(f"DROP TRIGGER {name}")
+    cursor.execute("DROP VIEW IF EXISTS action_items_titles")
+    cursor.execute("DROP TABLE action_items")
+    cursor.execute("ALTER TABLE action_items_migrating RENAME TO action_items")
+    if row:
+        cursor.execute(
+            "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'action_items'", (row[0],)
+        )
+    _create_search_index(cursor)
+    _create_triggers(cursor)
+
+
+def _migrate_epoch_timestamps(claim: "MigrationClaim") -> None:
+    """Convert legacy text timestamps on action_items to integer epoch seconds.
+
+    The table is copied in id ranges like any backfill, with triggers
+    mirroring the writes made meanwhile, then swapped for its copy in one
+    short transaction.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        claim.renew(cursor)
+        if not _has_text_timestamps(cursor):
+            return
+        _start_epoch_copy(cursor)
+    _backfill_in_batches("action_items", _copy_epoch_batch, claim)
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+        claim.renew(cursor)
+        _swap_epoch_copy(cursor)
+
+
+def _add_due_on(cursor: sqlite3.Cursor) -> None:
+    """Add the due_on column to older databases."""
+    cursor.execute("PRAGMA table_info(action_items)")
+    if "due_on" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE action_items ADD COLUMN due_on TEXT")
+
+
+def _backfill_due_on_batch(cursor: sqlite3.Cursor, after_id: int, last_id: int) -> int:
+    """Parse due_on for one id range of items saved without it.
+
+    Years are inferred relative to each item's creation day, matching what
+    extraction would have produced at the time.
+    """
+    cursor.execute("""
+        SELECT id, due_date, date(created_at, 'unixepoch') FROM action_items
+        WHERE id > ? AND id <= ? AND due_on IS NULL AND due_date IS NOT NULL
+    """, (after_id, last_id))
+    updates = []
+    for item_id, due_date, created_day in cursor.fetchall():
+        due_on = parse_due_date(due_date, date.fromisoformat(created_day))
+        if due_on:
+            updates.append((due_on.isoformat(), item_id))
+    cursor.executemany("UPDATE action_items SET due_on = ? WHERE id = ?", updates)
+    return len(updates)
+
+
+def _backfill_due_on(claim: "MigrationClaim") -> None:
+    """Backfill due_on on items saved before the column existed."""
+    _backfill_in_batches("action_items", _backfill_due_on_batch, claim)
+
+
+def _add_assignee_ids(cursor: sqlite3.Cursor) -> None:
+    """Add assignee_id to older databases and re-key the counters.
+
+    Counter and rollup tables keyed by assignee name are replaced with
+    empty ones keyed by assignee_id; the analytics_counters migration
+    refills them.
+    """
+    for table in ("action_items", "action_items_archive"):
+        cursor.execute(f"PRAGMA table_info({table})")
+        if "assignee_id" not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute(
+                f"ALTER TABLE {table} ADD COLUMN "
+                "assignee_id INTEGER REFERENCES team_members (id) ON DELETE SET NULL"
+            )
+
+    cursor.execute("PRAGMA table_info(assignee_counters)")
+    if "assignee_id" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("DROP TABLE assignee_counters")
+        cursor.execute("DROP TABLE IF EXISTS daily_completions")
+        _create_counter_tables(cursor)
+
+
+def _add_counter_names(cursor: sqlite3.Cursor) -> None:
+    """Re-key the per-assignee counters so names off the roster are counted.
+
+    Tables keyed by assignee_id alone are replaced with empty ones keyed as
+    _assignee_key_sql() describes; the migration's backfill refills them.
+    """
+    cursor.execute("PRAGMA table_info(assignee_counters)")
+    if "assignee" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("DROP TABLE assignee_counters")
+        cursor.execute("DROP TABLE IF EXISTS daily_completions")
+        _create_counter_tables(cursor)
+
+
+def _index_archived_titles(cursor: sqlite3.Cursor) -> None:
+    """Drop a search index whose content is action_items alone.
+
+    Such an index lost the postings of archived items. init_db recreates
+    it over action_items_titles, and the backfill indexes every item.
+    """
+    cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'action_items_fts'"
+    )
+    row = cursor.fetchone()
+    if row and "action_items_titles" not in row[0]:
+        cursor.execute("DROP TABLE action_items_fts")
+
+
+def _index_titles_batch(table: str, cursor: sqlite3.Cursor, after_id: int,
+                        last_id: int) -> int:
+    """Add search postings for one id range of a table's unindexed items."""
+    cursor.execute(f"""
+        INSERT INTO action_items_fts (rowid, title)
+        SELECT id, title FROM {table}
+        WHERE id > ? AND id <= ?
+          AND id NOT IN (SELECT id FROM action_items_fts_docsize WHERE id > ? AND id <= ?)
+    """, (after_id, last_id, after_id, last_id))
+    return cursor.rowcount
+
+
+def _backfill_search_index(claim: "MigrationClaim") -> None:
+    """Index the titles of items, live and archived, that have no postings yet.
+
+    Live items go first: one archived meanwhile was indexed before the move
+    or is reached by the archive pass.
+    """
+    for table in ("action_items", "action_items_archive"):
+        _backfill_in_batches(table, functools.partial(_index_titles_batch, table), claim)
+
+
+def _resolve_assignee_batch(table: str, cursor: sqlite3.Cursor, after_id: int,
+                            last_id: int) -> int:
+    """Resolve assignee_id for one id range of a table's unlinked items."""
+    cursor.execute(f"""
+        UPDATE {table} SET assignee_id = {RESOLVE_ASSIGNEE_SQL.format(f"{table}.assignee")}
+        WHERE id > ? AND id <= ? AND assignee_id IS NULL
+          AND assignee COLLATE NOCASE IN (SELECT name FROM team_members)
+    """, (after_id, last_id))
+    return cursor.rowcount
+
+
+def _backfill_assignee_ids(claim: "MigrationClaim") -> None:
+    """Link items, live and archived, to the team members their names resolve to."""
+    for table in ("action_items", "action_items_archive"):
+        _backfill_in_batches(table, functools.partial(_resolve_assignee_batch, table), claim)
+
+
+def _rebuild_counters(claim: "MigrationClaim") -> None:
+    """Recompute counters and rollups for databases from before the current keys.
+
+    This is a single transaction: the totals must match the triggers at the
+    moment they are swapped in, which an interleaved write would break.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        claim.renew(cursor)
+        rebuild_analytics_counters(cursor)
+
+
+def _backfill_in_batches(table: str,
+                         apply: Callable[[sqlite3.Cursor, int, int], int],
+                         claim: "MigrationClaim") -> int:
+    """Run a backfill over a table one id range at a time.
+
+    Each range of up to migration_batch_size rows commits on its own, and
+    the writer is released for migration_pause_ms between ranges, so other
+    writers interleave with the backfill rather than waiting for all of it.
+    Backfills only touch rows that still need them, so one interrupted by a
+    restart resumes where the data shows it left off. Each range renews the
+    migration claim in its own transaction.
+
+    Args:
+        table: Table to walk in id order.
+        apply: Backfills the rows with after_id < id <= last_id, given
+            (cursor, after_id, last_id); returns the number of rows changed.
+        claim: This worker's claim on the migration.
+
+    Returns:
+        Total rows changed.
+
+    Raises:
+        MigrationStoppedError: If the claim was lost or a stop requested.
+    """
+    batch_size = max(int(app_settings.migration_batch_size), 1)
+    pause = app_settings.migration_pause_ms / 1000
+    after_id = changed = batches = 0
+    while True:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            claim.renew(cursor)
+            cursor.execute(
+                f"SELECT MAX(id) FROM (SELECT id FROM {table} WHERE id > ? ORDER BY id LIMIT ?)",
+                (after_id, batch_size),
+            )
+            last_id = cursor.fetchone()[0]
+            if last_id is None:
+                break
+            changed += apply(cursor, after_id, last_id)
+        after_id = last_id
+        batches += 1
+        if pause:
+            time.sleep(pause)
+    logger.info("Backfilled %d %s rows in %d batches", changed, table, batches)
+    return changed
+
+
+class MigrationStoppedError(RuntimeError):
+    """Raised inside a backfill whose claim was lost or whose stop was requested."""
+
+
+class MigrationClaim:
+    """This worker's claim on running one pending migration.
+
+    Claims are rows in migration_claims, taken and checked in write
+    transactions, so two workers never run the same backfill at once. A
+    claim not renewed within MIGRATION_CLAIM_TIMEOUT_SECONDS may be taken
+    over by another worker.
+    """
+
+    def __init__(self, version: int, stop: threading.Event | None = None):
+        """Describe a claim; take it with _claim_migration().
+
+        Args:
+            version: The migration's version.
+            stop: Set to ask the backfill to stop after its current batch.
+        """
+        self.version = version
+        self._stop = stop
+
+    def held(self, cursor: sqlite3.Cursor) -> bool:
+        """Refresh the claim in the caller's write transaction; whether it is still ours."""
+        cursor.execute(
+            "UPDATE migration_claims SET heartbeat = ? WHERE version = ? AND owner = ?",
+            (int(time.time()), self.version, _MIGRATION_OWNER),
+        )
+        return cursor.rowcount == 1
+
+    def renew(self, cursor: sqlite3.Cursor) -> None:
+        """Refresh the claim before a unit of backfill work.
+
+        Raises:
+            MigrationStoppedError: If a stop was requested or the claim lost.
+        """
+        if self._stop is not None and self._stop.is_set():
+            raise MigrationStoppedError(f"Migration {self.version} stopped")
+        if not self.held(cursor):
+            raise MigrationStoppedError(f"Migration {self.version} claimed by another worker")
+
+
+def _claim_migration(version: int, stop: threading.Event | None) -> MigrationClaim | None:
+    """Claim a pending migration, unless it is applied or another worker holds it.
+
+    The check and the claim share one BEGIN IMMEDIATE transaction, so of
+    several workers starting together exactly one gets the claim.
+    """
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+        if cursor.execute("PRAGMA user_version").fetchone()[0] >= version:
+            return None
+        now = int(time.time())
+        cursor.execute("SELECT owner, heartbeat FROM migration_claims WHERE version = ?",
+                       (version,))
+        row = cursor.fetchone()
+        if row and row[0] != _MIGRATION_OWNER and now - row[1] < MIGRATION_CLAIM_TIMEOUT_SECONDS:
+            return None
+        cursor.execute(
+            "INSERT OR REPLACE INTO migration_claims (version, owner, heartbeat) VALUES (?, ?, ?)",
+            (version, _MIGRATION_OWNER, now),
+        )
+    return MigrationClaim(version, stop)
+
+
+def _finish_migration(claim: MigrationClaim) -> bool:
+    """Raise user_version past a completed migration and drop its claim.
+
+    Returns:
+        False if the claim was lost meanwhile, leaving the version to its new holder.
+    """
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.cursor()
+        if not claim.held(cursor):
+            return False
+        cursor.execute(f"PRAGMA user_version = {claim.version}")
+        cursor.execute("DELETE FROM migration_claims WHERE version = ?", (claim.version,))
+    return True
+
+
+def _release_migration(claim: MigrationClaim) -> None:
+    """Drop an unfinished claim, so another worker can resume the backfill at once."""
+    with get_db() as conn:
+        conn.execute(
+            "DELETE FROM migration_claims WHERE version = ? AND owner = ?",
+            (claim.version, _MIGRATION_OWNER),
+        )
+
+
+# Re-opened by init_db whenever it creates the search index on existing items
+SEARCH_INDEX_MIGRATION = 6
+
+# Schema migrations as (version, name, schema step, backfill), applied in
+# order to databases whose PRAGMA user_version is lower. Schema steps are
+# quick idempotent DDL, run together in one transaction by init_db;
+# backfills run afterwards in batches under a migration claim, from
+# run_migrations(), and user_version is raised as each one completes.
+# Databases created from scratch start at SCHEMA_VERSION.
+MIGRATIONS: list[tuple[int, str, Callable[[sqlite3.Cursor], None] | None,
+                       Callable[[MigrationClaim], None] | None]] = [
+    (1, "epoch_timestamps", None, _migrate_epoch_timestamps),
+    (2, "due_on", _add_due_on, _backfill_due_on),
+    (3, "assignee_ids", _add_assignee_ids, _backfill_assignee_ids),
+    (4, "analytics_counters", None, _rebuild_counters),
+    (5, "counter_names", _add_counter_names, _rebuild_counters),
+    (SEARCH_INDEX_MIGRATION, "search_index", _index_archived_titles, _backfill_search_index),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version() -> int:
+    """Get the schema version recorded in the database (PRAGMA user_version)."""
+    with get_read_db() as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
 
 
 def _seed_default_data(cursor: sqlite3.Cursor) -> None:
@@ -112,35 +1280,137 @@ def _seed_default_data(cursor: sqlite3.Cursor) -> None:
         )
 
 
-def init_db():
-    """Initialize the database schema and seed default data."""
-    ensure_db_directory()
+def init_db(migrate: bool = True):
+    """Create or upgrade the schema and seed default data.
+
+    The upgrade runs in three phases, so no one transaction holds the write
+    lock for all of it:
 
+    1. In one transaction: create missing tables, seed defaults, run the
+       schema steps of pending migrations, and create the search index and
+       the triggers that write to it. Nothing here copies or rewrites
+       existing rows, so the write lock is held briefly.
+    2. Run pending backfills in batches, raising user_version as each
+       migration completes.
+    3. Create the managed indexes, each committing on its own.
+
+    Args:
+        migrate: Run phases 2 and 3 (run_migrations()) too. The application
+            passes False and runs them in the background from its lifespan,
+            as they can take minutes on a large database.
+    """
     with get_db() as conn:
+        # Taking the write lock first makes concurrent starts upgrade once
+        conn.execute("BEGIN IMMEDIATE")
         cursor = conn.cursor()
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'action_items'"
+        )
+        created = cursor.fetchone() is None
         _create_tables(cursor)
+        # Seeded before migrating, so existing assignee names can resolve
         _seed_default_data(cursor)
+        if created:
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        pending = [migration for migration in MIGRATIONS if migration[0] > version]
+        for _, _, schema_step, _ in pending:
+            if schema_step:
+                schema_step(cursor)
+        if _create_search_index(cursor) and not created:
+            # The search_index backfill fills it, rather than a rebuild here
+            cursor.execute(
+                f"PRAGMA user_version = {min(version, SEARCH_INDEX_MIGRATION - 1)}"
+            )
+        _create_triggers(cursor)
+
+    if migrate:
+        run_migrations()
+
+
+def run_migrations(stop: threading.Event | None = None) -> list[int]:
+    """Run pending backfills in order, then create the managed indexes.
+
+    Each migration is claimed first (see MigrationClaim), re-checking
+    user_version under the write lock, so concurrent workers apply it once.
+    A worker finding a migration claimed by another leaves it and the
+    migrations after it to that worker.
+
+    Args:
+        stop: Set to stop after the current batch; the work done so far is
+            kept and resumes on the next run.
+
+    Returns:
+        Versions of the migrations this call applied.
+    """
+    # Read on the writer, so no pooled reader parses the schema before the indexes exist
+    with get_db() as conn:
+        version = conn.execute("PRAGMA user_version").fetchall()[0][0]
+    applied = []
+    for migration_version, name, _, backfill in MIGRATIONS:
+        if migration_version <= version:
+            continue
+        claim = _claim_migration(migration_version, stop)
+        if claim is None:
+            logger.info("Migration %d (%s) is applied or claimed by another worker",
+                        migration_version, name)
+            break
+        started = time.perf_counter()
+        try:
+            if backfill:
+                backfill(claim)
+        except MigrationStoppedError as exc:
+            logger.info("%s; it resumes on the next run", exc)
+            _release_migration(claim)
+            return applied
+        except BaseException:
+            _release_migration(claim)
+            raise
+        if not _finish_migration(claim):
+            break
+        applied.append(migration_version)
+        logger.info("Applied migration %d (%s) in %.1f ms", migration_version, name,
+                    (time.perf_counter() - started) * 1000)
+
+    if stop is None or not stop.is_set():
+        with get_db() as conn:
+            _create_indexes(conn.cursor())
+    return applied
 
 
 # Team members operations
-def get_all_team_members() -> list[dict]:
+def get_all_team_members(session: ReadSession | None = None) -> list[dict]:
     """Get all team members from database."""
-    with get_db() as conn:
+    with get_read_db(session) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM team_members ORDER BY name")
         rows = cursor.fetchall()
         return [dict(row) for row in rows]
 
 
-def get_team_member_by_id(member_id: int) -> dict | None:
+def get_team_member_rows(session: ReadSession | None = None) -> list[tuple]:
+    """Get all team members as plain tuples in TEAM_MEMBER_COLUMNS order."""
+    with get_read_db(session) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(f"SELECT {', '.join(TEAM_MEMBER_COLUMNS)} FROM team_members ORDER BY name")
+        return cursor.fetchall()
+
+
+def get_team_member_by_id(member_id: int, session: ReadSession | None = None) -> dict | None:
     """Get a team member by ID."""
-    with get_db() as conn:
+    with get_read_db(session) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM team_members WHERE id = ?", (member_id,))
         row = cursor.fetchone()
         return dict(row) if row else None
 
 
+def leaderboard_initials(name: str) -> str:
+    """Initials shown for an assignee not on the roster: up to two, from the name."""
+    return "".join(part[0].upper() for part in name.split() if part)[:2]
+
+
 def create_team_member(name: str, initials: str | None, slack_id: str | None,
                        jira_account_id: str | None, email: str | None) -> dict:
     """Create a new team member."""
@@ -188,10 +1458,20 @@ def delete_team_member(member_id: int) -> bool:
         return cursor.rowcount > 0
 
 
+def get_data_versions() -> dict[str, int]:
+    """Get the write counters of the tables in VERSIONED_TABLES.
+
+    Every committed write to one of those tables, from any process, raises
+    its counter, so comparing counters tells a cache whether it is stale.
+    """
+    with get_read_db() as conn:
+        return dict(conn.execute("SELECT name, version FROM data_versions").fetchall())
+
+
 # Settings operations
-def get_user_settings() -> dict:
+def get_user_settings(session: ReadSession | None = None) -> dict:
     """Get user settings from database."""
-    with get_db() as conn:
+    with get_read_db(session) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT value FROM settings WHERE key = ?", ("user_settings",))
         row = cursor.fetchone()
@@ -212,99 +1492,602 @@ def save_user_settings(settings: dict) -> dict:
 
 
 # Action items operations
+def _iso_due_on(due_date: str | None) -> str | None:
+    """Normalize a free-form due date to the ISO due_on column value."""
+    due_on = parse_due_date(due_date)
+    return due_on.isoformat() if due_on else None
+
+
 def save_action_item(title: str, assignee: str | None, due_date: str | None,
                      selected: bool = True, overdue: bool = False) -> dict:
-    """Save an action item to database."""
+    """Save an action item to database, resolving the assignee to a team member."""
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """INSERT INTO action_items (title, assignee, due_date, selected, overdue)
-               VALUES (?, ?, ?, ?, ?)""",
-            (title, assignee, due_date, int(selected), int(overdue))
+            f"""INSERT INTO action_items
+                   (title, assignee, assignee_id, due_date, due_on, selected, overdue)
+               VALUES (?, ?, {RESOLVE_ASSIGNEE_SQL.format("?")}, ?, ?, ?, ?)
+               RETURNING *""",
+            (title, assignee, assignee, due_date, _iso_due_on(due_date),
+             int(selected), int(overdue))
         )
-        item_id = cursor.lastrowid
-        cursor.execute("SELECT * FROM action_items WHERE id = ?", (item_id,))
-        row = cursor.fetchone()
-        return dict(row)
+        return dict(cursor.fetchone())
+
+
+# Batch operations pass the whole batch as one JSON parameter and expand it
+# with json_each, so each batch is a single set-based statement regardless of
+# size and never hits SQLite's bound-variable limit.
+def save_action_items(items: list[dict]) -> list[dict]:
+    """Save many action items in one statement.
 
+    Args:
+        items: Dicts with title, assignee, due_date and optional selected/overdue.
 
-def get_pending_action_items() -> list[dict]:
-    """Get all pending (not completed) action items."""
+    Returns:
+        The stored rows, in input order, with assignee_id resolved from the
+        assignee name.
+    """
+    if not items:
+        return []
+
+    payload = json.dumps([
+        {
+            "title": item["title"],
+            "assignee": item.get("assignee"),
+            "due_date": item.get("due_date"),
+            "due_on": _iso_due_on(item.get("due_date")),
+            "selected": int(item.get("selected", True)),
+            "overdue": int(item.get("overdue", False)),
+        }
+        for item in items
+    ])
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT * FROM action_items WHERE completed_at IS NULL ORDER BY created_at DESC"
+            f"""INSERT INTO action_items
+                   (title, assignee, assignee_id, due_date, due_on, selected, overdue)
+               SELECT json_extract(value, '$.title'), json_extract(value, '$.assignee'),
+                      {RESOLVE_ASSIGNEE_SQL.format("json_extract(value, '$.assignee')")},
+                      json_extract(value, '$.due_date'), json_extract(value, '$.due_on'),
+                      json_extract(value, '$.selected'), json_extract(value, '$.overdue')
+               FROM json_each(?)
+               ORDER BY key
+               RETURNING *""",
+            (payload,)
         )
+        rows = [dict(row) for row in cursor.fetchall()]
+    return sorted(rows, key=lambda row: row["id"])
+
+
+def update_action_items(updates: list[dict], today: date | None = None) -> list[dict]:
+    """Update many action items in one statement.
+
+    A pending item given a new due date has overdue recomputed from it, so
+    moving the date to today or later, or to no parseable date, clears the
+    flag the sweeper set.
+
+    Args:
+        updates: Dicts with an id plus any of title, assignee, due_date and
+            selected; None or missing fields are left unchanged. A new
+            assignee is resolved to its team member. Several updates to one
+            id are merged in order, later fields winning.
+        today: Reference day for overdue; defaults to today in UTC.
+
+    Returns:
+        The updated rows, ordered by id, one per id. IDs that do not exist
+        are omitted.
+    """
+    if not updates:
+        return []
+
+    # UPDATE ... FROM applies one batch row per item, chosen arbitrarily, so
+    # each id must appear once
+    merged: dict[int, dict] = {}
+    for update in updates:
+        fields = merged.setdefault(update["id"], {})
+        fields.update((key, value) for key, value in update.items() if value is not None)
+
+    payload = json.dumps([
+        {
+            "id": update["id"],
+            "title": update.get("title"),
+            "assignee": update.get("assignee"),
+            "due_date": update.get("due_date"),
+            "due_on": _iso_due_on(update.get("due_date")),
+            "selected": None if update.get("selected") is None else int(update["selected"]),
+        }
+        for update in merged.values()
+    ])
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"""WITH batch AS (
+                   SELECT json_extract(value, '$.id') AS id,
+                          json_extract(value, '$.title') AS title,
+                          json_extract(value, '$.assignee') AS assignee,
+                          json_extract(value, '$.due_date') AS due_date,
+                          json_extract(value, '$.due_on') AS due_on,
+                          json_extract(value, '$.selected') AS selected
+                   FROM json_each(?)
+               )
+               UPDATE action_items SET
+                   title = COALESCE(batch.title, action_items.title),
+                   assignee = COALESCE(batch.assignee, action_items.assignee),
+                   assignee_id = CASE WHEN batch.assignee IS NULL THEN action_items.assignee_id
+                                      ELSE {RESOLVE_ASSIGNEE_SQL.format("batch.assignee")} END,
+                   due_date = COALESCE(batch.due_date, action_items.due_date),
+                   due_on = CASE WHEN batch.due_date IS NULL THEN action_items.due_on
+                                 ELSE batch.due_on END,
+                   overdue = CASE WHEN batch.due_date IS NULL
+                                       OR action_items.completed_at IS NOT NULL
+                                  THEN action_items.overdue
+                                  ELSE COALESCE(batch.due_on < ?, 0) END,
+                   selected = COALESCE(batch.selected, action_items.selected)
+               FROM batch
+               WHERE action_items.id = batch.id
+               RETURNING *""",
+            (payload, (today or datetime.now(UTC).date()).isoformat())
+        )
+        rows = [dict(row) for row in cursor.fetchall()]
+    return sorted(rows, key=lambda row: row["id"])
+
+
+def _pending_items_query(select_list: str, limit: int | None,
+                         after: tuple[int, int] | None) -> tuple[str, list]:
+    """Build the keyset-paginated pending items query."""
+    sql = f"SELECT {select_list} FROM action_items WHERE completed_at IS NULL"
+    params: list = []
+    if after is not None:
+        sql += " AND (created_at, id) < (?, ?)"
+        params.extend(after)
+    sql += " ORDER BY created_at DESC, id DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return sql, params
+
+
+def get_pending_action_items(limit: int | None = None,
+                             after: tuple[int, int] | None = None,
+                             session: ReadSession | None = None) -> list[dict]:
+    """Get pending (not completed) action items, newest first.
+
+    Pages are keyset-paginated on (created_at, id), so each page is a range
+    scan of the pending index no matter how deep it is.
+
+    Args:
+        limit: Maximum number of items to return; None returns all.
+        after: (created_at, id) of the last item on the previous page.
+        session: Read session to run in, instead of a pooled connection.
+    """
+    sql, params = _pending_items_query("*", limit, after)
+    with get_read_db(session) as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
         return [dict(row) for row in cursor.fetchall()]
 
 
+def get_pending_action_item_rows(limit: int | None = None,
+                                 after: tuple[int, int] | None = None,
+                                 session: ReadSession | None = None) -> list[tuple]:
+    """Get pending action items as plain tuples, newest first.
+
+    Each tuple holds PENDING_ITEM_COLUMNS followed by created_at, the
+    trailing column being the keyset position for pagination.
+    """
+    sql, params = _pending_items_query(
+        ", ".join(PENDING_ITEM_COLUMNS + ("created_at",)), limit, after
+    )
+    with get_read_db(session) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
 def mark_action_item_completed(item_id: int, ticket_key: str | None = None) -> bool:
     """Mark an action item as completed."""
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "UPDATE action_items SET completed_at = CURRENT_TIMESTAMP, ticket_key = ? WHERE id = ?",
+            f"UPDATE action_items SET completed_at = {NOW_EPOCH_SQL}, ticket_key = ? WHERE id = ?",
             (ticket_key, item_id)
         )
         return cursor.rowcount > 0
 
 
-def get_analytics_data() -> dict:
-    """Get analytics data for dashboard."""
+def complete_action_items(completions: list[tuple[int, str | None]]) -> list[int]:
+    """Mark many action items as completed in one statement.
+
+    Args:
+        completions: (item_id, ticket_key) pairs; for a repeated ID the last
+            pair's ticket_key wins.
+
+    Returns:
+        IDs of the items that were marked completed, ascending.
+    """
+    if not completions:
+        return []
+
+    # UPDATE ... FROM applies an arbitrary one of several rows matching an id
+    ticket_keys = dict(completions)
+    payload = json.dumps([{"id": item_id, "ticket_key": key} for item_id, key in ticket_keys.items()])
     with get_db() as conn:
         cursor = conn.cursor()
+        cursor.execute(
+            f"""WITH batch AS (
+                   SELECT json_extract(value, '$.id') AS id,
+                          json_extract(value, '$.ticket_key') AS ticket_key
+                   FROM json_each(?)
+               )
+               UPDATE action_items SET
+                   completed_at = {NOW_EPOCH_SQL},
+                   ticket_key = batch.ticket_key
+               FROM batch
+               WHERE action_items.id = batch.id
+               RETURNING action_items.id""",
+            (payload,)
+        )
+        return sorted(row[0] for row in cursor.fetchall())
 
-        # Completed this week
-        cursor.execute("""
-            SELECT COUNT(*) FROM action_items
-            WHERE completed_at IS NOT NULL
-            AND completed_at >= date('now', '-7 days')
-        """)
-        completed_this_week = cursor.fetchone()[0]
 
-        # Pending actions
-        cursor.execute("SELECT COUNT(*) FROM action_items WHERE completed_at IS NULL")
-        pending_count = cursor.fetchone()[0]
+def delete_action_items(item_ids: list[int]) -> list[int]:
+    """Delete many action items in one statement.
+
+    Args:
+        item_ids: IDs of the items to delete.
+
+    Returns:
+        IDs of the items that were deleted, ascending.
+    """
+    if not item_ids:
+        return []
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """DELETE FROM action_items
+               WHERE id IN (SELECT value FROM json_each(?))
+               RETURNING id""",
+            (json.dumps(item_ids),)
+        )
+        return sorted(row[0] for row in cursor.fetchall())
+
+
+def sweep_overdue_action_items(today: date | None = None) -> int:
+    """Flag pending items whose due date has passed as overdue.
+
+    One UPDATE over the due_on index range; the counter triggers keep the
+    overdue totals in step.
+
+    Args:
+        today: Reference day; defaults to today in UTC.
+
+    Returns:
+        Number of items newly flagged overdue.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """UPDATE action_items SET overdue = 1
+               WHERE completed_at IS NULL AND due_on < ? AND overdue = 0""",
+            ((today or datetime.now(UTC).date()).isoformat(),)
+        )
+        return cursor.rowcount
+
+
+def build_search_query(text: str) -> str | None:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted so FTS5 operators and punctuation in user input are
+    matched literally, and the last word is a prefix match so partially
+    typed words still find results.
+
+    Args:
+        text: Search text as typed by the user.
+
+    Returns:
+        The MATCH expression, or None if the text contains no words.
+    """
+    tokens = _SEARCH_TOKEN.findall(text)
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+# Status filters accepted by search_action_item_rows
+SEARCH_STATUS_FILTERS = {
+    "all": "",
+    "pending": " AND a.completed_at IS NULL",
+    "completed": " AND a.completed_at IS NOT NULL",
+}
+
+
+def search_action_item_rows(query: str, assignee: str | None = None,
+                            status: str = "all", limit: int = 20,
+                            offset: int = 0, session: ReadSession | None = None) -> list[tuple]:
+    """Search action item titles, archived items included, best matches first.
+
+    Matching runs against the FTS5 index and results are ordered by its
+    bm25 rank, so cost depends on the number of matches rather than the
+    size of the table. Each match is looked up by id in the live and the
+    archive table; it is in exactly one of them.
+
+    Args:
+        query: Search text; see build_search_query.
+        assignee: Only return items assigned to this name.
+        status: One of SEARCH_STATUS_FILTERS.
+        limit: Maximum number of rows to return.
+        offset: Number of ranked rows to skip.
+        session: Read session to run in, instead of a pooled connection.
+
+    Returns:
+        Tuples in SEARCH_RESULT_COLUMNS order.
+
+    Raises:
+        ValueError: If the status is not recognized.
+    """
+    if status not in SEARCH_STATUS_FILTERS:
+        raise ValueError(f"Unknown status filter: {status}")
+    match = build_search_query(query)
+    if match is None:
+        return []
+
+    select_list = ", ".join(
+        "action_items_fts.rank AS rank" if column == "rank"
+        else f"COALESCE(live.{column}, archived.{column}) AS {column}"
+        for column in SEARCH_RESULT_COLUMNS
+    )
+    sql = f"""
+        SELECT {", ".join(SEARCH_RESULT_COLUMNS)} FROM (
+            SELECT {select_list}
+            FROM action_items_fts
+            LEFT JOIN action_items AS live ON live.id = action_items_fts.rowid
+            LEFT JOIN action_items_archive AS archived ON archived.id = action_items_fts.rowid
+            WHERE action_items_fts MATCH ?
+        ) AS a
+        WHERE a.id IS NOT NULL{SEARCH_STATUS_FILTERS[status]}
+    """
+    params: list = [match]
+    if assignee is not None:
+        sql += " AND a.assignee = ?"
+        params.append(assignee)
+    sql += " ORDER BY a.rank, a.id LIMIT ? OFFSET ?"
+    params.extend((limit, offset))
+
+    with get_read_db(session) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
+        return cursor.fetchall()
 
-        # Overdue count
-        cursor.execute("""
-            SELECT COUNT(*) FROM action_items
-            WHERE completed_at IS NULL AND overdue = 1
-        """)
-        overdue_count = cursor.fetchone()[0]
 
-        # Active team members (those with assignments)
+def archive_cutoff(older_than_days: int | None = None, now: int | None = None) -> int:
+    """Epoch second before which completed items are due for archiving."""
+    days = app_settings.archive_after_days if older_than_days is None else older_than_days
+    return (int(time.time()) if now is None else now) - days * 86400
+
+
+def archive_completed_action_items_batch(cutoff: int, batch_size: int) -> int:
+    """Move one batch of old completed items into action_items_archive.
+
+    The oldest completions go first, found through the completed_at index.
+    Copy and delete share one short write transaction, so a batch is either
+    fully moved or not at all.
+
+    Args:
+        cutoff: Items completed before this epoch second are archived.
+        batch_size: Maximum number of items to move.
+
+    Returns:
+        Number of items moved; 0 once nothing older than the cutoff is left.
+    """
+    columns = ", ".join(ARCHIVED_COLUMNS)
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT id FROM action_items
+               WHERE completed_at IS NOT NULL AND completed_at < ?
+               ORDER BY completed_at
+               LIMIT ?""",
+            (cutoff, batch_size)
+        )
+        payload = json.dumps([row[0] for row in cursor.fetchall()])
+        cursor.execute(
+            f"""INSERT INTO action_items_archive ({columns})
+                SELECT {columns} FROM action_items
+                WHERE id IN (SELECT value FROM json_each(?))""",
+            (payload,)
+        )
+        cursor.execute(
+            "DELETE FROM action_items WHERE id IN (SELECT value FROM json_each(?))",
+            (payload,)
+        )
+        return cursor.rowcount
+
+
+def archive_completed_action_items(older_than_days: int | None = None,
+                                   batch_size: int | None = None,
+                                   now: int | None = None) -> int:
+    """Move completed items older than the retention age into the archive.
+
+    Work is split into batches, each its own transaction, so the writer is
+    released between batches and other writes are never held up for long.
+
+    Args:
+        older_than_days: Retention age; defaults to the archive_after_days setting.
+        batch_size: Items per batch; defaults to the archive_batch_size setting.
+        now: Reference epoch second; defaults to the current time.
+
+    Returns:
+        Total number of items archived.
+    """
+    cutoff = archive_cutoff(older_than_days, now)
+    batch_size = batch_size or app_settings.archive_batch_size
+    archived = 0
+    while moved := archive_completed_action_items_batch(cutoff, batch_size):
+        archived += moved
+    return archived
+
+
+def get_action_item_history(limit: int, after: tuple[int, int] | None = None,
+                            assignee: str | None = None, start: str | None = None,
+                            end: str | None = None,
+                            session: ReadSession | None = None) -> list[tuple]:
+    """Get completed action items, hot and archived, most recent first.
+
+    Each table is range-scanned on its completed_at index and the two
+    ordered pages are merged, so archived history costs the same as recent
+    history. Pages are keyset-paginated on (completed_at, id).
+
+    Args:
+        limit: Maximum number of items to return.
+        after: (completed_at, id) of the last item on the previous page.
+        assignee: Only return items assigned to this name.
+        start: First completion day (ISO date, inclusive).
+        end: Last completion day (ISO date, inclusive).
+        session: Read session to run in, instead of a pooled connection.
+
+    Returns:
+        Tuples in HISTORY_ITEM_COLUMNS order.
+    """
+    conditions = ["completed_at IS NOT NULL"]
+    params: list = []
+    if after is not None:
+        conditions.append("(completed_at, id) < (?, ?)")
+        params.extend(after)
+    if assignee is not None:
+        conditions.append("assignee = ?")
+        params.append(assignee)
+    if start is not None:
+        conditions.append("completed_at >= CAST(strftime('%s', ?) AS INTEGER)")
+        params.append(start)
+    if end is not None:
+        conditions.append("completed_at < CAST(strftime('%s', ?, '+1 day') AS INTEGER)")
+        params.append(end)
+    where = " AND ".join(conditions)
+    columns = ", ".join(column for column in HISTORY_ITEM_COLUMNS if column != "archived")
+
+    sql = f"""
+        SELECT * FROM (
+            SELECT {columns}, 0 AS archived FROM action_items WHERE {where}
+            ORDER BY completed_at DESC, id DESC LIMIT ?
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT {columns}, 1 AS archived FROM action_items_archive WHERE {where}
+            ORDER BY completed_at DESC, id DESC LIMIT ?
+        )
+        ORDER BY completed_at DESC, id DESC
+        LIMIT ?
+    """
+    with get_read_db(session) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, [*params, limit, *params, limit, limit])
+        return cursor.fetchall()
+
+
+def get_daily_completions(start: str, end: str,
+                          session: ReadSession | None = None) -> dict[str, int]:
+    """Get completions per day from the daily rollup.
+
+    Args:
+        start: First day (ISO date, inclusive).
+        end: Last day (ISO date, inclusive).
+        session: Read session to run in, instead of a pooled connection.
+
+    Returns:
+        Mapping of ISO day to completions; days without completions are omitted.
+    """
+    with get_read_db(session) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT day, SUM(completed) FROM daily_completions
+               WHERE day BETWEEN ? AND ?
+               GROUP BY day""",
+            (start, end)
+        )
+        return {row[0]: row[1] for row in cursor.fetchall() if row[1]}
+
+
+def get_analytics_data(start: str | None = None, end: str | None = None,
+                       session: ReadSession | None = None) -> dict:
+    """Get analytics data for dashboard.
+
+    Totals come from the trigger-maintained counter tables and completions
+    from the daily rollup, so the cost does not grow with history. The
+    leaderboard takes names and initials from one left join with
+    team_members; assignees not on the roster appear under their assignee
+    name, with initials derived from it and no assignee_id.
+
+    Args:
+        start: First day (ISO date) of the leaderboard window; defaults to
+            seven days ago, matching completed_this_week.
+        end: Last day (ISO date) of the leaderboard window; defaults to today.
+        session: Read session to run in; its transaction replaces the one
+            the queries otherwise share.
+    """
+    with get_read_db(session) as conn:
+        cursor = conn.cursor()
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            cursor.execute("BEGIN")
+
+        cursor.execute("SELECT pending, overdue FROM analytics_counters WHERE id = 1")
+        row = cursor.fetchone()
+        pending_count, overdue_count = (row[0], row[1]) if row else (0, 0)
+
+        # Rows keyed by a name off the roster have no team member to join
         cursor.execute("""
-            SELECT COUNT(DISTINCT assignee) FROM action_items
-            WHERE assignee IS NOT NULL AND completed_at IS NULL
+            SELECT m.id, COALESCE(m.name, c.assignee), m.initials, c.total, c.pending,
+                   c.assignee_id, c.assignee
+            FROM assignee_counters AS c
+            LEFT JOIN team_members AS m ON m.id = c.assignee_id
+            WHERE c.total > 0 AND (m.id IS NOT NULL OR c.assignee != '')
+            ORDER BY 2
         """)
-        active_members = cursor.fetchone()[0]
+        assignee_rows = cursor.fetchall()
 
-        # Team member stats (using SQLite-compatible CASE/SUM instead of FILTER)
         cursor.execute("""
-            SELECT assignee,
-                   SUM(CASE WHEN completed_at IS NOT NULL AND completed_at >= date('now', '-7 days') THEN 1 ELSE 0 END) as completed,
-                   COUNT(*) as total
-            FROM action_items
-            WHERE assignee IS NOT NULL
-            GROUP BY assignee
-            ORDER BY completed DESC
+            SELECT COALESCE(SUM(completed), 0) FROM daily_completions
+            WHERE day >= date('now', '-7 days')
         """)
+        completed_this_week = cursor.fetchone()[0]
 
-        team_stats = []
-        for row in cursor.fetchall():
-            completion_rate = (row[1] / row[2] * 100) if row[2] > 0 else 0
-            team_stats.append({
-                "assignee": row[0],
-                "completed_this_week": row[1],
-                "total": row[2],
-                "completion_rate": round(completion_rate)
-            })
-
-        return {
-            "completed_this_week": completed_this_week,
-            "pending_count": pending_count,
-            "overdue_count": overdue_count,
-            "active_members": active_members,
-            "team_stats": team_stats
-        }
+        cursor.execute(
+            """SELECT assignee_id, assignee, SUM(completed) FROM daily_completions
+               WHERE day >= COALESCE(?, date('now', '-7 days'))
+               AND day <= COALESCE(?, date('now'))
+               AND (assignee_id != 0 OR assignee != '')
+               GROUP BY assignee_id, assignee""",
+            (start, end)
+        )
+        completed_by_assignee = {row[:2]: row[2] for row in cursor.fetchall()}
+
+        if own_transaction:
+            conn.rollback()
+
+    team_stats = []
+    for assignee_id, name, initials, total, _, *key in assignee_rows:
+        completed = completed_by_assignee.get(tuple(key), 0)
+        completion_rate = (completed / total * 100) if total > 0 else 0
+        team_stats.append({
+            "assignee_id": assignee_id,
+            "assignee": name,
+            "initials": initials or leaderboard_initials(name),
+            "completed_this_week": completed,
+            "total": total,
+            "completion_rate": round(completion_rate)
+        })
+    team_stats.sort(key=lambda stat: stat["completed_this_week"], reverse=True)
+
+    return {
+        "completed_this_week": completed_this_week,
+        "pending_count": pending_count,
+        "overdue_count": overdue_count,
+        "active_members": sum(1 for row in assignee_rows if row[4] > 0),
+        "team_stats": team_stats
+    }
@@ -0,0 +1,65 @@
+"""Normalization of free-form due dates into ISO dates."""
+import re
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
+
+# Formats Claude and users commonly produce; the yearless ones get a year inferred
+_DATE_FORMATS_WITH_YEAR = ("%Y-%m-%d", "%b %d %Y", "%B %d %Y", "%d %b %Y", "%d %B %Y", "%m/%d/%Y")
+_DATE_FORMATS_WITHOUT_YEAR = ("%b %d", "%B %d", "%d %b", "%d %B", "%m/%d")
+
+# A yearless date is placed in the year that puts it closest to the reference
+# day, i.e. within half a year either side.
+_HALF_YEAR = timedelta(days=183)
+
+# Leap year used to parse yearless dates so that "Feb 29" is accepted
+_LEAP_YEAR = 2000
+
+_ORDINAL_SUFFIX = re.compile(r"(?<=\d)(st|nd|rd|th)\b", re.IGNORECASE)
+
+
+def parse_due_date(text: str | None, today: date | None = None) -> date | None:
+    """Parse a free-form due date such as "Jan 15" into a date.
+
+    Args:
+        text: Due date text, e.g. "Jan 15", "January 15th, 2026" or "2026-01-15".
+        today: Reference day for year inference; defaults to today in UTC.
+
+    Returns:
+        The parsed date, or None if the text is empty or not recognized.
+    """
+    if not text:
+        return None
+    cleaned = _ORDINAL_SUFFIX.sub("", text.replace(",", " "))
+    cleaned = " ".join(cleaned.split())
+    return _parse_cached(cleaned.lower(), today or datetime.now(UTC).date())
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(cleaned: str, today: date) -> date | None:
+    """Parse normalized due date text; memoized per (text, reference day)."""
+    for fmt in _DATE_FORMATS_WITH_YEAR:
+        try:
+            return datetime.strptime(cleaned, fmt).date()
+        except ValueError:
+            continue
+
+    for fmt in _DATE_FORMATS_WITHOUT_YEAR:
+        try:
+            parsed = datetime.strptime(f"{cleaned} {_LEAP_YEAR}", f"{fmt} %Y").date()
+        except ValueError:
+            continue
+        return _infer_year(parsed.month, parsed.day, today)
+
+    return None
+
+
+def _infer_year(month: int, day: int, today: date) -> date | None:
+    """Place a month/day in the year nearest to the reference day."""
+    for year in (today.year, today.year + 1, today.year - 1):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue  # Feb 29 outside a leap year
+        if abs(candidate - today) <= _HALF_YEAR:
+            return candidate
+    return None
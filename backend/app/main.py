@@ -1,15 +1,89 @@
 """FastAPI application for Sanas Action Items Tracker."""
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
+from app.storage import get_engine
+from app.async_database import (
+    get_executor,
+    shutdown_executor,
+    sweep_overdue_action_items,
+    archive_completed_action_items,
+    run_scheduled_maintenance,
+)
+from app.tasks import PeriodicTask
 from app.api.actions import router as actions_router
 from app.api.settings import router as settings_router
+from app.api.admin import router as admin_router
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_migrations(engine, stop: threading.Event) -> None:
+    """Apply pending data migrations on a thread of their own, logging failures.
+
+    Backfills can run for minutes, so they neither delay startup nor hold a
+    database executor thread.
+    """
+    try:
+        applied = await asyncio.to_thread(engine.migrate, stop)
+        if applied:
+            logger.info("Data migrations applied: %s", applied)
+    except Exception:
+        logger.exception("Data migrations failed; they resume on the next start")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the storage engine, worker threads and background jobs."""
+    engine = get_engine()
+    engine.open()
+    get_executor()
+    migrations_stop = threading.Event()
+    migrations = asyncio.create_task(
+        _run_migrations(engine, migrations_stop), name="migrations"
+    )
+    background_tasks = [
+        PeriodicTask(
+            "overdue-sweep",
+            settings.overdue_sweep_interval_seconds,
+            sweep_overdue_action_items,
+        ),
+        PeriodicTask(
+            "archive-completed",
+            settings.archive_interval_seconds,
+            archive_completed_action_items,
+        ),
+        PeriodicTask(
+            "maintenance",
+            settings.maintenance_interval_seconds,
+            run_scheduled_maintenance,
+        ),
+    ]
+    for task in background_tasks:
+        task.start()
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            await task.stop()
+        # The running batch finishes; the rest resumes on the next start
+        migrations_stop.set()
+        await migrations
+        shutdown_executor()
+        engine.close()
+
 
 app = FastAPI(
     title=settings.app_name,
     description="Backend API for extracting action items from meeting notes and creating Jira tickets",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -24,6 +98,7 @@ app.add_middleware(
 # Include routers
 app.include_router(actions_router)
 app.include_router(settings_router)
+app.include_router(admin_router)
 
 
 @app.get("/health")
@@ -0,0 +1,277 @@
+"""Routine SQLite maintenance: planner statistics and free-page reclaim.
+
+A maintenance run takes these steps, within one time budget:
+
+* analyze: a full ANALYZE, only while the database has no statistics yet
+* optimize: PRAGMA optimize, which re-analyzes only tables whose
+  statistics have gone stale
+* incremental_vacuum: returns free pages to the filesystem a few pages per
+  write transaction, so writers only ever wait for one small step
+
+Each step holds the writer connection for its duration. A progress handler
+interrupts any statement still running when the budget runs out, so a run
+never holds the writer past its budget. The scheduled job only runs inside
+the configured UTC maintenance window.
+
+Databases created before auto_vacuum=INCREMENTAL was the default need one
+full VACUUM to switch modes:
+    uv run python -m app.maintenance --enable-incremental-vacuum
+"""
+import argparse
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+from app import database
+from app.config import settings as app_settings
+from app.storage import get_engine
+
+logger = logging.getLogger(__name__)
+
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+# SQLite virtual machine instructions between deadline checks
+_PROGRESS_INTERVAL = 1000
+
+# Only one maintenance run at a time
+_maintenance_lock = threading.Lock()
+_last_report: dict | None = None
+
+
+class MaintenanceInProgressError(RuntimeError):
+    """Raised when maintenance is requested while a run is in progress."""
+
+
+def in_maintenance_window(now: datetime | None = None) -> bool:
+    """Whether now falls inside the configured UTC maintenance window.
+
+    The window runs from maintenance_window_start_hour up to, not including,
+    maintenance_window_end_hour, and may wrap past midnight. Equal hours mean
+    any time.
+    """
+    start = app_settings.maintenance_window_start_hour % 24
+    end = app_settings.maintenance_window_end_hour % 24
+    if start == end:
+        return True
+    hour = (now or datetime.now(UTC)).hour
+    if start < end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+def get_last_report() -> dict | None:
+    """The report of the most recent maintenance run, if any."""
+    return _last_report
+
+
+@contextmanager
+def _held_writer(step: dict, deadline: float) -> Generator[sqlite3.Connection, None, None]:
+    """Borrow the writer for one transaction of a step, timing how long it is held.
+
+    Statements still running at the deadline are interrupted.
+    """
+    with database.get_db() as conn:
+        acquired = time.perf_counter()
+        conn.set_progress_handler(
+            lambda: int(time.perf_counter() > deadline), _PROGRESS_INTERVAL
+        )
+        try:
+            yield conn
+        finally:
+            conn.set_progress_handler(None, 0)
+            held_ms = (time.perf_counter() - acquired) * 1000
+            step["transactions"] += 1
+            step["lock_held_ms"] = round(max(step["lock_held_ms"], held_ms), 3)
+
+
+def _new_step(name: str) -> dict:
+    """Empty report entry for one maintenance step."""
+    return {
+        "name": name,
+        "ran": False,
+        "interrupted": False,
+        "duration_ms": 0.0,
+        "lock_held_ms": 0.0,
+        "transactions": 0,
+        "detail": "",
+    }
+
+
+def _run_statement(name: str, sql: str, deadline: float) -> dict:
+    """Run a single-statement step under the deadline."""
+    step = _new_step(name)
+    started = time.perf_counter()
+    try:
+        with _held_writer(step, deadline) as conn:
+            conn.executescript(sql)
+        step["ran"] = True
+    except sqlite3.OperationalError as exc:
+        if "interrupted" not in str(exc):
+            raise
+        step["interrupted"] = True
+    step["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return step
+
+
+def _incremental_vacuum(deadline: float, step_pages: int) -> dict:
+    """Free pages a few at a time until none are left or the budget is spent."""
+    step = _new_step("incremental_vacuum")
+    started = time.perf_counter()
+    freed = 0
+    while time.perf_counter() < deadline:
+        with _held_writer(step, deadline) as conn:
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if before == 0:
+                break
+            try:
+                # executescript steps the pragma to completion; execute() frees one page
+                conn.executescript(f"PRAGMA incremental_vacuum({int(step_pages)})")
+            except sqlite3.OperationalError as exc:
+                if "interrupted" not in str(exc):
+                    raise
+                step["interrupted"] = True
+            freed += before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if step["interrupted"]:
+            break
+    else:
+        step["interrupted"] = True
+    step["ran"] = step["transactions"] > 0
+    step["detail"] = f"{freed} pages freed"
+    step["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return step
+
+
+def _database_state() -> tuple[str, int, bool]:
+    """auto_vacuum mode, free pages, and whether statistics exist."""
+    with database.get_read_db() as conn:
+        # Reading the freelist reloads the header; auto_vacuum alone may be stale
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        analyzed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone() is not None
+    return AUTO_VACUUM_MODES.get(mode, str(mode)), freelist, analyzed
+
+
+def run_maintenance(budget_ms: float | None = None) -> dict:
+    """Run the maintenance steps within a time budget.
+
+    Args:
+        budget_ms: Total time allowed; defaults to the maintenance_budget_ms
+            setting. Steps not reached before it runs out are skipped.
+
+    Returns:
+        Report with the auto_vacuum mode, free pages before and after, and
+        per step whether it ran, whether it was interrupted, its duration,
+        the longest single hold of the writer and how many transactions it
+        took.
+
+    Raises:
+        MaintenanceInProgressError: If another run is in progress.
+    """
+    global _last_report
+    if not _maintenance_lock.acquire(blocking=False):
+        raise MaintenanceInProgressError("Maintenance is already in progress")
+    try:
+        budget_ms = app_settings.maintenance_budget_ms if budget_ms is None else budget_ms
+        started_at = datetime.now(UTC)
+        started = time.perf_counter()
+        deadline = started + budget_ms / 1000
+        auto_vacuum, freelist_before, analyzed = _database_state()
+
+        steps = []
+        if analyzed:
+            step = _new_step("analyze")
+            step["detail"] = "statistics exist; left to optimize"
+            steps.append(step)
+        else:
+            steps.append(_run_statement(
+                "analyze",
+                f"PRAGMA analysis_limit = {int(app_settings.maintenance_analysis_limit)}; ANALYZE",
+                deadline,
+            ))
+        steps.append(_run_statement("optimize", "PRAGMA optimize", deadline))
+        if auto_vacuum == "incremental":
+            steps.append(_incremental_vacuum(deadline, app_settings.maintenance_vacuum_step_pages))
+        else:
+            step = _new_step("incremental_vacuum")
+            step["detail"] = (
+                f"auto_vacuum is {auto_vacuum}; run python -m app.maintenance "
+                "--enable-incremental-vacuum"
+            )
+            steps.append(step)
+
+        report = {
+            "started_at": started_at.isoformat(),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            "budget_ms": budget_ms,
+            "auto_vacuum": auto_vacuum,
+            "freelist_pages_before": freelist_before,
+            "freelist_pages_after": _database_state()[1],
+            "steps": steps,
+        }
+        _last_report = report
+        logger.info("Maintenance finished: %s", report)
+        return report
+    finally:
+        _maintenance_lock.release()
+
+
+def run_scheduled_maintenance() -> dict | None:
+    """Run maintenance if inside the window and on the sqlite engine.
+
+    Returns:
+        The report, or None when the run was skipped.
+    """
+    if get_engine().name != "sqlite" or not in_maintenance_window():
+        return None
+    try:
+        return run_maintenance()
+    except MaintenanceInProgressError:
+        return None
+
+
+def enable_incremental_vacuum() -> dict:
+    """Switch the database to auto_vacuum=INCREMENTAL with one full VACUUM.
+
+    VACUUM rewrites the whole file and holds the writer throughout, so this
+    is a one-off, run by hand, not part of scheduled maintenance.
+
+    Returns:
+        The mode before and after, and how long the VACUUM took.
+    """
+    before = _database_state()[0]
+    started = time.perf_counter()
+    with database.get_db() as conn:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        if before != "incremental":
+            conn.execute("VACUUM")
+    return {
+        "before": before,
+        "after": _database_state()[0],
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run maintenance from the command line and print the report."""
+    parser = argparse.ArgumentParser(description="Run Sanas database maintenance.")
+    parser.add_argument("--budget-ms", type=float, help="Time budget for the run")
+    parser.add_argument(
+        "--enable-incremental-vacuum", action="store_true",
+        help="Switch the database to auto_vacuum=INCREMENTAL (runs a full VACUUM)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.enable_incremental_vacuum:
+        print(json.dumps(enable_incremental_vacuum(), indent=2))
+    print(json.dumps(run_maintenance(args.budget_ms), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,19 @@ from .action_item import (
     ActionItemBase,
     ActionItemCreate,
     ActionItemUpdate,
+    ActionItemRecord,
+    ActionItemBatchCreateRequest,
+    ActionItemBatchUpdate,
+    ActionItemBatchUpdateRequest,
+    ActionItemCompletion,
+    ActionItemBatchCompleteRequest,
+    ActionItemBatchDeleteRequest,
+    ActionItemBatchResponse,
+    ActionItemBatchResultResponse,
+    ActionItemSearchResult,
+    ActionItemSearchResponse,
+    ActionItemHistoryEntry,
+    ActionItemHistoryPage,
     ExtractActionItemsRequest,
     ExtractActionItemsResponse,
 )
@@ -29,11 +42,26 @@ from .settings import (
     UserSettings,
     IntegrationStatus,
 )
+from .admin import (
+    SnapshotRequest,
+    SnapshotResponse,
+    HistogramBucket,
+    LatencySummary,
+    QueryLatency,
+    SlowQuery,
+    SQLiteStats,
+    DatabaseStatsResponse,
+    MaintenanceRequest,
+    MaintenanceStep,
+    MaintenanceReport,
+    CacheStats,
+)
 from .analytics import (
     AnalyticsStats,
     TeamMemberStats,
     WeeklyTrend,
     PendingActionItem,
+    PendingActionItemPage,
     AnalyticsResponse,
 )
 
@@ -42,6 +70,19 @@ __all__ = [
     "ActionItemBase",
     "ActionItemCreate",
     "ActionItemUpdate",
+    "ActionItemRecord",
+    "ActionItemBatchCreateRequest",
+    "ActionItemBatchUpdate",
+    "ActionItemBatchUpdateRequest",
+    "ActionItemCompletion",
+    "ActionItemBatchCompleteRequest",
+    "ActionItemBatchDeleteRequest",
+    "ActionItemBatchResponse",
+    "ActionItemBatchResultResponse",
+    "ActionItemSearchResult",
+    "ActionItemSearchResponse",
+    "ActionItemHistoryEntry",
+    "ActionItemHistoryPage",
     "ExtractActionItemsRequest",
     "ExtractActionItemsResponse",
     "JiraConfig",
@@ -60,9 +101,22 @@ __all__ = [
     "DefaultSettings",
     "UserSettings",
     "IntegrationStatus",
+    "SnapshotRequest",
+    "SnapshotResponse",
+    "HistogramBucket",
+    "LatencySummary",
+    "QueryLatency",
+    "SlowQuery",
+    "SQLiteStats",
+    "DatabaseStatsResponse",
+    "MaintenanceRequest",
+    "MaintenanceStep",
+    "MaintenanceReport",
+    "CacheStats",
     "AnalyticsStats",
     "TeamMemberStats",
     "WeeklyTrend",
     "PendingActionItem",
+    "PendingActionItemPage",
     "AnalyticsResponse",
 ]
@@ -15,6 +15,7 @@ class ActionItem(ActionItemBase):
     """Action item with ID and status flags."""
 
     id: int = Field(..., description="Unique identifier")
+    due_on: date | None = Field(None, description="Due date normalized to an ISO date")
     selected: bool = Field(default=True, description="Whether item is selected")
     overdue: bool = Field(default=False, description="Whether item is overdue")
 
@@ -34,6 +35,132 @@ class ActionItemUpdate(BaseModel):
     selected: bool | None = None
 
 
+# Upper bound on items per batch request
+MAX_BATCH_SIZE = 1000
+
+
+class ActionItemRecord(ActionItemBase):
+    """Stored action item, as persisted in the database."""
+
+    id: int = Field(..., description="Unique identifier")
+    due_on: date | None = Field(None, description="Due date normalized to an ISO date")
+    selected: bool = Field(default=True, description="Whether item is selected")
+    overdue: bool = Field(default=False, description="Whether item is overdue")
+    ticket_key: str | None = Field(None, description="Jira ticket key once completed")
+    created_at: int | None = Field(None, description="Creation time (epoch seconds, UTC)")
+    completed_at: int | None = Field(None, description="Completion time (epoch seconds, UTC)")
+
+
+class ActionItemBatchCreateRequest(BaseModel):
+    """Request schema for creating many action items at once."""
+
+    items: list[ActionItemCreate] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE, description="Action items to create"
+    )
+
+
+class ActionItemBatchUpdate(ActionItemUpdate):
+    """Update for a single action item within a batch."""
+
+    id: int = Field(..., description="ID of the action item to update")
+
+
+class ActionItemBatchUpdateRequest(BaseModel):
+    """Request schema for updating many action items at once."""
+
+    updates: list[ActionItemBatchUpdate] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE, description="Per-item updates"
+    )
+
+
+class ActionItemCompletion(BaseModel):
+    """Completion of a single action item within a batch."""
+
+    id: int = Field(..., description="ID of the action item to complete")
+    ticket_key: str | None = Field(None, description="Associated Jira ticket key")
+
+
+class ActionItemBatchCompleteRequest(BaseModel):
+    """Request schema for completing many action items at once."""
+
+    items: list[ActionItemCompletion] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE, description="Items to complete"
+    )
+
+
+class ActionItemBatchDeleteRequest(BaseModel):
+    """Request schema for deleting many action items at once."""
+
+    ids: list[int] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE, description="IDs of items to delete"
+    )
+
+
+class ActionItemBatchResponse(BaseModel):
+    """Response schema for batch create and update operations."""
+
+    items: list[ActionItemRecord] = Field(..., description="Affected action items")
+    missing: list[int] = Field(
+        default_factory=list, description="Requested IDs that do not exist"
+    )
+
+
+class ActionItemBatchResultResponse(BaseModel):
+    """Response schema for batch complete and delete operations."""
+
+    succeeded: list[int] = Field(..., description="IDs that were processed")
+    missing: list[int] = Field(
+        default_factory=list, description="Requested IDs that do not exist"
+    )
+
+
+class ActionItemSearchResult(BaseModel):
+    """Action item matched by a title search."""
+
+    id: int = Field(..., description="Unique identifier")
+    title: str = Field(..., description="Action item title")
+    assignee: str | None = Field(None, description="Assigned team member name")
+    due_date: str | None = Field(None, description="Due date")
+    overdue: bool = Field(default=False, description="Whether item is overdue")
+    completed_at: int | None = Field(None, description="Completion time (epoch seconds, UTC)")
+    rank: float = Field(..., description="bm25 relevance score; lower is more relevant")
+
+
+class ActionItemSearchResponse(BaseModel):
+    """A page of search results, best matches first."""
+
+    items: list[ActionItemSearchResult] = Field(
+        default_factory=list, description="Matching action items"
+    )
+    next_offset: int | None = Field(
+        None, description="Offset of the next page, or null on the last page"
+    )
+
+
+class ActionItemHistoryEntry(BaseModel):
+    """Completed action item, from either the live table or the archive."""
+
+    id: int = Field(..., description="Unique identifier")
+    title: str = Field(..., description="Action item title")
+    assignee: str | None = Field(None, description="Assigned team member name")
+    due_date: str | None = Field(None, description="Due date")
+    ticket_key: str | None = Field(None, description="Jira ticket key")
+    created_at: int = Field(..., description="Creation time (epoch seconds, UTC)")
+    completed_at: int = Field(..., description="Completion time (epoch seconds, UTC)")
+    archived: bool = Field(default=False, description="Whether the item has been archived")
+
+
+class ActionItemHistoryPage(BaseModel):
+    """A page of completed action items, most recent first."""
+
+    items: list[ActionItemHistoryEntry] = Field(
+        default_factory=list, description="Completed action items"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
+
+
 class ExtractActionItemsRequest(BaseModel):
     """Request schema for extracting action items from meeting notes."""
 
@@ -0,0 +1,133 @@
+"""Admin models."""
+from pydantic import BaseModel, Field
+
+
+class SnapshotRequest(BaseModel):
+    """Request schema for taking a database snapshot."""
+
+    pages_per_step: int | None = Field(
+        None, ge=1, le=100_000, description="Pages copied per step; defaults to settings"
+    )
+    pause_ms: float | None = Field(
+        None, ge=0, le=1000, description="Pause between steps; defaults to settings"
+    )
+
+
+class SnapshotResponse(BaseModel):
+    """Result of a completed database snapshot."""
+
+    path: str = Field(..., description="Snapshot file path on the server")
+    pages: int = Field(..., description="Database pages copied")
+    steps: int = Field(..., description="Backup steps taken")
+    size_bytes: int = Field(..., description="Snapshot file size")
+    duration_ms: float = Field(..., description="Wall time of the snapshot")
+
+
+class HistogramBucket(BaseModel):
+    """Observations at or below a latency bound."""
+
+    le_ms: float | None = Field(..., description="Bucket upper bound; null for the overflow bucket")
+    count: int
+
+
+class LatencySummary(BaseModel):
+    """Latency histogram summary."""
+
+    count: int
+    errors: int = Field(0, description="Executions that raised")
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    p50_ms: float = Field(..., description="Bucket-estimated median")
+    p95_ms: float
+    p99_ms: float
+    histogram: list[HistogramBucket]
+
+
+class QueryLatency(LatencySummary):
+    """Latency of one normalized statement."""
+
+    sql: str = Field(..., description="Statement with literals replaced by ?")
+
+
+class SlowQuery(BaseModel):
+    """One slow-query log entry."""
+
+    sql: str
+    duration_ms: float
+    plan: list[str] = Field(default_factory=list, description="EXPLAIN QUERY PLAN lines")
+    recorded_at: str
+
+
+class SQLiteStats(BaseModel):
+    """SQLite storage internals."""
+
+    page_size: int
+    page_count: int
+    freelist_count: int
+    cache_size_kib: int
+    mmap_size: int
+    journal_mode: str
+    wal_autocheckpoint: int
+    busy_timeout: int
+    database_size_bytes: int
+    wal_size_bytes: int
+    wal_frames: int
+
+
+class DatabaseStatsResponse(BaseModel):
+    """SQL instrumentation and SQLite internals."""
+
+    queries: list[QueryLatency] = Field(..., description="Statements, highest total time first")
+    slow_queries: list[SlowQuery] = Field(..., description="Newest first")
+    waits: dict[str, LatencySummary] = Field(
+        ..., description="Time spent waiting for the pooled writer and reader connections"
+    )
+    locked_errors: int = Field(..., description="Statements that failed as locked or busy")
+    sqlite: SQLiteStats | None = Field(None, description="Null unless the sqlite engine is in use")
+
+
+class MaintenanceRequest(BaseModel):
+    """Request schema for running database maintenance."""
+
+    budget_ms: float | None = Field(
+        None, gt=0, le=60_000, description="Time budget for the run; defaults to settings"
+    )
+
+
+class MaintenanceStep(BaseModel):
+    """What one maintenance step did."""
+
+    name: str = Field(..., description="analyze, optimize or incremental_vacuum")
+    ran: bool
+    interrupted: bool = Field(..., description="Cut short by the time budget")
+    duration_ms: float
+    lock_held_ms: float = Field(..., description="Longest single hold of the writer connection")
+    transactions: int = Field(..., description="Write transactions the step took")
+    detail: str = ""
+
+
+class MaintenanceReport(BaseModel):
+    """Report of a database maintenance run."""
+
+    started_at: str
+    duration_ms: float
+    budget_ms: float
+    auto_vacuum: str = Field(..., description="none, full or incremental")
+    freelist_pages_before: int
+    freelist_pages_after: int
+    steps: list[MaintenanceStep]
+
+
+class CacheStats(BaseModel):
+    """Counters of one in-process read-through cache."""
+
+    name: str
+    hits: int
+    misses: int
+    hit_rate: float = Field(..., description="Hits per lookup, 0 before the first lookup")
+    invalidations: int = Field(..., description="Times a write path dropped the cache")
+    entries: int = Field(..., description="Values currently cached")
+    version: int | None = Field(
+        None, description="Data version last seen; null until the next read after a write"
+    )
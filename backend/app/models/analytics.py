@@ -40,12 +40,26 @@ class PendingActionItem(BaseModel):
     overdue: bool = Field(default=False, description="Whether item is overdue")
 
 
+class PendingActionItemPage(BaseModel):
+    """A page of pending action items."""
+
+    items: list[PendingActionItem] = Field(
+        default_factory=list, description="Pending action items, newest first"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
+
+
 class AnalyticsResponse(BaseModel):
     """Complete analytics response."""
 
     stats: AnalyticsStats = Field(default_factory=AnalyticsStats)
     pending_items: list[PendingActionItem] = Field(
-        default_factory=list, description="List of pending action items"
+        default_factory=list, description="First page of pending action items"
+    )
+    pending_next_cursor: str | None = Field(
+        None, description="Cursor for the next page of pending items"
     )
     leaderboard: list[TeamMemberStats] = Field(
         default_factory=list, description="Team leaderboard sorted by completion"
@@ -0,0 +1,118 @@
+"""Prefix index over the team roster, for assignee autocomplete.
+
+Each kind of key a member can be typed as (full name, later name parts,
+initials, Slack handle) has its own sorted list of (key, member id) pairs.
+A prefix lookup bisects to the first candidate in each list and walks
+forward, so finding the top k costs O(log n + k) per list whatever the size
+of the roster. Members are added and removed one at a time, each an
+insertion or deletion in the sorted lists, so a roster change never
+re-sorts the index.
+"""
+import bisect
+from collections.abc import Iterable
+
+from app.assignee_resolver import normalize_name
+from app.models import TeamMember
+
+# Key kinds, in the order their matches are ranked
+_KINDS = ("name", "name_part", "initials", "slack_handle")
+
+
+def _member_keys(member: TeamMember) -> dict[str, list[str]]:
+    """Normalized keys of each kind for a member."""
+    name = normalize_name(member.name)
+    keys = {
+        "name": [name],
+        # The first name part is already a prefix of the full name
+        "name_part": name.split()[1:],
+        "initials": [normalize_name(member.initials)] if member.initials else [],
+        "slack_handle": [],
+    }
+    # "@john.smith" is a handle; bare ids such as "U123" are not typed by people
+    if member.slack_id and member.slack_id.startswith("@"):
+        keys["slack_handle"].append(normalize_name(member.slack_id))
+    return keys
+
+
+class TeamPrefixIndex:
+    """Team members searchable by the prefix of any of their keys.
+
+    Matches rank by key kind (full name first, then later name parts,
+    initials and Slack handle), then alphabetically by key.
+    """
+
+    def __init__(self, members: Iterable[TeamMember] = ()):
+        """Build the index.
+
+        Args:
+            members: The team roster.
+        """
+        self._members: dict[int, TeamMember] = {}
+        self._keys: dict[int, dict[str, list[str]]] = {}
+        self._entries: dict[str, list[tuple[str, int]]] = {kind: [] for kind in _KINDS}
+        for member in members:
+            self._members[member.id] = member
+            self._keys[member.id] = _member_keys(member)
+            for kind, keys in self._keys[member.id].items():
+                self._entries[kind].extend((key, member.id) for key in keys if key)
+        for entries in self._entries.values():
+            entries.sort()
+
+    def __len__(self) -> int:
+        """Number of members indexed."""
+        return len(self._members)
+
+    def add(self, member: TeamMember) -> None:
+        """Index a new member, or re-index a changed one.
+
+        Args:
+            member: The member as stored.
+        """
+        self.remove(member.id)
+        self._members[member.id] = member
+        self._keys[member.id] = _member_keys(member)
+        for kind, keys in self._keys[member.id].items():
+            for key in keys:
+                if key:
+                    bisect.insort(self._entries[kind], (key, member.id))
+
+    def remove(self, member_id: int) -> None:
+        """Drop a member from the index, if present.
+
+        Args:
+            member_id: The member's ID.
+        """
+        if self._members.pop(member_id, None) is None:
+            return
+        for kind, keys in self._keys.pop(member_id).items():
+            entries = self._entries[kind]
+            for key in keys:
+                position = bisect.bisect_left(entries, (key, member_id))
+                if position < len(entries) and entries[position] == (key, member_id):
+                    del entries[position]
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[TeamMember]:
+        """Members with a key starting with the prefix, best first.
+
+        Args:
+            prefix: What the user has typed so far.
+            limit: Maximum number of members to return.
+
+        Returns:
+            Up to limit distinct members.
+        """
+        prefix = normalize_name(prefix)
+        if not prefix or limit < 1:
+            return []
+        found: dict[int, TeamMember] = {}
+        for kind in _KINDS:
+            entries = self._entries[kind]
+            position = bisect.bisect_left(entries, (prefix,))
+            while position < len(entries) and entries[position][0].startswith(prefix):
+                member_id = entries[position][1]
+                if member_id not in found:
+                    found[member_id] = self._members[member_id]
+                    if len(found) == limit:
+                        return list(found.values())
+                position += 1
+        return list(found.values())
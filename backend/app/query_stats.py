@@ -0,0 +1,296 @@
+"""Per-statement timing for SQLite connections.
+
+Connections opened by app.database use InstrumentedConnection, whose
+cursors time every execute() and executemany() call. Timings are kept in
+latency histograms keyed by normalized SQL: literals become ?, and IN lists
+collapse to one placeholder. Statements slower than the slow_query_ms
+setting also go to a bounded slow-query log, together with their EXPLAIN
+QUERY PLAN captured on the same connection.
+
+The execute() time covers the work SQLite does before the first row is
+ready. That is all of the work for writes and for sorted or aggregated
+reads, but not the cost of fetching a long streamed result.
+"""
+import logging
+import re
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+
+from app.config import settings as app_settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; one overflow bucket follows
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Statements EXPLAIN QUERY PLAN can describe
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """Reduce a statement to its shape, so each query gets one histogram.
+
+    Args:
+        sql: Statement text as executed.
+
+    Returns:
+        The statement on one line with literals replaced by ?.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class LatencyHistogram:
+    """Bucketed latencies for one statement shape."""
+
+    __slots__ = ("buckets", "count", "total_ms", "max_ms", "errors")
+
+    def __init__(self):
+        """Create an empty histogram."""
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.errors = 0
+
+    def record(self, elapsed_ms: float) -> None:
+        """Add one observation."""
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile as the upper bound of the bucket holding it.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.95.
+
+        Returns:
+            Estimated latency in ms, never above the largest observation.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict:
+        """Summary with percentiles and the non-empty buckets."""
+        bounds = (*LATENCY_BUCKETS_MS, None)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile(0.50), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "histogram": [
+                {"le_ms": bound, "count": bucket_count}
+                for bound, bucket_count in zip(bounds, self.buckets) if bucket_count
+            ],
+        }
+
+
+class QueryStats:
+    """Process-wide statement latencies, slow-query log and pool waits."""
+
+    def __init__(self):
+        """Create empty statistics."""
+        self._lock = threading.Lock()
+        self._queries: dict[str, LatencyHistogram] = {}
+        self._waits: dict[str, LatencyHistogram] = {}
+        self._slow: deque[dict] = deque(maxlen=max(app_settings.slow_query_log_size, 1))
+        self.locked_errors = 0
+
+    def observe(self, conn: sqlite3.Connection, sql: str, parameters: Any,
+                elapsed: float, error: BaseException | None = None) -> None:
+        """Record one executed statement, logging it if it was slow.
+
+        Args:
+            conn: Connection the statement ran on, used to capture the plan.
+            sql: Statement text.
+            parameters: Bound parameters, reused for EXPLAIN QUERY PLAN.
+            elapsed: Execution time in seconds.
+            error: Exception the statement raised, if any.
+        """
+        elapsed_ms = elapsed * 1000
+        key = normalize_sql(sql)
+        with self._lock:
+            histogram = self._queries.get(key)
+            if histogram is None:
+                histogram = self._queries[key] = LatencyHistogram()
+            histogram.record(elapsed_ms)
+            if error is not None:
+                histogram.errors += 1
+                if "locked" in str(error) or "busy" in str(error):
+                    self.locked_errors += 1
+
+        if elapsed_ms >= app_settings.slow_query_ms:
+            plan = explain_query_plan(conn, sql, parameters)
+            entry = {
+                "sql": key,
+                "duration_ms": round(elapsed_ms, 3),
+                "plan": plan,
+                "recorded_at": datetime.now(UTC).isoformat(),
+            }
+            with self._lock:
+                self._slow.append(entry)
+            logger.warning(
+                "Slow query (%.1f ms): %s%s", elapsed_ms, key,
+                "".join(f"\n  {line}" for line in plan),
+            )
+
+    def record_wait(self, kind: str, elapsed: float) -> None:
+        """Record time spent waiting for a pooled connection.
+
+        Args:
+            kind: Which connection was awaited ("writer" or "reader").
+            elapsed: Wait time in seconds.
+        """
+        if not app_settings.sql_stats_enabled:
+            return
+        with self._lock:
+            histogram = self._waits.get(kind)
+            if histogram is None:
+                histogram = self._waits[kind] = LatencyHistogram()
+            histogram.record(elapsed * 1000)
+
+    def snapshot(self, limit: int = 50) -> dict:
+        """Copy of the statistics, costliest statements first.
+
+        Args:
+            limit: Maximum number of statement shapes to include.
+
+        Returns:
+            Dict with queries, slow_queries, waits and locked_errors.
+        """
+        with self._lock:
+            queries = sorted(
+                ({"sql": key, **histogram.as_dict()} for key, histogram in self._queries.items()),
+                key=lambda entry: entry["total_ms"],
+                reverse=True,
+            )
+            return {
+                "queries": queries[:limit],
+                "slow_queries": list(reversed(self._slow)),
+                "waits": {kind: histogram.as_dict() for kind, histogram in self._waits.items()},
+                "locked_errors": self.locked_errors,
+            }
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._queries.clear()
+            self._waits.clear()
+            self._slow = deque(maxlen=max(app_settings.slow_query_log_size, 1))
+            self.locked_errors = 0
+
+
+query_stats = QueryStats()
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str, parameters: Any) -> list[str]:
+    """Capture the query plan of a statement as indented lines.
+
+    Args:
+        conn: Connection to plan on (same schema and statistics as the query).
+        sql: Statement text.
+        parameters: Bound parameters; for executemany, the first set is used.
+
+    Returns:
+        Plan lines, or an empty list if the statement cannot be explained.
+    """
+    if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+        return []
+    try:
+        # Bypass the instrumented execute so planning is not itself recorded
+        rows = sqlite3.Connection.execute(
+            conn, f"EXPLAIN QUERY PLAN {sql}", () if parameters is None else parameters
+        ).fetchall()
+    except (sqlite3.Error, ValueError):
+        return []
+    depth: dict[int, int] = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that reports the duration of every statement to query_stats."""
+
+    def execute(self, sql: str, parameters: Any = (), /) -> "InstrumentedCursor":
+        """Execute a statement, recording its latency."""
+        started = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        except Exception as exc:
+            query_stats.observe(self.connection, sql, parameters,
+                                time.perf_counter() - started, exc)
+            raise
+        query_stats.observe(self.connection, sql, parameters, time.perf_counter() - started)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> "InstrumentedCursor":
+        """Execute a statement for each parameter set, recording the total latency."""
+        started = time.perf_counter()
+        if isinstance(seq_of_parameters, (list, tuple)):
+            first = seq_of_parameters[0] if seq_of_parameters else ()
+        else:
+            first = None
+        try:
+            super().executemany(sql, seq_of_parameters)
+        except Exception as exc:
+            query_stats.observe(self.connection, sql, first,
+                                time.perf_counter() - started, exc)
+            raise
+        query_stats.observe(self.connection, sql, first, time.perf_counter() - started)
+        return self
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors, shortcuts and commits are timed."""
+
+    def cursor(self, factory: type = InstrumentedCursor) -> sqlite3.Cursor:
+        """Open a cursor, instrumented unless another factory is given."""
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> InstrumentedCursor:
+        """Execute a statement on a new instrumented cursor."""
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> InstrumentedCursor:
+        """Execute a statement per parameter set on a new instrumented cursor."""
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self) -> None:
+        """Commit, recording the commit time as its own COMMIT entry."""
+        if not self.in_transaction:
+            super().commit()
+            return
+        started = time.perf_counter()
+        super().commit()
+        query_stats.observe(self, "COMMIT", (), time.perf_counter() - started)
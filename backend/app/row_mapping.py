@@ -0,0 +1,95 @@
+"""Map database row tuples straight onto response models.
+
+Rows read from our own tables are already trusted and typed, so the hot read
+paths skip the sqlite3.Row -> dict -> model validation round trip. Each mapper
+knows its column order up front and builds model instances directly from the
+raw tuples returned by the cursor.
+"""
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from app.models import (
+    TeamMember,
+    PendingActionItem,
+    ActionItemSearchResult,
+    ActionItemHistoryEntry,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Column order for the mapped queries; SELECT lists are built from these
+TEAM_MEMBER_COLUMNS = ("id", "name", "initials", "slack_id", "jira_account_id", "email")
+PENDING_ITEM_COLUMNS = ("id", "title", "assignee", "due_date", "overdue")
+SEARCH_RESULT_COLUMNS = PENDING_ITEM_COLUMNS + ("completed_at", "rank")
+HISTORY_ITEM_COLUMNS = (
+    "id", "title", "assignee", "due_date", "ticket_key", "created_at", "completed_at",
+    "archived",
+)
+
+
+class RowMapper(Generic[M]):
+    """Builds instances of a pydantic model from row tuples without validation.
+
+    Instances come from ``model_construct``, so the rows must already match the
+    field types; converters cover the few columns SQLite stores differently.
+
+    Rows may carry extra trailing columns (e.g. pagination keys); only the
+    leading ``columns`` are mapped onto the model.
+    """
+
+    def __init__(
+        self,
+        model: type[M],
+        columns: Sequence[str],
+        converters: dict[str, Callable[[Any], Any]] | None = None,
+    ):
+        """Precompute the column order and per-column converters.
+
+        Args:
+            model: Pydantic model to build.
+            columns: Column names, in SELECT order; must cover every model field.
+            converters: Optional per-column conversions (e.g. SQLite 0/1 to bool).
+
+        Raises:
+            ValueError: If the columns do not match the model fields.
+        """
+        if set(columns) != set(model.model_fields):
+            raise ValueError(
+                f"Columns {tuple(columns)} do not match {model.__name__} fields"
+            )
+        self.model = model
+        self.columns = tuple(columns)
+        self.select_list = ", ".join(self.columns)
+        converters = converters or {}
+        self._converters = tuple(
+            (index, converters[name])
+            for index, name in enumerate(self.columns)
+            if name in converters
+        )
+
+    def from_row(self, row: Sequence[Any]) -> M:
+        """Build one model instance from a row tuple."""
+        values = dict(zip(self.columns, row))
+        for index, convert in self._converters:
+            name = self.columns[index]
+            values[name] = convert(values[name])
+        return self.model.model_construct(**values)
+
+    def map_rows(self, rows: Iterable[Sequence[Any]]) -> list[M]:
+        """Build model instances for every row."""
+        from_row = self.from_row
+        return [from_row(row) for row in rows]
+
+
+TEAM_MEMBER_MAPPER = RowMapper(TeamMember, TEAM_MEMBER_COLUMNS)
+PENDING_ITEM_MAPPER = RowMapper(
+    PendingActionItem, PENDING_ITEM_COLUMNS, converters={"overdue": bool}
+)
+SEARCH_RESULT_MAPPER = RowMapper(
+    ActionItemSearchResult, SEARCH_RESULT_COLUMNS, converters={"overdue": bool}
+)
+HISTORY_ITEM_MAPPER = RowMapper(
+    ActionItemHistoryEntry, HISTORY_ITEM_COLUMNS, converters={"archived": bool}
+)
@@ -22,6 +22,8 @@ from .settings_service import (
     add_team_member,
     update_team_member,
     delete_team_member,
+    get_assignee_resolver,
+    suggest_team_members,
     get_integration_status,
 )
 
@@ -42,5 +44,7 @@ __all__ = [
     "add_team_member",
     "update_team_member",
     "delete_team_member",
+    "get_assignee_resolver",
+    "suggest_team_members",
     "get_integration_status",
 ]
@@ -7,6 +7,7 @@ from typing import Any
 from anthropic import AsyncAnthropic
 
 from app.config import settings
+from app.due_dates import parse_due_date
 from app.models import ActionItem
 
 
@@ -87,12 +88,14 @@ class ExtractionService:
         action_items = []
         for i, item in enumerate(parsed_items, start=1):
             item_id = id_generator() if id_generator else i
+            due_date = item.get("due_date")
             action_items.append(
                 ActionItem(
                     id=item_id,
                     title=item.get("title", ""),
                     assignee=item.get("assignee"),
-                    due_date=item.get("due_date"),
+                    due_date=due_date,
+                    due_on=parse_due_date(due_date),
                     selected=True,
                     overdue=False,
                 )
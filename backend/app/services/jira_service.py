@@ -1,17 +1,37 @@
 """Service for creating Jira tickets."""
 import base64
+import logging
 from typing import Any
 
 import httpx
 
+from app.assignee_resolver import AssigneeResolver
 from app.config import settings
 from app.models import (
     ActionItem,
     JiraConfig,
     CreatedTicket,
+    TeamMember,
     TicketCreateResponse,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _rejects_assignee(error: httpx.HTTPStatusError) -> bool:
+    """Whether Jira refused an issue because of its assignee field.
+
+    Jira answers 400 with the offending fields under "errors", e.g. for an
+    account ID that does not exist or cannot be assigned in the project.
+    """
+    if error.response.status_code != 400:
+        return False
+    try:
+        errors = error.response.json().get("errors") or {}
+    except ValueError:
+        return False
+    return "assignee" in errors
+
 
 class JiraService:
     """Service for interacting with Jira API."""
@@ -58,9 +78,10 @@ class JiraService:
         return response.json()
 
     def _build_issue_payload(
-        self, action_item: ActionItem, config: JiraConfig
+        self, action_item: ActionItem, config: JiraConfig,
+        assignee: TeamMember | None = None,
     ) -> dict[str, Any]:
-        """Build the Jira issue payload."""
+        """Build the Jira issue payload, assigning it if the assignee has a Jira account."""
         payload = {
             "fields": {
                 "project": {"key": config.project},
@@ -69,6 +90,8 @@ class JiraService:
                 "labels": [config.label],
             }
         }
+        if assignee and assignee.jira_account_id:
+            payload["fields"]["assignee"] = {"accountId": assignee.jira_account_id}
 
         # Add description with assignee and due date info
         description_parts = []
@@ -94,22 +117,35 @@ class JiraService:
         return payload
 
     async def create_ticket(
-        self, action_item: ActionItem, config: JiraConfig
+        self, action_item: ActionItem, config: JiraConfig,
+        assignee: TeamMember | None = None,
     ) -> CreatedTicket:
         """Create a single Jira ticket.
 
         Args:
             action_item: The action item to create a ticket for.
             config: Jira configuration for the ticket.
+            assignee: Team member the item's assignee resolved to, if any.
 
         Returns:
             CreatedTicket with the new ticket details.
 
         Raises:
-            httpx.HTTPError: If the API request fails.
+            httpx.HTTPError: If the API request fails. An assignee Jira
+                rejects is not an error: the ticket is created unassigned.
         """
-        payload = self._build_issue_payload(action_item, config)
-        response = await self._make_request("POST", "/rest/api/3/issue", json_data=payload)
+        payload = self._build_issue_payload(action_item, config, assignee)
+        try:
+            response = await self._make_request("POST", "/rest/api/3/issue", json_data=payload)
+        except httpx.HTTPStatusError as exc:
+            if "assignee" not in payload["fields"] or not _rejects_assignee(exc):
+                raise
+            logger.warning(
+                "Jira rejected assignee %s (account %s) for %r; creating it unassigned",
+                assignee.name, assignee.jira_account_id, action_item.title,
+            )
+            payload = self._build_issue_payload(action_item, config)
+            response = await self._make_request("POST", "/rest/api/3/issue", json_data=payload)
 
         ticket_key = response["key"]
         return CreatedTicket(
@@ -119,13 +155,16 @@ class JiraService:
         )
 
     async def create_tickets(
-        self, action_items: list[ActionItem], config: JiraConfig
+        self, action_items: list[ActionItem], config: JiraConfig,
+        resolver: AssigneeResolver | None = None,
     ) -> TicketCreateResponse:
         """Create multiple Jira tickets.
 
         Args:
             action_items: List of action items to create tickets for.
             config: Jira configuration for the tickets.
+            resolver: Resolver for the team roster; resolved members with
+                a Jira account are set as the ticket assignee.
 
         Returns:
             TicketCreateResponse with created tickets and any failures.
@@ -138,7 +177,8 @@ class JiraService:
 
         for item in action_items:
             try:
-                ticket = await self.create_ticket(item, config)
+                assignee = resolver.resolve(item.assignee) if resolver else None
+                ticket = await self.create_ticket(item, config, assignee)
                 created_tickets.append(ticket)
             except Exception:
                 failed_ids.append(item.id)
@@ -153,19 +193,21 @@ class JiraService:
 
 
 async def create_jira_tickets(
-    action_items: list[ActionItem], config: JiraConfig
+    action_items: list[ActionItem], config: JiraConfig,
+    resolver: AssigneeResolver | None = None,
 ) -> TicketCreateResponse:
     """Helper function to create Jira tickets.
 
     Args:
         action_items: List of action items.
         config: Jira configuration.
+        resolver: Optional roster resolver for assigning tickets.
 
     Returns:
         TicketCreateResponse with results.
     """
     service = JiraService()
     try:
-        return await service.create_tickets(action_items, config)
+        return await service.create_tickets(action_items, config, resolver)
     finally:
         await service.close()
@@ -1,4 +1,9 @@
 """Service for managing settings and team members using SQLite."""
+from typing import Any
+
+from app.assignee_resolver import AssigneeResolver
+from app.cache import ReadThroughCache
+from app.prefix_index import TeamPrefixIndex
 from app.config import settings as app_settings
 from app.models import (
     TeamMember,
@@ -10,38 +15,106 @@ from app.models import (
     DefaultSettings,
     IntegrationStatus,
 )
-from app.database import (
-    get_all_team_members,
+from app.storage import get_engine
+from app.row_mapping import TEAM_MEMBER_MAPPER
+from app.async_database import (
+    get_team_member_rows,
     get_team_member_by_id,
     create_team_member as db_create_team_member,
     update_team_member as db_update_team_member,
     delete_team_member as db_delete_team_member,
     get_user_settings,
     save_user_settings,
-    init_db,
+    get_data_versions,
+    set_assignee_resolver,
 )
 
-# Initialize database on module load
-init_db()
+# Initialize storage on module load
+get_engine().init()
 
 
 class SettingsService:
-    """Service for managing user settings and team members using SQLite."""
+    """Service for managing user settings and team members using SQLite.
+
+    Database access goes through app.async_database, so callers await these
+    methods without blocking the event loop. Reads take an optional read
+    session (see app.api.dependencies.get_read_session), so they can join
+    the snapshot of the request they serve.
+
+    Settings and the team roster change rarely, so reads outside a session
+    are served from read-through caches that the write paths invalidate.
+    Reads in a session bypass the caches and see the session's snapshot.
+    Before serving from a cache, a read compares the tables' write counters
+    (see app.database.get_data_versions), so writes made by other worker
+    processes drop the cache too.
+    """
+
+    def __init__(self):
+        """Create the service with empty caches."""
+        self._settings_cache = ReadThroughCache("settings")
+        self._roster_cache = ReadThroughCache("team_members")
+        # Autocomplete index and the team_members version it reflects
+        self._suggest_index: TeamPrefixIndex | None = None
+        self._suggest_version: int | None = None
+        # Assignee resolver and the team_members version it was built from
+        self._resolver: AssigneeResolver | None = None
+        self._resolver_version: int | None = None
+
+    async def _load_settings(self, session: Any = None) -> UserSettings:
+        """Read settings from the database."""
+        data = await get_user_settings(session)
+        return UserSettings(
+            reminders=ReminderSettings(**data.get("reminders", {})),
+            notifications=NotificationSettings(**data.get("notifications", {})),
+            defaults=DefaultSettings(**data.get("defaults", {})),
+        )
 
-    def get_settings(self) -> UserSettings:
+    async def _load_roster(self) -> dict[int, TeamMember]:
+        """Read the team roster from the database, keyed by ID in name order."""
+        members = TEAM_MEMBER_MAPPER.map_rows(await get_team_member_rows())
+        return {member.id: member for member in members}
+
+    async def _sync_caches(self) -> None:
+        """Drop caches whose tables another process has written to."""
+        versions = await get_data_versions()
+        self._settings_cache.sync(versions["settings"])
+        self._roster_cache.sync(versions["team_members"])
+
+    async def _cached_settings(self) -> UserSettings:
+        """Settings from the cache, after checking it is current."""
+        await self._sync_caches()
+        return await self._settings_cache.get(None, self._load_settings)
+
+    async def _cached_roster(self) -> dict[int, TeamMember]:
+        """Roster from the cache, after checking it is current."""
+        await self._sync_caches()
+        return await self._roster_cache.get(None, self._load_roster)
+
+    def clear_cache(self) -> None:
+        """Drop cached settings and roster, and zero their counters."""
+        self._settings_cache.reset()
+        self._roster_cache.reset()
+        self._suggest_index = None
+        self._resolver = None
+
+    def cache_stats(self) -> list[dict]:
+        """Hit and miss counters of the settings and roster caches."""
+        return [self._settings_cache.stats(), self._roster_cache.stats()]
+
+    async def get_settings(self, session: Any = None) -> UserSettings:
         """Get the current user settings from database.
 
+        Args:
+            session: Read session to read in, if any.
+
         Returns:
             UserSettings object with current settings.
         """
-        data = get_user_settings()
-        return UserSettings(
-            reminders=ReminderSettings(**data.get("reminders", {})),
-            notifications=NotificationSettings(**data.get("notifications", {})),
-            defaults=DefaultSettings(**data.get("defaults", {})),
-        )
+        if session is not None:
+            return await self._load_settings(session)
+        return await self._cached_settings()
 
-    def update_settings(self, new_settings: UserSettings) -> UserSettings:
+    async def update_settings(self, new_settings: UserSettings) -> UserSettings:
         """Update user settings in database.
 
         Args:
@@ -55,31 +128,93 @@ class SettingsService:
             "notifications": new_settings.notifications.model_dump(),
             "defaults": new_settings.defaults.model_dump(),
         }
-        save_user_settings(data)
+        try:
+            await save_user_settings(data)
+        finally:
+            self._settings_cache.invalidate()
         return new_settings
 
-    def get_team_members(self) -> list[TeamMember]:
+    async def get_team_members(self, session: Any = None) -> list[TeamMember]:
         """Get all team members from database.
 
+        Args:
+            session: Read session to read in, if any.
+
         Returns:
             List of TeamMember objects.
         """
-        rows = get_all_team_members()
-        return [TeamMember(**row) for row in rows]
+        if session is not None:
+            return TEAM_MEMBER_MAPPER.map_rows(await get_team_member_rows(session))
+        return list((await self._cached_roster()).values())
 
-    def get_team_member(self, member_id: int) -> TeamMember | None:
+    async def get_team_member(self, member_id: int, session: Any = None) -> TeamMember | None:
         """Get a team member by ID.
 
         Args:
             member_id: The member's ID.
+            session: Read session to read in, if any.
 
         Returns:
             TeamMember if found, None otherwise.
         """
-        row = get_team_member_by_id(member_id)
-        return TeamMember(**row) if row else None
+        if session is not None:
+            row = await get_team_member_by_id(member_id, session)
+            return TeamMember(**row) if row else None
+        return (await self._cached_roster()).get(member_id)
+
+    async def get_assignee_resolver(self) -> AssigneeResolver:
+        """Get the assignee resolver for the current roster.
+
+        The resolver is kept with the team_members version it was built
+        from, so finding it is one comparison, and any roster write, by
+        this or another worker, rebuilds it on next use.
+
+        Returns:
+            Resolver shared with every caller until the roster changes.
+        """
+        roster = await self._cached_roster()
+        version = self._roster_cache.version
+        if self._resolver is None or version is None or version != self._resolver_version:
+            self._resolver = AssigneeResolver(roster.values())
+            self._resolver_version = version
+        return self._resolver
 
-    def add_team_member(self, data: TeamMemberCreate) -> TeamMember:
+    async def suggest_team_members(self, prefix: str, limit: int = 10) -> list[TeamMember]:
+        """Get team members whose name, initials or Slack handle start with a prefix.
+
+        The prefix index follows this process's roster writes one member at
+        a time. It is rebuilt from the roster only when the team_members
+        version shows a write it has not seen, such as one by another worker.
+
+        Args:
+            prefix: What the user has typed so far.
+            limit: Maximum number of members to return.
+
+        Returns:
+            Matching members, full-name matches first.
+        """
+        roster = await self._cached_roster()
+        version = self._roster_cache.version
+        if self._suggest_index is None or version is None or version != self._suggest_version:
+            self._suggest_index = TeamPrefixIndex(roster.values())
+            self._suggest_version = version
+        return self._suggest_index.suggest(prefix, limit)
+
+    def _index_write(self, member: TeamMember | None = None, removed_id: int | None = None) -> None:
+        """Apply one of this process's roster writes to the prefix index.
+
+        Each write of a team_members row raises its version by exactly one,
+        so the index stays current unless another write lands in between.
+        """
+        if self._suggest_index is None or self._suggest_version is None:
+            return
+        if member is not None:
+            self._suggest_index.add(member)
+        if removed_id is not None:
+            self._suggest_index.remove(removed_id)
+        self._suggest_version += 1
+
+    async def add_team_member(self, data: TeamMemberCreate) -> TeamMember:
         """Add a new team member to database.
 
         Args:
@@ -88,16 +223,21 @@ class SettingsService:
         Returns:
             Created TeamMember object.
         """
-        row = db_create_team_member(
-            name=data.name,
-            initials=data.initials,
-            slack_id=data.slack_id,
-            jira_account_id=data.jira_account_id,
-            email=data.email,
-        )
-        return TeamMember(**row)
-
-    def update_team_member(
+        try:
+            row = await db_create_team_member(
+                name=data.name,
+                initials=data.initials,
+                slack_id=data.slack_id,
+                jira_account_id=data.jira_account_id,
+                email=data.email,
+            )
+        finally:
+            self._roster_cache.invalidate()
+        member = TeamMember(**row)
+        self._index_write(member)
+        return member
+
+    async def update_team_member(
         self, member_id: int, data: TeamMemberUpdate
     ) -> TeamMember | None:
         """Update a team member in database.
@@ -110,10 +250,18 @@ class SettingsService:
             Updated TeamMember if found, None otherwise.
         """
         update_fields = data.model_dump(exclude_unset=True)
-        row = db_update_team_member(member_id, **update_fields)
-        return TeamMember(**row) if row else None
-
-    def delete_team_member(self, member_id: int) -> bool:
+        try:
+            row = await db_update_team_member(member_id, **update_fields)
+        finally:
+            self._roster_cache.invalidate()
+        if row is None:
+            return None
+        member = TeamMember(**row)
+        if any(value is not None for value in update_fields.values()):
+            self._index_write(member)
+        return member
+
+    async def delete_team_member(self, member_id: int) -> bool:
         """Delete a team member from database.
 
         Args:
@@ -122,7 +270,13 @@ class SettingsService:
         Returns:
             True if deleted, False if not found.
         """
-        return db_delete_team_member(member_id)
+        try:
+            deleted = await db_delete_team_member(member_id)
+        finally:
+            self._roster_cache.invalidate()
+        if deleted:
+            self._index_write(removed_id=member_id)
+        return deleted
 
     def get_integration_status(self) -> IntegrationStatus:
         """Get the status of external integrations.
@@ -149,40 +303,63 @@ class SettingsService:
 # Global service instance
 _settings_service = SettingsService()
 
+# Action item writes store the names this resolver canonicalizes to
+set_assignee_resolver(_settings_service.get_assignee_resolver)
 
-def get_settings() -> UserSettings:
+
+async def get_settings(session: Any = None) -> UserSettings:
     """Get the current user settings."""
-    return _settings_service.get_settings()
+    return await _settings_service.get_settings(session)
 
 
-def update_settings(new_settings: UserSettings) -> UserSettings:
+async def update_settings(new_settings: UserSettings) -> UserSettings:
     """Update user settings."""
-    return _settings_service.update_settings(new_settings)
+    return await _settings_service.update_settings(new_settings)
 
 
-def get_team_members() -> list[TeamMember]:
+async def get_team_members(session: Any = None) -> list[TeamMember]:
     """Get all team members."""
-    return _settings_service.get_team_members()
+    return await _settings_service.get_team_members(session)
 
 
-def get_team_member(member_id: int) -> TeamMember | None:
+async def get_team_member(member_id: int, session: Any = None) -> TeamMember | None:
     """Get a team member by ID."""
-    return _settings_service.get_team_member(member_id)
+    return await _settings_service.get_team_member(member_id, session)
+
+
+async def get_assignee_resolver() -> AssigneeResolver:
+    """Get the assignee resolver for the current roster."""
+    return await _settings_service.get_assignee_resolver()
 
 
-def add_team_member(data: TeamMemberCreate) -> TeamMember:
+async def add_team_member(data: TeamMemberCreate) -> TeamMember:
     """Add a new team member."""
-    return _settings_service.add_team_member(data)
+    return await _settings_service.add_team_member(data)
 
 
-def update_team_member(member_id: int, data: TeamMemberUpdate) -> TeamMember | None:
+async def update_team_member(member_id: int, data: TeamMemberUpdate) -> TeamMember | None:
     """Update a team member."""
-    return _settings_service.update_team_member(member_id, data)
+    return await _settings_service.update_team_member(member_id, data)
 
 
-def delete_team_member(member_id: int) -> bool:
+async def delete_team_member(member_id: int) -> bool:
     """Delete a team member."""
-    return _settings_service.delete_team_member(member_id)
+    return await _settings_service.delete_team_member(member_id)
+
+
+async def suggest_team_members(prefix: str, limit: int = 10) -> list[TeamMember]:
+    """Get team members matching a typed prefix."""
+    return await _settings_service.suggest_team_members(prefix, limit)
+
+
+def clear_cache() -> None:
+    """Drop cached settings and roster."""
+    _settings_service.clear_cache()
+
+
+def get_cache_stats() -> list[dict]:
+    """Get hit and miss counters of the settings and roster caches."""
+    return _settings_service.cache_stats()
 
 
 def get_integration_status() -> IntegrationStatus:
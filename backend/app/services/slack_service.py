@@ -3,9 +3,9 @@ from typing import Any
 
 import httpx
 
+from app.assignee_resolver import AssigneeResolver
 from app.config import settings
 from app.models import (
-    TeamMember,
     NotificationResponse,
     BulkNotificationResponse,
 )
@@ -47,15 +47,6 @@ class SlackService:
         response.raise_for_status()
         return response.json()
 
-    def _find_team_member(
-        self, name: str, team_members: list[TeamMember]
-    ) -> TeamMember | None:
-        """Find a team member by name."""
-        for member in team_members:
-            if member.name.lower() == name.lower():
-                return member
-        return None
-
     async def send_message(
         self, channel: str, text: str, blocks: list[dict] | None = None
     ) -> NotificationResponse:
@@ -104,7 +95,7 @@ class SlackService:
         self,
         assignee: str,
         message: str,
-        team_members: list[TeamMember],
+        resolver: AssigneeResolver,
         ticket_key: str | None = None,
     ) -> NotificationResponse:
         """Send a notification to a specific team member.
@@ -112,13 +103,14 @@ class SlackService:
         Args:
             assignee: Name of the team member to notify.
             message: Notification message.
-            team_members: List of team members to look up Slack ID.
+            resolver: Resolver for the team roster; full names, first or
+                last names, initials and near-miss spellings all resolve.
             ticket_key: Optional associated Jira ticket key.
 
         Returns:
             NotificationResponse indicating success/failure.
         """
-        member = self._find_team_member(assignee, team_members)
+        member = resolver.resolve(assignee)
 
         if not member:
             return NotificationResponse(
@@ -154,7 +146,7 @@ class SlackService:
         assignee: str,
         ticket_key: str,
         ticket_url: str,
-        team_members: list[TeamMember],
+        resolver: AssigneeResolver,
     ) -> NotificationResponse:
         """Send a ticket creation notification.
 
@@ -162,7 +154,7 @@ class SlackService:
             assignee: Name of the assignee.
             ticket_key: Jira ticket key.
             ticket_url: URL to the ticket.
-            team_members: List of team members.
+            resolver: Resolver for the team roster.
 
         Returns:
             NotificationResponse indicating success/failure.
@@ -175,7 +167,7 @@ class SlackService:
         return await self.send_notification(
             assignee=assignee,
             message=message,
-            team_members=team_members,
+            resolver=resolver,
             ticket_key=ticket_key,
         )
 
@@ -183,14 +175,14 @@ class SlackService:
         self,
         assignees: list[str],
         message: str,
-        team_members: list[TeamMember],
+        resolver: AssigneeResolver,
     ) -> BulkNotificationResponse:
         """Send notifications to multiple team members.
 
         Args:
             assignees: List of team member names.
             message: Notification message.
-            team_members: List of team members for lookup.
+            resolver: Resolver for the team roster.
 
         Returns:
             BulkNotificationResponse with success/failure counts.
@@ -210,7 +202,7 @@ class SlackService:
             result = await self.send_notification(
                 assignee=assignee,
                 message=message,
-                team_members=team_members,
+                resolver=resolver,
             )
 
             if result.success:
@@ -235,7 +227,7 @@ class SlackService:
 async def send_slack_notification(
     assignee: str,
     message: str,
-    team_members: list[TeamMember],
+    resolver: AssigneeResolver,
     ticket_key: str | None = None,
 ) -> NotificationResponse:
     """Helper function to send a Slack notification.
@@ -243,7 +235,7 @@ async def send_slack_notification(
     Args:
         assignee: Name of the team member.
         message: Notification message.
-        team_members: List of team members.
+        resolver: Resolver for the team roster.
         ticket_key: Optional ticket key.
 
     Returns:
@@ -254,7 +246,7 @@ async def send_slack_notification(
         return await service.send_notification(
             assignee=assignee,
             message=message,
-            team_members=team_members,
+            resolver=resolver,
             ticket_key=ticket_key,
         )
     finally:
@@ -264,14 +256,14 @@ async def send_slack_notification(
 async def send_reminders(
     assignees: list[str],
     message: str,
-    team_members: list[TeamMember],
+    resolver: AssigneeResolver,
 ) -> BulkNotificationResponse:
     """Helper function to send reminders to multiple users.
 
     Args:
         assignees: List of team member names.
         message: Reminder message.
-        team_members: List of team members.
+        resolver: Resolver for the team roster.
 
     Returns:
         BulkNotificationResponse with results.
@@ -281,7 +273,7 @@ async def send_reminders(
         return await service.send_bulk_notifications(
             assignees=assignees,
             message=message,
-            team_members=team_members,
+            resolver=resolver,
         )
     finally:
         await service.close()
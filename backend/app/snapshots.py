@@ -0,0 +1,147 @@
+"""Online snapshots of the SQLite database through the backup API.
+
+A snapshot copies the live database in small page steps, pausing between
+steps. The source connection holds one read transaction for the whole copy,
+so the snapshot is consistent as of its start. In WAL mode that read
+transaction does not block writers, and the backup does not restart when
+they commit. API writes carry on while the copy runs.
+
+Usage:
+    uv run python -m app.snapshots [destination] [--pages N] [--pause-ms MS]
+"""
+import argparse
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app import database
+from app.config import settings as app_settings
+
+logger = logging.getLogger(__name__)
+
+# Only one snapshot runs at a time
+_snapshot_lock = threading.Lock()
+
+
+class SnapshotInProgressError(RuntimeError):
+    """Raised when a snapshot is requested while another one is running."""
+
+
+def default_snapshot_path() -> Path:
+    """Timestamped snapshot path in the configured snapshot directory."""
+    directory = (
+        Path(app_settings.snapshot_dir) if app_settings.snapshot_dir
+        else database.DB_PATH.parent / "snapshots"
+    )
+    return directory / f"sanas-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.db"
+
+
+def create_snapshot(
+    destination: Path | None = None,
+    pages_per_step: int | None = None,
+    pause_ms: float | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> dict:
+    """Copy the live database to a snapshot file without stopping writers.
+
+    The copy is written next to the destination and renamed into place once
+    complete, so a snapshot file is never seen half-written.
+
+    Args:
+        destination: Snapshot file; defaults to default_snapshot_path().
+        pages_per_step: Pages copied per step; defaults to the
+            snapshot_pages_per_step setting.
+        pause_ms: Pause between steps; defaults to the snapshot_pause_ms setting.
+        progress: Called after each step with (pages copied, total pages).
+
+    Returns:
+        Dict with path, pages, steps, size_bytes and duration_ms.
+
+    Raises:
+        SnapshotInProgressError: If another snapshot is already running.
+    """
+    if not _snapshot_lock.acquire(blocking=False):
+        raise SnapshotInProgressError("A snapshot is already in progress")
+    try:
+        return _copy(
+            destination or default_snapshot_path(),
+            pages_per_step or app_settings.snapshot_pages_per_step,
+            app_settings.snapshot_pause_ms if pause_ms is None else pause_ms,
+            progress,
+        )
+    finally:
+        _snapshot_lock.release()
+
+
+def _copy(destination: Path, pages_per_step: int, pause_ms: float,
+          progress: Callable[[int, int], None] | None) -> dict:
+    """Run the stepped backup into destination."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    partial = destination.with_name(destination.name + ".partial")
+    partial.unlink(missing_ok=True)
+
+    started = time.perf_counter()
+    steps = 0
+    total_pages = 0
+
+    def on_step(status: int, remaining: int, total: int) -> None:
+        nonlocal steps, total_pages
+        steps += 1
+        total_pages = total
+        if progress is not None:
+            progress(total - remaining, total)
+        # Connection.backup only sleeps after a busy or locked step, so the
+        # pause between successful steps is taken here
+        if remaining and pause_ms > 0:
+            time.sleep(pause_ms / 1000)
+
+    source = database.get_connection()
+    target = sqlite3.connect(str(partial))
+    try:
+        # Pin the read snapshot so concurrent commits cannot restart the copy
+        source.execute("BEGIN")
+        source.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone()
+        source.backup(
+            target, pages=max(pages_per_step, 1), progress=on_step, sleep=pause_ms / 1000
+        )
+    finally:
+        target.close()
+        source.rollback()
+        source.close()
+    partial.replace(destination)
+
+    result = {
+        "path": str(destination),
+        "pages": total_pages,
+        "steps": steps,
+        "size_bytes": destination.stat().st_size,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info("Snapshot written: %s", result)
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Take a snapshot from the command line, printing progress."""
+    parser = argparse.ArgumentParser(description="Snapshot the Sanas database online.")
+    parser.add_argument("destination", nargs="?", type=Path, help="Snapshot file path")
+    parser.add_argument("--pages", type=int, help="Pages copied per step")
+    parser.add_argument("--pause-ms", type=float, help="Pause between steps in milliseconds")
+    args = parser.parse_args(argv)
+
+    def report(copied: int, total: int) -> None:
+        print(f"\r  {copied}/{total} pages ({copied / max(total, 1):.0%})", end="", flush=True)
+
+    result = create_snapshot(args.destination, args.pages, args.pause_ms, report)
+    print(
+        f"\nSnapshot {result['path']}: {result['pages']} pages, "
+        f"{result['size_bytes']} bytes in {result['steps']} steps, {result['duration_ms']} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
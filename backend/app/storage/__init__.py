@@ -0,0 +1,50 @@
+# Storage engines module
+import threading
+
+from app.config import settings as app_settings
+
+from .base import StorageEngine
+from .sqlite import SQLiteEngine
+from .memory import MemoryEngine
+
+# Engines selectable through the storage_engine setting
+ENGINES: dict[str, type] = {
+    "sqlite": SQLiteEngine,
+    "memory": MemoryEngine,
+}
+
+_engine: StorageEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> StorageEngine:
+    """Get the configured storage engine, creating it on first use.
+
+    Raises:
+        ValueError: If the storage_engine setting names no known engine.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None or _engine.name != app_settings.storage_engine:
+            engine_class = ENGINES.get(app_settings.storage_engine)
+            if engine_class is None:
+                raise ValueError(f"Unknown storage engine: {app_settings.storage_engine}")
+            _engine = engine_class()
+        return _engine
+
+
+def reset_engine() -> None:
+    """Forget the current engine; the next get_engine() builds a fresh one."""
+    global _engine
+    with _engine_lock:
+        _engine = None
+
+
+__all__ = [
+    "StorageEngine",
+    "SQLiteEngine",
+    "MemoryEngine",
+    "ENGINES",
+    "get_engine",
+    "reset_engine",
+]
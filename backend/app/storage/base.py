@@ -0,0 +1,129 @@
+"""The storage interface implemented by every engine."""
+import threading
+from collections.abc import Callable
+from datetime import date
+from typing import Any, Protocol
+
+
+class StorageEngine(Protocol):
+    """Operations the API layer needs from storage.
+
+    Return shapes match app.database: rows as dicts keyed by column, or as
+    tuples in the column order declared in app.row_mapping.
+    """
+
+    name: str
+
+    def init(self) -> None:
+        """Create the schema and seed default data, if needed."""
+
+    def migrate(self, stop: threading.Event | None = None) -> list[int]:
+        """Run pending data migrations, stopping early once stop is set.
+
+        Called in the background after startup, as backfills may take
+        minutes; returns the versions applied.
+        """
+
+    def open(self) -> None:
+        """Acquire long-lived resources at application startup."""
+
+    def close(self) -> None:
+        """Release long-lived resources at application shutdown."""
+
+    def open_read_session(self) -> Any:
+        """Open a session whose reads share one snapshot; close() it when done.
+
+        Read methods accept the session as their session argument. Engines
+        without transactions may return None.
+        """
+
+    def run_write_batch(self, calls: list[Callable[[], Any]]) -> list[tuple[bool, Any]]:
+        """Run write calls as one unit; return (succeeded, result or exception) each."""
+
+    # Team members
+    def get_all_team_members(self, session: Any = None) -> list[dict]:
+        """Get all team members, ordered by name."""
+
+    def get_team_member_rows(self, session: Any = None) -> list[tuple]:
+        """Get all team members as tuples in TEAM_MEMBER_COLUMNS order."""
+
+    def get_team_member_by_id(self, member_id: int, session: Any = None) -> dict | None:
+        """Get a team member by ID."""
+
+    def create_team_member(self, name: str, initials: str | None, slack_id: str | None,
+                           jira_account_id: str | None, email: str | None) -> dict:
+        """Create a team member, deriving initials from the name if missing."""
+
+    def update_team_member(self, member_id: int, **updates) -> dict | None:
+        """Update the given non-None fields of a team member."""
+
+    def delete_team_member(self, member_id: int) -> bool:
+        """Delete a team member."""
+
+    # Settings
+    def get_user_settings(self, session: Any = None) -> dict:
+        """Get user settings."""
+
+    def save_user_settings(self, settings: dict) -> dict:
+        """Replace user settings."""
+
+    def get_data_versions(self) -> dict[str, int]:
+        """Get write counters of the settings and team_members tables.
+
+        Each counter rises on every committed write to its table, including
+        writes made by other processes sharing the storage.
+        """
+
+    # Action items
+    def save_action_item(self, title: str, assignee: str | None, due_date: str | None,
+                         selected: bool = True, overdue: bool = False) -> dict:
+        """Save one action item and return the stored row."""
+
+    def save_action_items(self, items: list[dict]) -> list[dict]:
+        """Save many action items; return the stored rows in input order."""
+
+    def update_action_items(self, updates: list[dict], today: date | None = None) -> list[dict]:
+        """Apply per-item updates, recomputing overdue on new due dates; rows ordered by id."""
+
+    def get_pending_action_items(self, limit: int | None = None,
+                                 after: tuple[int, int] | None = None,
+                                 session: Any = None) -> list[dict]:
+        """Get pending items newest first, keyset-paginated on (created_at, id)."""
+
+    def get_pending_action_item_rows(self, limit: int | None = None,
+                                     after: tuple[int, int] | None = None,
+                                     session: Any = None) -> list[tuple]:
+        """Get pending items as PENDING_ITEM_COLUMNS + created_at tuples."""
+
+    def mark_action_item_completed(self, item_id: int, ticket_key: str | None = None) -> bool:
+        """Mark one action item completed."""
+
+    def complete_action_items(self, completions: list[tuple[int, str | None]]) -> list[int]:
+        """Mark many items completed; return the completed IDs ascending."""
+
+    def delete_action_items(self, item_ids: list[int]) -> list[int]:
+        """Delete many items; return the deleted IDs ascending."""
+
+    def sweep_overdue_action_items(self, today: date | None = None) -> int:
+        """Flag pending items due before today as overdue; return how many."""
+
+    def search_action_item_rows(self, query: str, assignee: str | None = None,
+                                status: str = "all", limit: int = 20,
+                                offset: int = 0, session: Any = None) -> list[tuple]:
+        """Search titles, best matches first, as SEARCH_RESULT_COLUMNS tuples."""
+
+    def archive_completed_action_items_batch(self, cutoff: int, batch_size: int) -> int:
+        """Archive one batch of items completed before cutoff; return how many."""
+
+    def get_action_item_history(self, limit: int, after: tuple[int, int] | None = None,
+                                assignee: str | None = None, start: str | None = None,
+                                end: str | None = None, session: Any = None) -> list[tuple]:
+        """Get completed items, archived included, as HISTORY_ITEM_COLUMNS tuples."""
+
+    # Analytics
+    def get_daily_completions(self, start: str, end: str, session: Any = None) -> dict[str, int]:
+        """Get completions per ISO day within [start, end]."""
+
+    def get_analytics_data(self, start: str | None = None, end: str | None = None,
+                           session: Any = None) -> dict:
+        """Get dashboard totals and the per-assignee leaderboard."""
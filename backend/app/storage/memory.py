@@ -0,0 +1,663 @@
+"""In-memory storage engine: dicts plus secondary indexes, no I/O.
+
+Rows live in dicts keyed by id. Sorted lists of (key, id) tuples stand in
+for the SQLite indexes (pending listing, completion ranges, due dates), an
+inverted index stands in for FTS5, and the analytics counters and daily
+rollup are kept current on every change, as the SQLite triggers do. Results
+have the same shapes as the SQLite engine, so the API layer cannot tell
+them apart; nothing is persisted.
+
+Assignee names resolve to team member ids through a case-insensitive name
+index. Roster changes (new members claiming items, renames, deletions) scan
+the items, as they are rare next to item writes.
+"""
+import bisect
+import copy
+import re
+import threading
+import time
+import unicodedata
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from app.database import (
+    DEFAULT_SETTINGS,
+    DEFAULT_TEAM_MEMBERS,
+    SEARCH_STATUS_FILTERS,
+    VERSIONED_TABLES,
+    leaderboard_initials,
+)
+from app.due_dates import parse_due_date
+from app.row_mapping import (
+    TEAM_MEMBER_COLUMNS,
+    PENDING_ITEM_COLUMNS,
+    HISTORY_ITEM_COLUMNS,
+)
+
+_WORD = re.compile(r"\w+")
+_DAY_SECONDS = 86400
+
+
+def _fold_terms(text: str) -> list[str]:
+    """Split text into case- and accent-folded words, like the FTS5 tokenizer."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return _WORD.findall("".join(c for c in decomposed if not unicodedata.combining(c)))
+
+
+def _utc_day(epoch: int) -> str:
+    """ISO day of an epoch second, in UTC."""
+    return datetime.fromtimestamp(epoch, UTC).date().isoformat()
+
+
+def _assignee_key(item: dict) -> tuple[int, str]:
+    """Counter key of an item, as the SQLite counter tables key it."""
+    if item["assignee_id"] is not None:
+        return item["assignee_id"], ""
+    return 0, item["assignee"] or ""
+
+
+def _day_start(day: str) -> int:
+    """Epoch second at the start of an ISO day, in UTC."""
+    return int(datetime.fromisoformat(day).replace(tzinfo=UTC).timestamp())
+
+
+def _insort(index: list, key: tuple) -> None:
+    """Add a key to a sorted index."""
+    bisect.insort(index, key)
+
+
+def _discard(index: list, key: tuple) -> None:
+    """Remove a key from a sorted index, if present."""
+    position = bisect.bisect_left(index, key)
+    if position < len(index) and index[position] == key:
+        del index[position]
+
+
+class MemoryEngine:
+    """Storage engine keeping everything in process memory.
+
+    Every public method holds one re-entrant lock, so the engine is safe to
+    call from the database worker threads. Reads accept a session argument
+    for interface parity and ignore it.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        """Create an empty store seeded with the default data."""
+        self._lock = threading.RLock()
+        self._members: dict[int, dict] = {}
+        self._member_ids_by_name: dict[str, list[int]] = {}
+        self._next_member_id = 1
+        self._settings: dict | None = None
+        # Write counters, as the SQLite data_versions triggers keep them
+        self._versions = dict.fromkeys(VERSIONED_TABLES, 0)
+
+        self._items: dict[int, dict] = {}
+        self._archive: dict[int, dict] = {}
+        self._next_item_id = 1
+
+        # Secondary indexes: sorted (key, id) tuples
+        self._pending: list[tuple[int, int]] = []
+        self._due: list[tuple[str, int]] = []
+        self._completed: list[tuple[int, int]] = []
+        self._archived_completed: list[tuple[int, int]] = []
+
+        # Title search: term -> {id: occurrences}, sorted vocabulary, title lengths
+        self._postings: dict[str, dict[int, int]] = {}
+        self._vocabulary: list[str] = []
+        self._title_lengths: dict[int, int] = {}
+
+        # Analytics counters and the daily rollup, by assignee_id (0 means unassigned)
+        self._totals = {"total": 0, "pending": 0, "overdue": 0}
+        self._assignee_counters: dict[tuple[int, str], dict[str, int]] = {}
+        self._daily: dict[tuple[str, int, str], int] = {}
+
+        self.init()
+
+    def init(self) -> None:
+        """Seed default settings and team members if empty."""
+        with self._lock:
+            if self._settings is None:
+                self._settings = copy.deepcopy(DEFAULT_SETTINGS)
+            if not self._members:
+                for name, initials, slack_id, jira_account_id, email in DEFAULT_TEAM_MEMBERS:
+                    self.create_team_member(name, initials, slack_id, jira_account_id, email)
+
+    def migrate(self, stop: threading.Event | None = None) -> list[int]:
+        """Nothing to migrate; the data never outlives the current schema."""
+        return []
+
+    def open(self) -> None:
+        """Nothing to open."""
+
+    def close(self) -> None:
+        """Nothing to close; the data lives as long as the engine."""
+
+    def open_read_session(self) -> None:
+        """No session: there are no transactions, and each read holds the lock."""
+        return None
+
+    def run_write_batch(self, calls: list[Callable[[], Any]]) -> list[tuple[bool, Any]]:
+        """Run write calls back to back under the engine lock.
+
+        Operations validate their input before changing anything, so a
+        failing call leaves no partial changes behind.
+        """
+        outcomes: list[tuple[bool, Any]] = []
+        with self._lock:
+            for call in calls:
+                try:
+                    outcomes.append((True, call()))
+                except Exception as exc:
+                    outcomes.append((False, exc))
+        return outcomes
+
+    # Team members
+    def get_all_team_members(self, session: Any = None) -> list[dict]:
+        """Get all team members, ordered by name."""
+        with self._lock:
+            members = sorted(self._members.values(), key=lambda member: member["name"])
+            return [dict(member) for member in members]
+
+    def get_team_member_rows(self, session: Any = None) -> list[tuple]:
+        """Get all team members as tuples in TEAM_MEMBER_COLUMNS order."""
+        return [
+            tuple(member[column] for column in TEAM_MEMBER_COLUMNS)
+            for member in self.get_all_team_members()
+        ]
+
+    def get_team_member_by_id(self, member_id: int, session: Any = None) -> dict | None:
+        """Get a team member by ID."""
+        with self._lock:
+            member = self._members.get(member_id)
+            return dict(member) if member else None
+
+    def _resolve(self, name: str | None) -> int | None:
+        """Team member id for an assignee name; lowest id on duplicates."""
+        if name is None:
+            return None
+        ids = self._member_ids_by_name.get(name.lower())
+        return ids[0] if ids else None
+
+    def create_team_member(self, name: str, initials: str | None, slack_id: str | None,
+                           jira_account_id: str | None, email: str | None) -> dict:
+        """Create a team member, deriving initials from the name if missing.
+
+        Live items already assigned to the name are linked to the new member.
+        """
+        if not initials:
+            initials = "".join(part[0].upper() for part in name.split() if part)
+        with self._lock:
+            member_id = self._next_member_id
+            self._next_member_id += 1
+            self._members[member_id] = {
+                "id": member_id,
+                "name": name,
+                "initials": initials,
+                "slack_id": slack_id,
+                "jira_account_id": jira_account_id,
+                "email": email,
+            }
+            bisect.insort(self._member_ids_by_name.setdefault(name.lower(), []), member_id)
+            self._versions["team_members"] += 1
+            claimed = [
+                item_id for item_id, item in self._items.items()
+                if item["assignee_id"] is None and item["assignee"] is not None
+                and item["assignee"].lower() == name.lower()
+            ]
+            for item_id in claimed:
+                self._replace(item_id, assignee_id=member_id)
+            return dict(self._members[member_id])
+
+    def update_team_member(self, member_id: int, **updates) -> dict | None:
+        """Update the given non-None fields of a team member.
+
+        A new name carries over to every item assigned to the member.
+        """
+        valid_fields = {"name", "initials", "slack_id", "jira_account_id", "email"}
+        updates = {k: v for k, v in updates.items() if k in valid_fields and v is not None}
+        with self._lock:
+            member = self._members.get(member_id)
+            if member is None:
+                return None
+            if updates:
+                self._versions["team_members"] += 1
+            old_name = member["name"]
+            member.update(updates)
+            if member["name"] != old_name:
+                self._member_ids_by_name[old_name.lower()].remove(member_id)
+                bisect.insort(
+                    self._member_ids_by_name.setdefault(member["name"].lower(), []), member_id
+                )
+                for item in (*self._items.values(), *self._archive.values()):
+                    if item["assignee_id"] == member_id:
+                        item["assignee"] = member["name"]
+            return dict(member)
+
+    def delete_team_member(self, member_id: int) -> bool:
+        """Delete a team member, unlinking their items but keeping the names."""
+        with self._lock:
+            member = self._members.pop(member_id, None)
+            if member is None:
+                return False
+            self._versions["team_members"] += 1
+            self._member_ids_by_name[member["name"].lower()].remove(member_id)
+            for item_id in [i for i, item in self._items.items() if item["assignee_id"] == member_id]:
+                self._replace(item_id, assignee_id=None)
+            for item in self._archive.values():
+                if item["assignee_id"] == member_id:
+                    item["assignee_id"] = None
+            return True
+
+    # Settings
+    def get_user_settings(self, session: Any = None) -> dict:
+        """Get user settings."""
+        with self._lock:
+            return copy.deepcopy(self._settings or DEFAULT_SETTINGS)
+
+    def save_user_settings(self, settings: dict) -> dict:
+        """Replace user settings."""
+        with self._lock:
+            self._settings = copy.deepcopy(settings)
+            self._versions["settings"] += 1
+        return settings
+
+    def get_data_versions(self) -> dict[str, int]:
+        """Get the write counters of the versioned tables."""
+        with self._lock:
+            return dict(self._versions)
+
+    # Index maintenance
+    def _index(self, item: dict) -> None:
+        """Add a live item to the secondary indexes."""
+        if item["completed_at"] is None:
+            _insort(self._pending, (item["created_at"], item["id"]))
+            if item["due_on"] is not None:
+                _insort(self._due, (item["due_on"], item["id"]))
+        else:
+            _insort(self._completed, (item["completed_at"], item["id"]))
+
+    def _unindex(self, item: dict) -> None:
+        """Remove a live item from the secondary indexes."""
+        if item["completed_at"] is None:
+            _discard(self._pending, (item["created_at"], item["id"]))
+            if item["due_on"] is not None:
+                _discard(self._due, (item["due_on"], item["id"]))
+        else:
+            _discard(self._completed, (item["completed_at"], item["id"]))
+
+    def _index_title(self, item_id: int, title: str) -> None:
+        """Add a title to the search index."""
+        terms = _fold_terms(title)
+        self._title_lengths[item_id] = len(terms)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._vocabulary, term)
+            postings[item_id] = postings.get(item_id, 0) + 1
+
+    def _unindex_title(self, item_id: int, title: str) -> None:
+        """Remove a title from the search index."""
+        self._title_lengths.pop(item_id, None)
+        for term in set(_fold_terms(title)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(item_id, None)
+            if not postings:
+                del self._postings[term]
+                position = bisect.bisect_left(self._vocabulary, term)
+                del self._vocabulary[position]
+
+    def _count(self, item: dict, sign: int) -> None:
+        """Apply one item to the counters and rollup, as the SQLite triggers do."""
+        pending = int(item["completed_at"] is None)
+        overdue = int(pending and item["overdue"] == 1)
+        deltas = {"total": sign, "pending": sign * pending, "overdue": sign * overdue}
+        for key, delta in deltas.items():
+            self._totals[key] += delta
+        assignee = _assignee_key(item)
+        if assignee != (0, ""):
+            counters = self._assignee_counters.setdefault(
+                assignee, {"total": 0, "pending": 0, "overdue": 0}
+            )
+            for key, delta in deltas.items():
+                counters[key] += delta
+        if item["completed_at"] is not None:
+            key = (_utc_day(item["completed_at"]), *assignee)
+            self._daily[key] = self._daily.get(key, 0) + sign
+
+    def _insert(self, item: dict) -> None:
+        """Store a new live item and index it."""
+        self._items[item["id"]] = item
+        self._index(item)
+        self._index_title(item["id"], item["title"])
+        self._count(item, +1)
+
+    def _replace(self, item_id: int, **changes) -> dict:
+        """Change fields of a live item, keeping indexes and counters current."""
+        old = self._items[item_id]
+        new = {**old, **changes}
+        self._unindex(old)
+        self._count(old, -1)
+        if new["title"] != old["title"]:
+            self._unindex_title(item_id, old["title"])
+            self._index_title(item_id, new["title"])
+        self._items[item_id] = new
+        self._index(new)
+        self._count(new, +1)
+        return new
+
+    def _remove(self, item_id: int, archiving: bool = False) -> dict:
+        """Remove a live item; archived items keep counting and stay searchable."""
+        item = self._items.pop(item_id)
+        self._unindex(item)
+        if not archiving:
+            self._unindex_title(item_id, item["title"])
+            self._count(item, -1)
+        return item
+
+    def _new_item(self, item: dict, now: int) -> dict:
+        """Build a row for a new action item."""
+        if not item.get("title"):
+            raise ValueError("Action item title is required")
+        due_on = parse_due_date(item.get("due_date"))
+        return {
+            "id": None,
+            "title": item["title"],
+            "assignee": item.get("assignee"),
+            "due_date": item.get("due_date"),
+            "due_on": due_on.isoformat() if due_on else None,
+            "selected": int(item.get("selected", True)),
+            "overdue": int(item.get("overdue", False)),
+            "ticket_key": None,
+            "created_at": now,
+            "completed_at": None,
+            "assignee_id": None,
+        }
+
+    # Action items
+    def save_action_item(self, title: str, assignee: str | None, due_date: str | None,
+                         selected: bool = True, overdue: bool = False) -> dict:
+        """Save one action item and return the stored row."""
+        return self.save_action_items([{
+            "title": title,
+            "assignee": assignee,
+            "due_date": due_date,
+            "selected": selected,
+            "overdue": overdue,
+        }])[0]
+
+    def save_action_items(self, items: list[dict]) -> list[dict]:
+        """Save many action items; return the stored rows in input order."""
+        now = int(time.time())
+        rows = [self._new_item(item, now) for item in items]
+        with self._lock:
+            for row in rows:
+                row["id"] = self._next_item_id
+                row["assignee_id"] = self._resolve(row["assignee"])
+                self._next_item_id += 1
+                self._insert(row)
+            return [dict(row) for row in rows]
+
+    def update_action_items(self, updates: list[dict], today: date | None = None) -> list[dict]:
+        """Apply per-item updates; None or missing fields are left unchanged.
+
+        A pending item given a new due date has overdue recomputed from it.
+        """
+        cutoff = (today or datetime.now(UTC).date()).isoformat()
+        updated: dict[int, dict] = {}
+        with self._lock:
+            for update in updates:
+                item_id = update["id"]
+                if item_id not in self._items:
+                    continue
+                changes = {
+                    field: update[field]
+                    for field in ("title", "assignee", "due_date")
+                    if update.get(field) is not None
+                }
+                if update.get("selected") is not None:
+                    changes["selected"] = int(update["selected"])
+                if "assignee" in changes:
+                    changes["assignee_id"] = self._resolve(changes["assignee"])
+                if "due_date" in changes:
+                    due_on = parse_due_date(changes["due_date"])
+                    changes["due_on"] = due_on.isoformat() if due_on else None
+                    if self._items[item_id]["completed_at"] is None:
+                        changes["overdue"] = int(changes["due_on"] is not None
+                                                 and changes["due_on"] < cutoff)
+                updated[item_id] = self._replace(item_id, **changes)
+            return [dict(updated[item_id]) for item_id in sorted(updated)]
+
+    def _pending_keys(self, limit: int | None,
+                      after: tuple[int, int] | None) -> list[tuple[int, int]]:
+        """Pending (created_at, id) keys, newest first, after the keyset position."""
+        upper = bisect.bisect_left(self._pending, after) if after else len(self._pending)
+        lower = 0 if limit is None else max(upper - limit, 0)
+        return self._pending[lower:upper][::-1]
+
+    def get_pending_action_items(self, limit: int | None = None,
+                                 after: tuple[int, int] | None = None,
+                                 session: Any = None) -> list[dict]:
+        """Get pending items, newest first."""
+        with self._lock:
+            return [
+                dict(self._items[item_id])
+                for _, item_id in self._pending_keys(limit, after)
+            ]
+
+    def get_pending_action_item_rows(self, limit: int | None = None,
+                                     after: tuple[int, int] | None = None,
+                                     session: Any = None) -> list[tuple]:
+        """Get pending items as PENDING_ITEM_COLUMNS + created_at tuples."""
+        columns = PENDING_ITEM_COLUMNS + ("created_at",)
+        with self._lock:
+            return [
+                tuple(self._items[item_id][column] for column in columns)
+                for _, item_id in self._pending_keys(limit, after)
+            ]
+
+    def mark_action_item_completed(self, item_id: int, ticket_key: str | None = None) -> bool:
+        """Mark one action item completed."""
+        return bool(self.complete_action_items([(item_id, ticket_key)]))
+
+    def complete_action_items(self, completions: list[tuple[int, str | None]]) -> list[int]:
+        """Mark many items completed; return the completed IDs ascending.
+
+        For a repeated ID the last pair's ticket_key wins.
+        """
+        now = int(time.time())
+        completed = set()
+        with self._lock:
+            for item_id, ticket_key in completions:
+                if item_id in self._items:
+                    self._replace(item_id, completed_at=now, ticket_key=ticket_key)
+                    completed.add(item_id)
+        return sorted(completed)
+
+    def delete_action_items(self, item_ids: list[int]) -> list[int]:
+        """Delete many items; return the deleted IDs ascending."""
+        with self._lock:
+            deleted = sorted({item_id for item_id in item_ids if item_id in self._items})
+            for item_id in deleted:
+                self._remove(item_id)
+        return deleted
+
+    def sweep_overdue_action_items(self, today: date | None = None) -> int:
+        """Flag pending items due before today as overdue; return how many."""
+        cutoff = (today or datetime.now(UTC).date()).isoformat()
+        with self._lock:
+            upper = bisect.bisect_left(self._due, (cutoff,))
+            due = [item_id for _, item_id in self._due[:upper]
+                   if self._items[item_id]["overdue"] == 0]
+            for item_id in due:
+                self._replace(item_id, overdue=1)
+        return len(due)
+
+    def _matching_ids(self, terms: list[str]) -> dict[int, int]:
+        """IDs containing every term, the last as a prefix, with match counts."""
+        *exact, prefix = terms
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        matches: dict[int, int] = {}
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            for item_id, occurrences in self._postings[term].items():
+                matches[item_id] = matches.get(item_id, 0) + occurrences
+        for term in exact:
+            postings = self._postings.get(term, {})
+            matches = {
+                item_id: count + postings[item_id]
+                for item_id, count in matches.items()
+                if item_id in postings
+            }
+        return matches
+
+    def search_action_item_rows(self, query: str, assignee: str | None = None,
+                                status: str = "all", limit: int = 20,
+                                offset: int = 0, session: Any = None) -> list[tuple]:
+        """Search titles, archived items included, best matches first.
+
+        Rank approximates bm25: the share of a title's words that match,
+        negated so that lower is more relevant.
+        """
+        if status not in SEARCH_STATUS_FILTERS:
+            raise ValueError(f"Unknown status filter: {status}")
+        terms = _fold_terms(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            ranked = []
+            for item_id, count in self._matching_ids(terms).items():
+                item = self._items.get(item_id) or self._archive[item_id]
+                if assignee is not None and item["assignee"] != assignee:
+                    continue
+                if status == "pending" and item["completed_at"] is not None:
+                    continue
+                if status == "completed" and item["completed_at"] is None:
+                    continue
+                rank = -count / max(self._title_lengths[item_id], 1)
+                ranked.append((rank, item_id, item))
+            ranked.sort(key=lambda match: match[:2])
+            return [
+                (*(item[column] for column in PENDING_ITEM_COLUMNS), item["completed_at"], rank)
+                for rank, _, item in ranked[offset:offset + limit]
+            ]
+
+    def archive_completed_action_items_batch(self, cutoff: int, batch_size: int) -> int:
+        """Move one batch of items completed before cutoff into the archive."""
+        archived_at = int(time.time())
+        with self._lock:
+            upper = bisect.bisect_left(self._completed, (cutoff,))
+            batch = [item_id for _, item_id in self._completed[:min(upper, batch_size)]]
+            for item_id in batch:
+                item = self._remove(item_id, archiving=True)
+                self._archive[item_id] = {**item, "archived_at": archived_at}
+                _insort(self._archived_completed, (item["completed_at"], item_id))
+        return len(batch)
+
+    def get_action_item_history(self, limit: int, after: tuple[int, int] | None = None,
+                                assignee: str | None = None, start: str | None = None,
+                                end: str | None = None, session: Any = None) -> list[tuple]:
+        """Get completed items, archived included, most recent first."""
+        lower = _day_start(start) if start else None
+        columns = HISTORY_ITEM_COLUMNS[:-1]
+        rows = []
+        with self._lock:
+            sources = (
+                (self._items, self._completed, 0),
+                (self._archive, self._archived_completed, 1),
+            )
+            for items, index, archived in sources:
+                upper = len(index)
+                if after is not None:
+                    upper = bisect.bisect_left(index, after)
+                if end is not None:
+                    upper = min(upper, bisect.bisect_left(index, (_day_start(end) + _DAY_SECONDS,)))
+                taken = 0
+                for position in range(upper - 1, -1, -1):
+                    completed_at, item_id = index[position]
+                    if lower is not None and completed_at < lower:
+                        break
+                    item = items[item_id]
+                    if assignee is not None and item["assignee"] != assignee:
+                        continue
+                    rows.append((*(item[column] for column in columns), archived))
+                    taken += 1
+                    if taken == limit:
+                        break
+        completed_at = HISTORY_ITEM_COLUMNS.index("completed_at")
+        rows.sort(key=lambda row: (row[completed_at], row[0]), reverse=True)
+        return rows[:limit]
+
+    # Analytics
+    def get_daily_completions(self, start: str, end: str, session: Any = None) -> dict[str, int]:
+        """Get completions per ISO day within [start, end]."""
+        totals: dict[str, int] = {}
+        with self._lock:
+            for (day, *_), completed in self._daily.items():
+                if start <= day <= end:
+                    totals[day] = totals.get(day, 0) + completed
+        return {day: completed for day, completed in totals.items() if completed}
+
+    def get_analytics_data(self, start: str | None = None, end: str | None = None,
+                           session: Any = None) -> dict:
+        """Get dashboard totals and the leaderboard of assignees.
+
+        Assignees not on the roster appear under their name, with derived
+        initials and no assignee_id.
+        """
+        today = datetime.now(UTC).date()
+        week_start = (today - timedelta(days=7)).isoformat()
+        window_start = start or week_start
+        window_end = end or today.isoformat()
+
+        with self._lock:
+            completed_this_week = 0
+            completed_by_assignee: dict[tuple[int, str], int] = {}
+            for (day, *assignee), completed in self._daily.items():
+                if day >= week_start:
+                    completed_this_week += completed
+                assignee = tuple(assignee)
+                if assignee != (0, "") and window_start <= day <= window_end:
+                    completed_by_assignee[assignee] = (
+                        completed_by_assignee.get(assignee, 0) + completed
+                    )
+            assignee_rows = []
+            for (assignee_id, name), counters in self._assignee_counters.items():
+                member = self._members.get(assignee_id)
+                if counters["total"] <= 0 or (member is None and not name):
+                    continue
+                if member is None:
+                    member = {"id": None, "name": name, "initials": leaderboard_initials(name)}
+                assignee_rows.append(((assignee_id, name), member, dict(counters)))
+            assignee_rows.sort(key=lambda row: row[1]["name"])
+            pending_count = self._totals["pending"]
+            overdue_count = self._totals["overdue"]
+
+        team_stats = []
+        for assignee, member, counters in assignee_rows:
+            completed = completed_by_assignee.get(assignee, 0)
+            total = counters["total"]
+            team_stats.append({
+                "assignee_id": member["id"],
+                "assignee": member["name"],
+                "initials": member["initials"],
+                "completed_this_week": completed,
+                "total": total,
+                "completion_rate": round(completed / total * 100),
+            })
+        team_stats.sort(key=lambda stat: stat["completed_this_week"], reverse=True)
+
+        return {
+            "completed_this_week": completed_this_week,
+            "pending_count": pending_count,
+            "overdue_count": overdue_count,
+            "active_members": sum(1 for *_, counters in assignee_rows if counters["pending"] > 0),
+            "team_stats": team_stats,
+        }
@@ -0,0 +1,151 @@
+"""SQLite file storage engine, backed by app.database."""
+import threading
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from app import database
+
+
+class SQLiteEngine:
+    """Storage engine for the SQLite database at database.DB_PATH.
+
+    Each method calls the app.database function of the same name at call
+    time, so the schema, pool and triggers stay defined in one place. Reads
+    given a session run on its connection, inside its read transaction.
+    """
+
+    name = "sqlite"
+
+    def init(self) -> None:
+        """Create the schema and seed default data, if needed; backfills wait for migrate()."""
+        database.init_db(migrate=False)
+
+    def migrate(self, stop: threading.Event | None = None) -> list[int]:
+        """Run pending backfills under migration claims, then create the indexes."""
+        return database.run_migrations(stop)
+
+    def open(self) -> None:
+        """Open the connection pool."""
+        database.get_pool()
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        database.close_pool()
+
+    def open_read_session(self) -> database.ReadSession:
+        """Open a read session: one reader connection and read transaction."""
+        return database.open_read_session()
+
+    def run_write_batch(self, calls: list[Callable[[], Any]]) -> list[tuple[bool, Any]]:
+        """Run write calls in one transaction, a savepoint each."""
+        return database.run_write_batch(calls)
+
+    # Team members
+    def get_all_team_members(self, session: Any = None) -> list[dict]:
+        """Get all team members, ordered by name."""
+        return database.get_all_team_members(session)
+
+    def get_team_member_rows(self, session: Any = None) -> list[tuple]:
+        """Get all team members as tuples in TEAM_MEMBER_COLUMNS order."""
+        return database.get_team_member_rows(session)
+
+    def get_team_member_by_id(self, member_id: int, session: Any = None) -> dict | None:
+        """Get a team member by ID."""
+        return database.get_team_member_by_id(member_id, session)
+
+    def create_team_member(self, name: str, initials: str | None, slack_id: str | None,
+                           jira_account_id: str | None, email: str | None) -> dict:
+        """Create a team member."""
+        return database.create_team_member(name, initials, slack_id, jira_account_id, email)
+
+    def update_team_member(self, member_id: int, **updates) -> dict | None:
+        """Update a team member."""
+        return database.update_team_member(member_id, **updates)
+
+    def delete_team_member(self, member_id: int) -> bool:
+        """Delete a team member."""
+        return database.delete_team_member(member_id)
+
+    # Settings
+    def get_user_settings(self, session: Any = None) -> dict:
+        """Get user settings."""
+        return database.get_user_settings(session)
+
+    def save_user_settings(self, settings: dict) -> dict:
+        """Replace user settings."""
+        return database.save_user_settings(settings)
+
+    def get_data_versions(self) -> dict[str, int]:
+        """Get the write counters of the versioned tables."""
+        return database.get_data_versions()
+
+    # Action items
+    def save_action_item(self, title: str, assignee: str | None, due_date: str | None,
+                         selected: bool = True, overdue: bool = False) -> dict:
+        """Save one action item."""
+        return database.save_action_item(title, assignee, due_date, selected, overdue)
+
+    def save_action_items(self, items: list[dict]) -> list[dict]:
+        """Save many action items in one statement."""
+        return database.save_action_items(items)
+
+    def update_action_items(self, updates: list[dict], today: date | None = None) -> list[dict]:
+        """Update many action items in one statement."""
+        return database.update_action_items(updates, today)
+
+    def get_pending_action_items(self, limit: int | None = None,
+                                 after: tuple[int, int] | None = None,
+                                 session: Any = None) -> list[dict]:
+        """Get pending items, newest first."""
+        return database.get_pending_action_items(limit, after, session)
+
+    def get_pending_action_item_rows(self, limit: int | None = None,
+                                     after: tuple[int, int] | None = None,
+                                     session: Any = None) -> list[tuple]:
+        """Get pending items as plain tuples, newest first."""
+        return database.get_pending_action_item_rows(limit, after, session)
+
+    def mark_action_item_completed(self, item_id: int, ticket_key: str | None = None) -> bool:
+        """Mark one action item completed."""
+        return database.mark_action_item_completed(item_id, ticket_key)
+
+    def complete_action_items(self, completions: list[tuple[int, str | None]]) -> list[int]:
+        """Mark many action items completed in one statement."""
+        return database.complete_action_items(completions)
+
+    def delete_action_items(self, item_ids: list[int]) -> list[int]:
+        """Delete many action items in one statement."""
+        return database.delete_action_items(item_ids)
+
+    def sweep_overdue_action_items(self, today: date | None = None) -> int:
+        """Flag pending items whose due date has passed as overdue."""
+        return database.sweep_overdue_action_items(today)
+
+    def search_action_item_rows(self, query: str, assignee: str | None = None,
+                                status: str = "all", limit: int = 20,
+                                offset: int = 0, session: Any = None) -> list[tuple]:
+        """Search titles through the FTS5 index."""
+        return database.search_action_item_rows(
+            query, assignee, status, limit, offset, session
+        )
+
+    def archive_completed_action_items_batch(self, cutoff: int, batch_size: int) -> int:
+        """Move one batch of old completed items into the archive table."""
+        return database.archive_completed_action_items_batch(cutoff, batch_size)
+
+    def get_action_item_history(self, limit: int, after: tuple[int, int] | None = None,
+                                assignee: str | None = None, start: str | None = None,
+                                end: str | None = None, session: Any = None) -> list[tuple]:
+        """Get completed items from the live and archive tables."""
+        return database.get_action_item_history(limit, after, assignee, start, end, session)
+
+    # Analytics
+    def get_daily_completions(self, start: str, end: str, session: Any = None) -> dict[str, int]:
+        """Get completions per day from the daily rollup."""
+        return database.get_daily_completions(start, end, session)
+
+    def get_analytics_data(self, start: str | None = None, end: str | None = None,
+                           session: Any = None) -> dict:
+        """Get dashboard totals from the counter tables."""
+        return database.get_analytics_data(start, end, session)
@@ -0,0 +1,56 @@
+"""Background tasks run for the lifetime of the application."""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs an async job on a fixed interval until stopped.
+
+    A failing run is logged and the schedule continues, so one bad run does
+    not stop later ones.
+    """
+
+    def __init__(self, name: str, interval_seconds: float,
+                 job: Callable[[], Awaitable[object]]):
+        """Configure the task; call start() to begin running it."""
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.job = job
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the task loop is currently scheduled."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the loop on the running event loop; no-op if the interval is 0."""
+        if self.interval_seconds <= 0 or self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Cancel the loop and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Run the job, then sleep for the interval, forever."""
+        while True:
+            try:
+                result = await self.job()
+                logger.debug("%s finished: %s", self.name, result)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("%s failed", self.name)
+            await asyncio.sleep(self.interval_seconds)
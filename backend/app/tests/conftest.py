@@ -25,9 +25,14 @@ def isolated_test_db(tmp_path):
     # Initialize the test database
     database.init_db()
 
+    # Cached settings and roster belong to the previous test's database
+    from app.services.settings_service import clear_cache
+    clear_cache()
+
     yield test_db_path
 
-    # Restore original DB path
+    # Release pooled connections and restore original DB path
+    database.close_pool()
     database.DB_PATH = original_db_path
 
 
@@ -236,6 +236,20 @@ class TestSendNotificationEndpoint:
         data = response.json()
         assert data["success"] is True
 
+    def test_send_notification_resolves_stored_roster(self, client):
+        """Test notifications resolve assignees against the stored team roster."""
+        client.post("/api/team", json={"name": "Ada Lovelace", "slack_id": "U999AL"})
+
+        with patch(
+            "app.api.actions.send_slack_notification",
+            new_callable=AsyncMock,
+            return_value=MagicMock(success=True, message="Sent", recipients=["Ada"]),
+        ) as mock_send:
+            client.post("/api/notifications/send", json={"assignee": "Ada", "message": "Hi"})
+
+        member = mock_send.call_args.kwargs["resolver"].resolve("Ada")
+        assert (member.name, member.slack_id) == ("Ada Lovelace", "U999AL")
+
     def test_send_notification_missing_fields(self, client):
         """Test sending notification with missing fields."""
         response = client.post(
@@ -283,6 +297,264 @@ class TestSendRemindersEndpoint:
         assert response.status_code == 400
 
 
+class TestBatchActionItemsEndpoints:
+    """Tests for the batch action item endpoints."""
+
+    def _create(self, client, count: int) -> list[dict]:
+        """Create action items through the batch endpoint."""
+        response = client.post(
+            "/api/actions/items/batch",
+            json={"items": [{"title": f"Task {i}", "assignee": "John Smith"} for i in range(count)]},
+        )
+        assert response.status_code == 201
+        return response.json()["items"]
+
+    def test_batch_create(self, client):
+        """Test creating many items returns them in request order."""
+        items = self._create(client, 3)
+
+        assert [item["title"] for item in items] == ["Task 0", "Task 1", "Task 2"]
+        assert all(item["selected"] is True for item in items)
+        assert len({item["id"] for item in items}) == 3
+
+    def test_batch_create_resolves_assignees(self, client):
+        """Test extracted names are stored as the roster name they resolve to."""
+        response = client.post(
+            "/api/actions/items/batch",
+            json={"items": [
+                {"title": "Roadmap", "assignee": "j. smith"},
+                {"title": "Docs", "assignee": "Someone Else"},
+            ]},
+        )
+
+        from app import database
+
+        items = response.json()["items"]
+        with database.get_read_db() as conn:
+            linked = conn.execute(
+                "SELECT assignee_id IS NOT NULL FROM action_items ORDER BY id"
+            ).fetchall()
+        assert [item["assignee"] for item in items] == ["John Smith", "Someone Else"]
+        assert [row[0] for row in linked] == [1, 0]
+
+    def test_batch_create_rejects_empty(self, client):
+        """Test an empty batch fails validation."""
+        response = client.post("/api/actions/items/batch", json={"items": []})
+
+        assert response.status_code == 422
+
+    def test_batch_update(self, client):
+        """Test updating selected and title for many items."""
+        items = self._create(client, 2)
+
+        response = client.patch(
+            "/api/actions/items/batch",
+            json={"updates": [
+                {"id": items[0]["id"], "selected": False},
+                {"id": items[1]["id"], "title": "Renamed"},
+                {"id": 9999, "title": "Missing"},
+            ]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"][0]["selected"] is False
+        assert data["items"][0]["title"] == "Task 0"
+        assert data["items"][1]["title"] == "Renamed"
+        assert data["missing"] == [9999]
+
+    def test_batch_update_duplicate_ids(self, client):
+        """Test an ID listed twice is updated once, the later update winning."""
+        items = self._create(client, 1)
+
+        response = client.patch(
+            "/api/actions/items/batch",
+            json={"updates": [
+                {"id": items[0]["id"], "title": "First"},
+                {"id": items[0]["id"], "title": "Second"},
+                {"id": 9999, "title": "Missing"},
+                {"id": 9999, "title": "Missing again"},
+            ]},
+        )
+
+        data = response.json()
+        assert [(item["id"], item["title"]) for item in data["items"]] == [
+            (items[0]["id"], "Second")
+        ]
+        assert data["missing"] == [9999]
+
+    def test_batch_complete(self, client):
+        """Test completing many items records ticket keys."""
+        items = self._create(client, 2)
+
+        response = client.post(
+            "/api/actions/items/batch/complete",
+            json={"items": [
+                {"id": items[0]["id"], "ticket_key": "SANAS-1"},
+                {"id": items[1]["id"], "ticket_key": "SANAS-2"},
+            ]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["succeeded"] == [items[0]["id"], items[1]["id"]]
+        analytics = client.get("/api/analytics").json()
+        assert analytics["stats"]["pending_actions"] == 0
+        assert analytics["stats"]["completed_this_week"] == 2
+
+    def test_batch_delete(self, client):
+        """Test deleting many items reports missing IDs."""
+        items = self._create(client, 2)
+
+        response = client.post(
+            "/api/actions/items/batch/delete",
+            json={"ids": [items[0]["id"], 9999]},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"succeeded": [items[0]["id"]], "missing": [9999]}
+        assert client.get("/api/analytics").json()["stats"]["pending_actions"] == 1
+
+
+class TestPendingItemsEndpoint:
+    """Tests for GET /api/actions/pending keyset pagination."""
+
+    def test_pages_cover_all_items_once(self, client):
+        """Test following cursors visits every pending item exactly once."""
+        from app.database import save_action_items
+
+        save_action_items([{"title": f"Task {i}"} for i in range(7)])
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/api/actions/pending", params=params).json()
+            seen.extend(item["id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert seen == sorted(seen, reverse=True)
+
+    def test_last_page_has_no_cursor(self, client):
+        """Test a page that fits everything has no next cursor."""
+        from app.database import save_action_item
+
+        save_action_item("Only Task", None, None)
+
+        page = client.get("/api/actions/pending", params={"limit": 5}).json()
+
+        assert [item["title"] for item in page["items"]] == ["Only Task"]
+        assert page["next_cursor"] is None
+
+    def test_invalid_cursor_rejected(self, client):
+        """Test a malformed cursor is a client error."""
+        response = client.get("/api/actions/pending", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+
+class TestSearchEndpoint:
+    """Tests for GET /api/actions/search."""
+
+    def test_returns_ranked_page_with_next_offset(self, client):
+        """Test matches come back best first with an offset for the next page."""
+        from app.database import save_action_items
+
+        save_action_items(
+            [{"title": "Plan launch"}, {"title": "Launch launch checklist"}, {"title": "Lunch"}]
+        )
+
+        page = client.get("/api/actions/search", params={"q": "launch", "limit": 1}).json()
+        rest = client.get(
+            "/api/actions/search", params={"q": "launch", "limit": 1, "offset": 1}
+        ).json()
+
+        assert [item["title"] for item in page["items"]] == ["Launch launch checklist"]
+        assert page["next_offset"] == 1
+        assert [item["title"] for item in rest["items"]] == ["Plan launch"]
+        assert rest["next_offset"] is None
+
+    def test_applies_filters(self, client):
+        """Test assignee and status filters are passed through."""
+        from app.database import save_action_item, mark_action_item_completed
+
+        save_action_item("Write report", "John Smith", None)
+        done = save_action_item("Review report", "Sarah Lee", None)
+        mark_action_item_completed(done["id"])
+
+        response = client.get(
+            "/api/actions/search",
+            params={"q": "report", "assignee": "Sarah Lee", "status": "completed"},
+        )
+
+        items = response.json()["items"]
+        assert [item["title"] for item in items] == ["Review report"]
+        assert items[0]["completed_at"] is not None
+
+    def test_query_without_words_is_empty(self, client):
+        """Test punctuation-only queries return no results instead of failing."""
+        response = client.get("/api/actions/search", params={"q": '"*'})
+
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "next_offset": None}
+
+    def test_invalid_status_rejected(self, client):
+        """Test an unknown status filter is a validation error."""
+        response = client.get("/api/actions/search", params={"q": "x", "status": "archived"})
+
+        assert response.status_code == 422
+
+
+class TestHistoryEndpoint:
+    """Tests for GET /api/actions/history."""
+
+    def test_pages_include_archived_items(self, client):
+        """Test history pages cover live and archived completions once each."""
+        from app.database import (
+            save_action_items,
+            complete_action_items,
+            archive_completed_action_items,
+            get_db,
+        )
+
+        items = save_action_items([{"title": f"Task {i}"} for i in range(5)])
+        complete_action_items([(item["id"], None) for item in items])
+        with get_db() as conn:
+            conn.execute("UPDATE action_items SET completed_at = 1000 WHERE id <= ?",
+                         (items[1]["id"],))
+        archive_completed_action_items(older_than_days=1)
+
+        seen = []
+        archived = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/api/actions/history", params=params).json()
+            seen.extend(item["id"] for item in page["items"])
+            archived.extend(item["id"] for item in page["items"] if item["archived"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert sorted(seen) == [item["id"] for item in items]
+        assert sorted(archived) == [items[0]["id"], items[1]["id"]]
+        assert seen[-2:] == [items[1]["id"], items[0]["id"]]
+
+    def test_inverted_range_rejected(self, client):
+        """Test 'from' after 'to' is a client error."""
+        response = client.get(
+            "/api/actions/history", params={"from": "2025-02-01", "to": "2025-01-01"}
+        )
+
+        assert response.status_code == 400
+
+
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
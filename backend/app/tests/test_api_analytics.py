@@ -100,3 +100,105 @@ class TestAnalyticsEndpoint:
             assert "assignee" in item
             assert "due_date" in item
             assert "overdue" in item
+
+
+class TestAnalyticsTrend:
+    """Tests for rollup-backed trend data."""
+
+    def test_weekly_trend_counts_todays_completions(self, client):
+        """Test completions show up in today's trend bucket."""
+        from datetime import UTC, datetime
+        from app.database import mark_action_item_completed
+
+        item = save_action_item("Done Today", "John Smith", None, True, False)
+        mark_action_item_completed(item["id"], "SANAS-1")
+
+        response = client.get("/api/analytics")
+
+        data = response.json()
+        weekday = datetime.now(UTC).weekday()
+        assert data["weekly_trend"][weekday]["completed"] == 1
+        assert sum(t["completed"] for t in data["weekly_trend"]) == 1
+
+    def test_windowed_trend_by_day(self, client):
+        """Test an explicit window returns one bucket per day."""
+        response = client.get("/api/analytics?from=2025-01-01&to=2025-01-10")
+
+        assert response.status_code == 200
+        trend = response.json()["weekly_trend"]
+        assert len(trend) == 10
+        assert trend[0]["week"] == "Jan 1"
+
+    def test_windowed_trend_by_week(self, client):
+        """Test week buckets start on Monday."""
+        response = client.get("/api/analytics?from=2025-01-01&to=2025-01-31&bucket=week")
+
+        assert response.status_code == 200
+        labels = [t["week"] for t in response.json()["weekly_trend"]]
+        assert labels == ["Dec 30", "Jan 6", "Jan 13", "Jan 20", "Jan 27"]
+
+    def test_inverted_window_rejected(self, client):
+        """Test from after to is a client error."""
+        response = client.get("/api/analytics?from=2025-02-01&to=2025-01-01")
+
+        assert response.status_code == 400
+
+    def test_invalid_bucket_rejected(self, client):
+        """Test unknown bucket sizes fail validation."""
+        response = client.get("/api/analytics?bucket=month")
+
+        assert response.status_code == 422
+
+
+class TestAnalyticsPendingPage:
+    """Tests for the bounded pending list in analytics."""
+
+    def test_pending_items_bounded_with_cursor(self, client):
+        """Test analytics embeds one page of pending items plus a cursor."""
+        from app.api.settings import ANALYTICS_PENDING_PAGE_SIZE
+        from app.database import save_action_items
+
+        save_action_items(
+            [{"title": f"Task {i}"} for i in range(ANALYTICS_PENDING_PAGE_SIZE + 5)]
+        )
+
+        data = client.get("/api/analytics").json()
+
+        assert len(data["pending_items"]) == ANALYTICS_PENDING_PAGE_SIZE
+        assert data["pending_next_cursor"] is not None
+        assert data["stats"]["pending_actions"] == ANALYTICS_PENDING_PAGE_SIZE + 5
+
+        rest = client.get(
+            "/api/actions/pending", params={"cursor": data["pending_next_cursor"]}
+        ).json()
+        assert len(rest["items"]) == 5
+
+
+class TestAnalyticsReadSession:
+    """Tests for the analytics request's read session."""
+
+    def test_one_reader_per_request(self, client):
+        """Test every analytics query runs on one borrowed reader connection."""
+        from app.query_stats import query_stats
+
+        save_action_item("Task", "John Smith", None)
+        query_stats.reset()
+
+        response = client.get("/api/analytics")
+
+        assert response.status_code == 200
+        assert query_stats.snapshot()["waits"]["reader"]["count"] == 1
+
+    async def test_concurrent_requests_beyond_reader_count(self):
+        """Test more concurrent analytics requests than readers all complete."""
+        import asyncio
+        import httpx
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.wait_for(
+                asyncio.gather(*(client.get("/api/analytics") for _ in range(12))),
+                timeout=10,
+            )
+
+        assert [response.status_code for response in responses] == [200] * 12
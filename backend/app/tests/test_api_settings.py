@@ -135,6 +135,35 @@ class TestTeamEndpoints:
         assert response.status_code == 404
 
 
+class TestTeamSuggestEndpoint:
+    """Tests for GET /api/team/suggest."""
+
+    def test_suggest_by_prefix(self, client):
+        """Test seeded members are suggested by name and initials."""
+        by_name = client.get("/api/team/suggest", params={"prefix": "sar"})
+        by_initials = client.get("/api/team/suggest", params={"prefix": "MK"})
+
+        assert by_name.status_code == 200
+        assert [m["name"] for m in by_name.json()] == ["Sarah Lee"]
+        assert [m["name"] for m in by_initials.json()] == ["Muthu K"]
+
+    def test_new_members_are_suggested(self, client):
+        """Test a member added through the API is suggested right away."""
+        client.get("/api/team/suggest", params={"prefix": "a"})
+        client.post("/api/team", json={"name": "Ada Lovelace"})
+
+        response = client.get("/api/team/suggest", params={"prefix": "lov"})
+
+        assert [m["name"] for m in response.json()] == ["Ada Lovelace"]
+
+    def test_limit_and_validation(self, client):
+        """Test limit caps results and an empty prefix is rejected."""
+        limited = client.get("/api/team/suggest", params={"prefix": "a", "limit": 1})
+
+        assert len(limited.json()) == 1
+        assert client.get("/api/team/suggest", params={"prefix": ""}).status_code == 422
+        assert client.get("/api/team/suggest").status_code == 422
+
 class TestIntegrationStatusEndpoint:
     """Tests for integration status endpoint."""
 
@@ -146,3 +175,23 @@ class TestIntegrationStatusEndpoint:
         data = response.json()
         assert "jira_connected" in data
         assert "slack_connected" in data
+
+
+class TestCacheStatsEndpoint:
+    """Tests for /api/admin/cache."""
+
+    def test_counts_hits_and_invalidations(self, client):
+        """Test roster reads and writes show up in the cache counters."""
+        client.get("/api/team")
+        client.get("/api/team")
+        client.post("/api/team", json={"name": "Ada Lovelace"})
+
+        response = client.get("/api/admin/cache")
+
+        assert response.status_code == 200
+        stats = {entry["name"]: entry for entry in response.json()}
+        assert stats["team_members"]["hits"] == 1
+        assert stats["team_members"]["misses"] == 1
+        assert stats["team_members"]["hit_rate"] == 0.5
+        assert stats["team_members"]["invalidations"] == 1
+        assert stats["team_members"]["entries"] == 0
@@ -0,0 +1,82 @@
+"""Tests for assignee name resolution."""
+import pytest
+
+from app.assignee_resolver import AssigneeResolver, normalize_name, resolver_for
+from app.models import TeamMember
+
+
+@pytest.fixture
+def roster():
+    """A roster with a shared first name."""
+    return [
+        TeamMember(id=1, name="John Smith", initials="JS", slack_id="@john.smith",
+                   email="jsmith@example.com"),
+        TeamMember(id=2, name="Sarah Lee", initials="SL", slack_id="U234567",
+                   email="sarah.lee@example.com"),
+        TeamMember(id=3, name="John Park", initials="JP"),
+        TeamMember(id=4, name="Zoë Müller", initials="ZM"),
+    ]
+
+
+class TestAssigneeResolver:
+    """Tests for AssigneeResolver."""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("John Smith", 1),
+        ("  john   SMITH ", 1),
+        ("jsmith", 1),
+        ("@john.smith", 1),
+        ("JS", 1),
+        ("J. Smith", 1),
+        ("John S.", 1),
+        ("Smith", 1),
+        ("sarah", 2),
+        ("sarah.lee@example.com", 2),
+        ("U234567", 2),
+        ("zoe muller", 4),
+        ("Jon Smith", 1),
+        ("Sara Lee", 2),
+    ])
+    def test_resolves_name_variants(self, roster, name, expected):
+        """Test names, handles, initials, short forms and typos resolve."""
+        assert AssigneeResolver(roster).resolve(name).id == expected
+
+    @pytest.mark.parametrize("name", ["John", "Unknown Person", "", None, "xq"])
+    def test_ambiguous_or_unknown_names_resolve_to_no_one(self, roster, name):
+        """Test a shared first name or a stranger is not guessed."""
+        assert AssigneeResolver(roster).resolve(name) is None
+
+    def test_fuzzy_results_are_learned(self, roster, monkeypatch):
+        """Test a fuzzy match is computed once per resolver."""
+        resolver = AssigneeResolver(roster)
+        calls = []
+        original = resolver._fuzzy_match
+        monkeypatch.setattr(resolver, "_fuzzy_match", lambda key: calls.append(key) or original(key))
+
+        first = resolver.resolve("Jon Smith")
+        second = resolver.resolve("jon smith")
+
+        assert first is second is roster[0]
+        assert calls == ["jon smith"]
+
+    def test_normalize_name(self):
+        """Test folding of case, accents and punctuation."""
+        assert normalize_name("  Zoë  O'Brien-Müller ") == "zoe o brien muller"
+
+
+class TestResolverFor:
+    """Tests for the shared resolver cache."""
+
+    def test_same_roster_shares_a_resolver(self, roster):
+        """Test an unchanged roster, even as a new list, reuses the index."""
+        assert resolver_for(roster) is resolver_for(list(roster))
+
+    def test_changed_roster_rebuilds(self, roster):
+        """Test a rename produces a new resolver that knows the new name."""
+        before = resolver_for(roster)
+        renamed = [roster[0].model_copy(update={"name": "Johnny Smith"}), *roster[1:]]
+
+        after = resolver_for(renamed)
+
+        assert after is not before
+        assert after.resolve("Johnny Smith").id == 1
@@ -0,0 +1,156 @@
+"""Tests for the async database layer."""
+import threading
+
+import pytest
+
+import app.async_database as async_database
+import app.services  # noqa: F401  (registers the roster resolver for item writes)
+from app.async_database import (
+    run_db,
+    get_all_team_members,
+    save_action_item,
+    get_pending_action_items,
+    get_analytics_data,
+)
+from app.database import DEFAULT_TEAM_MEMBERS
+
+
+class TestDatabaseExecutor:
+    """Tests for the dedicated database executor."""
+
+    async def test_run_db_uses_database_thread(self):
+        """Test blocking calls run off the event loop thread."""
+        thread_name = await run_db(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("sanas-db")
+        assert thread_name != threading.current_thread().name
+
+    async def test_run_db_propagates_errors(self):
+        """Test exceptions raised on the database thread reach the caller."""
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await run_db(fail)
+
+    async def test_shutdown_executor_recreates_on_demand(self):
+        """Test the executor is recreated after shutdown."""
+        first = async_database.get_executor()
+        async_database.shutdown_executor()
+
+        second = async_database.get_executor()
+
+        assert second is not first
+
+
+class TestAsyncOperations:
+    """Tests for async counterparts of database operations."""
+
+    async def test_get_all_team_members(self):
+        """Test async team member listing returns seeded members."""
+        members = await get_all_team_members()
+        assert len(members) == len(DEFAULT_TEAM_MEMBERS)
+
+    async def test_save_and_list_pending_items(self):
+        """Test async writes are visible to async reads."""
+        await save_action_item("Async Task", "John", None)
+
+        pending = await get_pending_action_items()
+
+        assert [p["title"] for p in pending] == ["Async Task"]
+
+    async def test_save_stores_canonical_assignee(self):
+        """Test single and batch saves store the roster name an assignee resolves to."""
+        single = await save_action_item("Single", "J. Smith", None)
+        batch = await async_database.save_action_items([
+            {"title": "Batch", "assignee": "sarah"},
+            {"title": "Stranger", "assignee": "Nobody"},
+        ])
+
+        assert (single["assignee"], single["assignee_id"]) == ("John Smith", 1)
+        assert [(row["assignee"], row["assignee_id"]) for row in batch] == [
+            ("Sarah Lee", 2), ("Nobody", None)
+        ]
+
+    async def test_get_analytics_data(self):
+        """Test async analytics returns dashboard counters."""
+        await save_action_item("Task", "John", None, True, True)
+
+        data = await get_analytics_data()
+
+        assert data["pending_count"] == 1
+        assert data["overdue_count"] == 1
+
+    async def test_archive_completed_action_items(self):
+        """Test the async archival job moves old completions in batches."""
+        from app import database
+
+        items = [await save_action_item(f"Done {n}", "John", None) for n in range(3)]
+        with database.get_db() as conn:
+            conn.execute("UPDATE action_items SET completed_at = 1000")
+
+        archived = await async_database.archive_completed_action_items(batch_size=2)
+
+        history = await async_database.get_action_item_history(limit=10)
+        assert archived == 3
+        assert sorted(row[0] for row in history) == [item["id"] for item in items]
+        assert all(row[-1] == 1 for row in history)
+
+
+class TestReadSession:
+    """Tests for async read sessions."""
+
+    async def test_session_reads_one_snapshot(self):
+        """Test reads through an async session keep their snapshot."""
+        async with async_database.read_session() as session:
+            before = await get_pending_action_items(session=session)
+            await save_action_item("Later", None, None)
+            during = await get_pending_action_items(session=session)
+
+        assert before == during == []
+        assert len(await get_pending_action_items()) == 1
+
+    async def test_more_sessions_than_readers_do_not_deadlock(self):
+        """Test sessions beyond db_pool_readers queue instead of starving the threads."""
+        import asyncio
+        from app.config import settings as app_settings
+
+        async def request():
+            async with async_database.read_session() as session:
+                await get_pending_action_items(session=session)
+                await asyncio.sleep(0.01)
+                await get_all_team_members()
+                await get_pending_action_items(session=session)
+
+        tasks = [request() for _ in range(app_settings.db_pool_readers * 3)]
+        tasks += [get_all_team_members() for _ in range(app_settings.db_pool_readers * 3)]
+
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=10)
+
+    async def test_single_reader_runs_without_sessions(self, monkeypatch):
+        """Test a one-reader pool yields no session rather than holding its only reader."""
+        from app.config import settings as app_settings
+
+        monkeypatch.setattr(app_settings, "db_pool_readers", 1)
+
+        async with async_database.read_session() as session:
+            members = await get_all_team_members(session)
+
+        assert session is None
+        assert len(members) == len(DEFAULT_TEAM_MEMBERS)
+
+    async def test_memory_engine_has_no_session(self, monkeypatch):
+        """Test engines without transactions yield None, which reads accept."""
+        from app import storage
+        from app.config import settings as app_settings
+
+        monkeypatch.setattr(app_settings, "storage_engine", "memory")
+        storage.reset_engine()
+        try:
+            async with async_database.read_session() as session:
+                members = await get_all_team_members(session)
+        finally:
+            storage.reset_engine()
+
+        assert session is None
+        assert len(members) == len(DEFAULT_TEAM_MEMBERS)
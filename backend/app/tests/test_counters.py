@@ -0,0 +1,139 @@
+"""Tests for analytics counter verification and rebuild."""
+import json
+
+from app import counters, database
+from app.database import mark_action_item_completed, save_action_item
+
+
+def _seed() -> None:
+    """Two assigned items, one of them completed."""
+    save_action_item("Task 1", "John Smith", None)
+    done = save_action_item("Task 2", "Sarah Lee", None)
+    mark_action_item_completed(done["id"])
+
+
+def _corrupt_pending(delta: int) -> None:
+    """Skew the stored global pending count, as a buggy trigger would."""
+    with database.get_db() as conn:
+        conn.execute("UPDATE analytics_counters SET pending = pending + ? WHERE id = 1", (delta,))
+
+
+class TestVerifyCounters:
+    """Tests for verify_counters."""
+
+    def test_trigger_maintained_counters_have_no_drift(self):
+        """Test counters kept by the triggers match a recomputation."""
+        _seed()
+
+        report = counters.verify_counters()
+
+        assert report["drift"] is False
+        assert report["tables"] == {
+            "analytics_counters": [],
+            "assignee_counters": [],
+            "daily_completions": [],
+        }
+
+    def test_reports_corrupted_counter(self):
+        """Test a skewed counter is reported with stored and expected values."""
+        _seed()
+        _corrupt_pending(3)
+
+        report = counters.verify_counters()
+
+        assert report["drift"] is True
+        assert report["tables"]["analytics_counters"] == [{
+            "id": 1,
+            "stored": {"total": 2, "pending": 4, "overdue": 0},
+            "expected": {"total": 2, "pending": 1, "overdue": 0},
+        }]
+        assert report["tables"]["assignee_counters"] == []
+
+    def test_reports_missing_and_stray_rows(self):
+        """Test deleted rollups and rows for nothing are both drift."""
+        _seed()
+        with database.get_db() as conn:
+            conn.execute("DELETE FROM daily_completions")
+            conn.execute(
+                "INSERT INTO assignee_counters (assignee_id, assignee, total, pending, overdue) "
+                "VALUES (999, '', 1, 1, 0)"
+            )
+
+        tables = counters.verify_counters()["tables"]
+
+        assert len(tables["daily_completions"]) == 1
+        assert tables["daily_completions"][0]["stored"] == {"completed": 0}
+        assert tables["daily_completions"][0]["expected"] == {"completed": 1}
+        assert tables["assignee_counters"] == [{
+            "assignee_id": 999,
+            "assignee": "",
+            "stored": {"total": 1, "pending": 1, "overdue": 0},
+            "expected": {"total": 0, "pending": 0, "overdue": 0},
+        }]
+
+    def test_verify_does_not_write(self):
+        """Test verifying leaves drifted counters in place."""
+        _seed()
+        _corrupt_pending(3)
+
+        counters.verify_counters()
+
+        assert counters.verify_counters()["drift"] is True
+
+
+class TestRebuildCounters:
+    """Tests for rebuild_counters."""
+
+    def test_rebuild_repairs_drift(self):
+        """Test a rebuild reports the drift it found and leaves none."""
+        _seed()
+        _corrupt_pending(-1)
+
+        report = counters.rebuild_counters()
+
+        assert report["drift"] is True
+        assert report["rebuilt"] is True
+        assert counters.verify_counters()["drift"] is False
+
+    def test_no_rebuild_without_drift(self, monkeypatch):
+        """Test clean counters are not rewritten unless forced."""
+        _seed()
+        calls = []
+        original = database.rebuild_analytics_counters
+        monkeypatch.setattr(
+            database, "rebuild_analytics_counters",
+            lambda cursor: calls.append(cursor) or original(cursor),
+        )
+
+        assert counters.rebuild_counters()["rebuilt"] is False
+        assert counters.rebuild_counters(only_on_drift=False)["rebuilt"] is True
+        assert len(calls) == 1
+
+
+class TestMain:
+    """Tests for the command line entry point."""
+
+    def test_verify_only_reports(self, capsys):
+        """Test the default run prints the drift, exits 1 and rebuilds nothing."""
+        _seed()
+        _corrupt_pending(3)
+
+        status = counters.main([])
+
+        report = json.loads(capsys.readouterr().out)
+        assert status == 1
+        assert report["drift"] is True
+        assert "rebuilt" not in report
+        assert counters.verify_counters()["drift"] is True
+
+    def test_rebuild_flag_repairs(self, capsys):
+        """Test --rebuild repairs the drift and exits 0."""
+        _seed()
+        _corrupt_pending(3)
+
+        status = counters.main(["--rebuild"])
+
+        report = json.loads(capsys.readouterr().out)
+        assert status == 0
+        assert report["rebuilt"] is True
+        assert counters.verify_counters()["drift"] is False
@@ -15,6 +15,10 @@ from app.database import (
     save_action_item,
     get_pending_action_items,
     mark_action_item_completed,
+    save_action_items,
+    update_action_items,
+    complete_action_items,
+    delete_action_items,
     get_analytics_data,
     DEFAULT_SETTINGS,
     DEFAULT_TEAM_MEMBERS,
@@ -203,6 +207,20 @@ class TestActionItemOperations:
 
         assert len(pending) == 2
 
+    def test_get_pending_action_items_keyset_page(self, isolated_test_db):
+        """Test pages continue strictly after the given position."""
+        for i in range(5):
+            save_action_item(f"Task {i}", None, None)
+
+        first = get_pending_action_items(limit=2)
+        last = first[-1]
+        second = get_pending_action_items(limit=2, after=(last["created_at"], last["id"]))
+
+        assert len(first) == 2
+        assert len(second) == 2
+        assert {p["id"] for p in first}.isdisjoint(p["id"] for p in second)
+        assert second[0]["id"] < last["id"]
+
     def test_mark_action_item_completed(self, isolated_test_db):
         """Test marking action item as completed."""
         item = save_action_item("Complete Me", "John", None, True, False)
@@ -215,6 +233,53 @@ class TestActionItemOperations:
         assert all(p["id"] != item["id"] for p in pending)
 
 
+class TestBatchActionItemOperations:
+    """Tests for set-based batch action item operations."""
+
+    def test_save_action_items(self, isolated_test_db):
+        """Test batch insert returns rows in input order."""
+        rows = save_action_items([
+            {"title": "A", "assignee": "John"},
+            {"title": "B", "assignee": None, "overdue": True},
+        ])
+
+        assert [row["title"] for row in rows] == ["A", "B"]
+        assert rows[1]["overdue"] == 1
+        assert len(get_pending_action_items()) == 2
+
+    def test_save_action_items_empty(self, isolated_test_db):
+        """Test an empty batch is a no-op."""
+        assert save_action_items([]) == []
+
+    def test_update_action_items_keeps_unset_fields(self, isolated_test_db):
+        """Test None fields leave stored values unchanged."""
+        rows = save_action_items([{"title": "A", "assignee": "John", "due_date": "Jan 15"}])
+
+        updated = update_action_items([{"id": rows[0]["id"], "selected": False}])
+
+        assert updated[0]["selected"] == 0
+        assert updated[0]["assignee"] == "John"
+        assert updated[0]["due_date"] == "Jan 15"
+
+    def test_complete_action_items(self, isolated_test_db):
+        """Test batch completion sets ticket keys and skips unknown IDs."""
+        rows = save_action_items([{"title": "A"}, {"title": "B"}])
+
+        completed = complete_action_items([(rows[0]["id"], "SANAS-1"), (9999, None)])
+
+        assert completed == [rows[0]["id"]]
+        assert [p["title"] for p in get_pending_action_items()] == ["B"]
+
+    def test_delete_action_items(self, isolated_test_db):
+        """Test batch delete returns only IDs that existed."""
+        rows = save_action_items([{"title": "A"}, {"title": "B"}])
+
+        deleted = delete_action_items([rows[0]["id"], 9999])
+
+        assert deleted == [rows[0]["id"]]
+        assert get_analytics_data()["pending_count"] == 1
+
+
 class TestAnalyticsData:
     """Tests for analytics data retrieval."""
 
@@ -238,3 +303,1040 @@ class TestAnalyticsData:
         assert data["pending_count"] == 3
         assert data["overdue_count"] == 1
         assert len(data["team_stats"]) == 2
+
+    def test_get_analytics_data_counts_unassigned_items(self, isolated_test_db):
+        """Test unassigned items count toward totals but not the leaderboard."""
+        save_action_item("Unassigned", None, None, True, True)
+        save_action_item("Assigned", "John", None, True, False)
+
+        data = get_analytics_data()
+
+        assert data["pending_count"] == 2
+        assert data["overdue_count"] == 1
+        assert data["active_members"] == 1
+        assert [s["assignee"] for s in data["team_stats"]] == ["John"]
+
+    def test_get_analytics_data_orders_by_completed(self, isolated_test_db):
+        """Test team stats are sorted by completions this week."""
+        save_action_item("Task 1", "John", None)
+        done = save_action_item("Task 2", "Sarah", None)
+        mark_action_item_completed(done["id"])
+
+        data = get_analytics_data()
+
+        assert data["completed_this_week"] == 1
+        assert data["active_members"] == 1
+        assert data["team_stats"][0]["assignee"] == "Sarah"
+        assert data["team_stats"][0]["completion_rate"] == 100
+
+
+class TestConnectionPool:
+    """Tests for the pooled connection layer."""
+
+    def test_pool_is_reused_across_calls(self, isolated_test_db):
+        """Test helpers share one pool instead of reconnecting."""
+        pool = database.get_pool()
+        get_all_team_members()
+        get_user_settings()
+
+        assert database.get_pool() is pool
+
+    def test_pool_applies_tuning_pragmas(self, isolated_test_db):
+        """Test pooled connections use WAL and relaxed synchronous mode."""
+        with database.get_read_db() as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert busy_timeout > 0
+
+    def test_reader_connections_are_read_only(self, isolated_test_db):
+        """Test reader connections reject writes."""
+        import sqlite3
+
+        with database.get_read_db() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM team_members")
+
+    def test_reader_sees_committed_writes(self, isolated_test_db):
+        """Test a reader observes data committed by the writer."""
+        save_action_item("Pooled Task", "John", None, True, False)
+
+        with database.get_read_db() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM action_items").fetchone()[0]
+
+        assert count == 1
+
+    def test_pool_follows_db_path_changes(self, isolated_test_db, tmp_path):
+        """Test the pool is rebuilt when DB_PATH is repointed."""
+        first = database.get_pool()
+        database.DB_PATH = tmp_path / "other.db"
+
+        second = database.get_pool()
+
+        assert second is not first
+        assert second.db_path == tmp_path / "other.db"
+
+
+class TestActionItemIndexes:
+    """Tests for the managed action_items index set."""
+
+    @staticmethod
+    def _plan(sql: str) -> str:
+        """Return the EXPLAIN QUERY PLAN details for a statement."""
+        with database.get_read_db() as conn:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        return " | ".join(row[3] for row in rows)
+
+    def test_init_db_creates_managed_indexes(self, isolated_test_db):
+        """Test every managed index exists after init."""
+        with database.get_read_db() as conn:
+            names = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'action_items'"
+                )
+            }
+
+        assert set(database.ACTION_ITEM_INDEXES) <= names
+
+    def test_init_db_drops_retired_indexes(self, isolated_test_db):
+        """Test indexes outside the managed set are removed on init."""
+        with database.get_db() as conn:
+            conn.execute("CREATE INDEX idx_action_items_retired ON action_items (title)")
+
+        init_db()
+
+        with database.get_read_db() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'idx_action_items_retired'"
+            ).fetchone()
+        assert row is None
+
+    def test_pending_listing_uses_partial_index(self, isolated_test_db):
+        """Test pending items are read in order from the partial index."""
+        plan = self._plan(
+            "SELECT * FROM action_items WHERE completed_at IS NULL ORDER BY created_at DESC"
+        )
+
+        assert "idx_action_items_pending" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_completed_range_uses_completed_index(self, isolated_test_db):
+        """Test completion date ranges are index range scans."""
+        plan = self._plan(
+            "SELECT COUNT(*) FROM action_items WHERE completed_at IS NOT NULL "
+            "AND completed_at >= 1700000000"
+        )
+
+        assert "COVERING INDEX idx_action_items_completed_at" in plan
+
+    def test_leaderboard_uses_covering_index(self, isolated_test_db):
+        """Test per-assignee grouping never reads the table."""
+        plan = self._plan(
+            "SELECT assignee_id, SUM(CASE WHEN completed_at IS NULL AND overdue = 1 THEN 1 ELSE 0 END), "
+            "COUNT(*) FROM action_items GROUP BY assignee_id"
+        )
+
+        assert "COVERING INDEX idx_action_items_assignee_id_status" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestAnalyticsCounters:
+    """Tests for the trigger-maintained analytics counters."""
+
+    @staticmethod
+    def _counters() -> tuple[tuple, list[tuple]]:
+        """Read the global and per-assignee counters."""
+        with database.get_read_db() as conn:
+            totals = tuple(conn.execute(
+                "SELECT total, pending, overdue FROM analytics_counters WHERE id = 1"
+            ).fetchone())
+            per_assignee = [
+                tuple(row)
+                for row in conn.execute(
+                    "SELECT COALESCE(m.name, c.assignee), c.total, c.pending, c.overdue "
+                    "FROM assignee_counters AS c "
+                    "LEFT JOIN team_members AS m ON m.id = c.assignee_id "
+                    "WHERE c.total > 0 ORDER BY 1"
+                )
+            ]
+        return totals, per_assignee
+
+    def test_counters_track_inserts(self, isolated_test_db):
+        """Test inserts increment totals, pending and overdue."""
+        save_action_item("Task 1", "John", None, True, True)
+        save_action_item("Task 2", None, None, True, False)
+
+        totals, per_assignee = self._counters()
+
+        assert totals == (2, 2, 1)
+        assert per_assignee == [("John", 1, 1, 1)]
+
+    def test_counters_track_completion_and_reassignment(self, isolated_test_db):
+        """Test updates move rows between counter buckets."""
+        item = save_action_item("Task", "John", None, True, True)
+        mark_action_item_completed(item["id"])
+        with database.get_db() as conn:
+            conn.execute("UPDATE action_items SET assignee = 'Sarah' WHERE id = ?", (item["id"],))
+
+        totals, per_assignee = self._counters()
+
+        assert totals == (1, 0, 0)
+        assert per_assignee == [("Sarah", 1, 0, 0)]
+
+    def test_counters_track_deletes(self, isolated_test_db):
+        """Test deletes decrement the counters."""
+        item = save_action_item("Task", "John", None)
+        with database.get_db() as conn:
+            conn.execute("DELETE FROM action_items WHERE id = ?", (item["id"],))
+
+        totals, per_assignee = self._counters()
+
+        assert totals == (0, 0, 0)
+        assert per_assignee == []
+
+    def test_rebuild_matches_trigger_maintained_counters(self, isolated_test_db):
+        """Test a full rebuild agrees with incremental maintenance."""
+        save_action_item("Task 1", "John", None, True, True)
+        done = save_action_item("Task 2", "Sarah", None)
+        mark_action_item_completed(done["id"])
+        before = self._counters()
+
+        with database.get_db() as conn:
+            database.rebuild_analytics_counters(conn.cursor())
+
+        assert self._counters() == before
+
+
+class TestDailyCompletions:
+    """Tests for the daily completion rollup."""
+
+    def test_completion_updates_rollup(self, isolated_test_db):
+        """Test completing an item increments today's bucket."""
+        item = save_action_item("Task", "John", None)
+        mark_action_item_completed(item["id"])
+
+        with database.get_read_db() as conn:
+            today = conn.execute("SELECT date('now')").fetchone()[0]
+
+        assert database.get_daily_completions(today, today) == {today: 1}
+
+    def test_rollup_windows_leaderboard(self, isolated_test_db):
+        """Test the leaderboard window excludes completions outside it."""
+        item = save_action_item("Task", "John", None)
+        mark_action_item_completed(item["id"])
+
+        data = get_analytics_data("2000-01-01", "2000-01-31")
+
+        assert data["team_stats"][0]["completed_this_week"] == 0
+        assert data["completed_this_week"] == 1
+
+
+class TestEpochTimestamps:
+    """Tests for integer epoch timestamps and the legacy migration."""
+
+    def test_timestamps_are_integers(self, isolated_test_db):
+        """Test new rows store created_at/completed_at as epoch seconds."""
+        item = save_action_item("Task", "John", None)
+        mark_action_item_completed(item["id"])
+
+        with database.get_read_db() as conn:
+            row = conn.execute(
+                "SELECT typeof(created_at), typeof(completed_at), created_at FROM action_items"
+            ).fetchone()
+
+        assert row[0] == "integer"
+        assert row[1] == "integer"
+        assert row[2] > 1_600_000_000
+
+    def test_legacy_text_timestamps_migrated(self, isolated_test_db, tmp_path):
+        """Test init_db converts a legacy text-timestamp table in place."""
+        import sqlite3
+
+        legacy_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(legacy_path)
+        legacy.execute("""
+            CREATE TABLE action_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                assignee TEXT,
+                due_date TEXT,
+                selected INTEGER DEFAULT 1,
+                overdue INTEGER DEFAULT 0,
+                ticket_key TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                completed_at TIMESTAMP
+            )
+        """)
+        legacy.executemany(
+            "INSERT INTO action_items (title, assignee, created_at, completed_at) VALUES (?, ?, ?, ?)",
+            [
+                ("Old pending", "John", "2025-01-10 09:30:00", None),
+                ("Old done", "John", "2025-01-10 09:30:00", "2025-01-12 17:00:00"),
+            ],
+        )
+        legacy.commit()
+        legacy.close()
+
+        database.DB_PATH = legacy_path
+        init_db()
+
+        with database.get_read_db() as conn:
+            rows = conn.execute(
+                "SELECT title, created_at, completed_at FROM action_items ORDER BY id"
+            ).fetchall()
+            column_type = conn.execute(
+                "SELECT type FROM pragma_table_info('action_items') WHERE name = 'created_at'"
+            ).fetchone()[0]
+
+        assert column_type == "INTEGER"
+        assert [tuple(r) for r in rows] == [
+            ("Old pending", 1736501400, None),
+            ("Old done", 1736501400, 1736701200),
+        ]
+        assert database.get_daily_completions("2025-01-12", "2025-01-12") == {"2025-01-12": 1}
+        assert get_analytics_data()["pending_count"] == 1
+        assert len(get_pending_action_items()) == 1
+
+    def test_writes_during_copy_reach_the_swapped_table(self, isolated_test_db, tmp_path,
+                                                        monkeypatch):
+        """Test the batched copy keeps writes made between batches, then swaps."""
+        import sqlite3
+
+        monkeypatch.setattr(database.app_settings, "migration_batch_size", 1)
+        monkeypatch.setattr(database.app_settings, "migration_pause_ms", 0)
+        legacy_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(legacy_path)
+        legacy.executescript("""
+            CREATE TABLE action_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, assignee TEXT,
+                due_date TEXT, selected INTEGER DEFAULT 1, overdue INTEGER DEFAULT 0,
+                ticket_key TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                completed_at TIMESTAMP
+            );
+            INSERT INTO action_items (title, created_at) VALUES
+                ('First', '2025-01-10 09:30:00'), ('Second', '2025-01-10 09:30:00'),
+                ('Third', '2025-01-10 09:30:00');
+        """)
+        legacy.commit()
+        legacy.close()
+        database.DB_PATH = legacy_path
+        copy = database._copy_epoch_batch
+        calls = []
+
+        def copy_with_writes(cursor, after_id, last_id):
+            calls.append(last_id)
+            if len(calls) == 2:
+                cursor.execute("UPDATE action_items SET title = 'First edited' WHERE id = 1")
+                cursor.execute("DELETE FROM action_items WHERE id = 3")
+                cursor.execute("INSERT INTO action_items (title) VALUES ('Fourth')")
+            return copy(cursor, after_id, last_id)
+
+        monkeypatch.setattr(database, "_copy_epoch_batch", copy_with_writes)
+        init_db(migrate=False)
+        with database.get_db() as conn:
+            phase_one_type = conn.execute(
+                "SELECT type FROM pragma_table_info('action_items') WHERE name = 'created_at'"
+            ).fetchone()[0]
+
+        database.run_migrations()
+
+        with database.get_read_db() as conn:
+            rows = conn.execute(
+                "SELECT id, title, typeof(created_at) FROM action_items ORDER BY id"
+            ).fetchall()
+        assert phase_one_type == "TIMESTAMP"
+        assert [tuple(row) for row in rows] == [
+            (1, "First edited", "integer"), (2, "Second", "integer"), (4, "Fourth", "integer"),
+        ]
+        assert save_action_item("Fifth", None, None)["id"] == 5
+        assert [r[1] for r in database.search_action_item_rows("edited")] == ["First edited"]
+
+
+class TestDueDatesAndOverdueSweep:
+    """Tests for the ISO due_on column and the overdue sweeper."""
+
+    def test_save_normalizes_due_on(self, isolated_test_db):
+        """Test saving an item stores the parsed ISO due date."""
+        item = save_action_item("Task", "John", "2025-01-15")
+
+        assert item["due_on"] == "2025-01-15"
+
+    def test_batch_update_recomputes_due_on(self, isolated_test_db):
+        """Test changing due_date recomputes due_on; other updates keep it."""
+        rows = save_action_items([{"title": "Task", "due_date": "2025-01-15"}])
+
+        kept = update_action_items([{"id": rows[0]["id"], "title": "Renamed"}])
+        changed = update_action_items([{"id": rows[0]["id"], "due_date": "2025-02-01"}])
+
+        assert kept[0]["due_on"] == "2025-01-15"
+        assert changed[0]["due_on"] == "2025-02-01"
+
+    def test_sweep_flags_past_due_pending_items(self, isolated_test_db):
+        """Test the sweep flags only pending items due before today."""
+        from datetime import date
+
+        late = save_action_item("Late", "John", "2025-01-10")
+        save_action_item("Future", "John", "2025-03-01")
+        done = save_action_item("Done", "John", "2025-01-05")
+        mark_action_item_completed(done["id"])
+
+        flagged = database.sweep_overdue_action_items(today=date(2025, 2, 1))
+
+        assert flagged == 1
+        overdue = [p["id"] for p in get_pending_action_items() if p["overdue"]]
+        assert overdue == [late["id"]]
+        assert get_analytics_data()["overdue_count"] == 1
+        assert database.sweep_overdue_action_items(today=date(2025, 2, 1)) == 0
+
+    def test_init_backfills_due_on(self, isolated_test_db):
+        """Test init_db parses due_on for rows saved before the due_on migration."""
+        item = save_action_item("Task", "John", "2025-01-15")
+        with database.get_db() as conn:
+            conn.execute("UPDATE action_items SET due_on = NULL WHERE id = ?", (item["id"],))
+            conn.execute("PRAGMA user_version = 1")
+
+        init_db()
+
+        assert get_pending_action_items()[0]["due_on"] == "2025-01-15"
+
+
+class TestActionItemSearch:
+    """Tests for full-text search over action item titles."""
+
+    def test_build_search_query_quotes_words(self):
+        """Test user text becomes quoted terms with a trailing prefix match."""
+        assert database.build_search_query("budget rev") == '"budget" "rev"*'
+        assert database.build_search_query('NOT "x" OR y-') == '"NOT" "x" "OR" "y"*'
+        assert database.build_search_query("  ?! ") is None
+
+    def test_search_ranks_and_matches_prefixes(self, isolated_test_db):
+        """Test results are ranked and the last word matches as a prefix."""
+        weak = save_action_item("Review budget draft for the quarterly offsite", "John", None)
+        strong = save_action_item("Budget budget", "Sarah", None)
+        save_action_item("Book venue", "John", None)
+
+        rows = database.search_action_item_rows("budg")
+
+        assert [row[0] for row in rows] == [strong["id"], weak["id"]]
+        assert rows[0][-1] <= rows[1][-1]
+
+    def test_search_is_case_and_accent_insensitive(self, isolated_test_db):
+        """Test matching ignores case and diacritics."""
+        item = save_action_item("Update Café menu", "John", None)
+
+        assert [row[0] for row in database.search_action_item_rows("cafe")] == [item["id"]]
+
+    def test_search_filters_by_assignee_and_status(self, isolated_test_db):
+        """Test the assignee and status filters narrow the matches."""
+        johns = save_action_item("Fix login bug", "John", None)
+        sarahs = save_action_item("Fix signup bug", "Sarah", None)
+        mark_action_item_completed(sarahs["id"])
+
+        by_assignee = database.search_action_item_rows("bug", assignee="John")
+        pending = database.search_action_item_rows("bug", status="pending")
+        completed = database.search_action_item_rows("bug", status="completed")
+
+        assert [row[0] for row in by_assignee] == [johns["id"]]
+        assert [row[0] for row in pending] == [johns["id"]]
+        assert [row[0] for row in completed] == [sarahs["id"]]
+        with pytest.raises(ValueError):
+            database.search_action_item_rows("bug", status="archived")
+
+    def test_search_paginates(self, isolated_test_db):
+        """Test limit and offset walk the ranked results without overlap."""
+        save_action_items([{"title": f"Sync item {n}"} for n in range(5)])
+
+        first = database.search_action_item_rows("sync", limit=3)
+        rest = database.search_action_item_rows("sync", limit=3, offset=3)
+
+        ids = [row[0] for row in first + rest]
+        assert len(first) == 3 and len(rest) == 2
+        assert len(set(ids)) == 5
+
+    def test_index_follows_updates_and_deletes(self, isolated_test_db):
+        """Test the triggers keep the index in step with title changes."""
+        rows = save_action_items([{"title": "Draft roadmap"}, {"title": "Draft memo"}])
+
+        update_action_items([{"id": rows[0]["id"], "title": "Publish roadmap"}])
+        database.delete_action_items([rows[1]["id"]])
+
+        assert database.search_action_item_rows("draft") == []
+        assert [r[0] for r in database.search_action_item_rows("publish")] == [rows[0]["id"]]
+        with database.get_db() as conn:
+            conn.execute(
+                "INSERT INTO action_items_fts (action_items_fts) VALUES ('integrity-check')"
+            )
+
+    def test_archived_items_stay_searchable(self, isolated_test_db):
+        """Test archiving keeps an item's postings and search reads it from the archive."""
+        old = save_action_item("Archived budget", "John", None)
+        save_action_item("Pending budget", "John", None)
+        _complete_at(old["id"], 1_600_000_000)
+
+        database.archive_completed_action_items(older_than_days=1)
+
+        rows = database.search_action_item_rows("budget", status="completed")
+        assert [(row[0], row[1], row[-2]) for row in rows] == [
+            (old["id"], "Archived budget", 1_600_000_000)
+        ]
+        assert len(database.search_action_item_rows("budget")) == 2
+        with database.get_db() as conn:
+            conn.execute(
+                "INSERT INTO action_items_fts (action_items_fts) VALUES ('integrity-check')"
+            )
+
+    def test_live_only_index_rebuilt_with_archive(self, isolated_test_db):
+        """Test an index over action_items alone is replaced by one covering the archive."""
+        old = save_action_item("Archived memo", "John", None)
+        _complete_at(old["id"], 1_600_000_000)
+        database.archive_completed_action_items(older_than_days=1)
+        with database.get_db() as conn:
+            conn.executescript(f"""
+                DROP TABLE action_items_fts;
+                CREATE VIRTUAL TABLE action_items_fts USING fts5(
+                    title, content='action_items', content_rowid='id',
+                    tokenize='{database.SEARCH_TOKENIZER}'
+                );
+                INSERT INTO action_items_fts (action_items_fts) VALUES ('rebuild');
+                PRAGMA user_version = 5;
+            """)
+
+        init_db()
+
+        assert [r[0] for r in database.search_action_item_rows("memo")] == [old["id"]]
+
+    def test_new_index_filled_by_backfill(self, isolated_test_db):
+        """Test a recreated index is filled by the backfill, not during init_db."""
+        items = save_action_items([{"title": "Legacy memo"}, {"title": "Legacy note"}])
+        with database.get_db() as conn:
+            conn.execute("DROP TABLE action_items_fts")
+
+        init_db(migrate=False)
+        before = database.search_action_item_rows("legacy")
+        update_action_items([{"id": items[0]["id"], "title": "Legacy memo v2"}])
+        database.delete_action_items([items[1]["id"]])
+        save_action_item("Legacy plan", None, None)
+        database.run_migrations()
+
+        assert before == []
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+        assert sorted(r[1] for r in database.search_action_item_rows("legacy")) == [
+            "Legacy memo v2", "Legacy plan"
+        ]
+        with database.get_db() as conn:
+            conn.execute(
+                "INSERT INTO action_items_fts (action_items_fts) VALUES ('integrity-check')"
+            )
+
+    def test_init_builds_index_for_existing_items(self, isolated_test_db):
+        """Test init_db indexes items saved before the search index existed."""
+        item = save_action_item("Legacy task", "John", None)
+        with database.get_db() as conn:
+            conn.execute("DROP TABLE action_items_fts")
+
+        init_db()
+
+        assert [r[0] for r in database.search_action_item_rows("legacy")] == [item["id"]]
+
+    def test_search_uses_fts_index(self, isolated_test_db):
+        """Test the search plan scans the FTS index and looks rows up by id."""
+        with database.get_db() as conn:
+            plan = " ".join(
+                row[3] for row in conn.execute(
+                    """EXPLAIN QUERY PLAN
+                       SELECT a.id FROM action_items_fts
+                       JOIN action_items AS a ON a.id = action_items_fts.rowid
+                       WHERE action_items_fts MATCH ? ORDER BY action_items_fts.rank""",
+                    ('"x"*',)
+                )
+            )
+
+        assert "VIRTUAL TABLE INDEX" in plan
+        assert "INTEGER PRIMARY KEY" in plan
+
+
+def _complete_at(item_id: int, completed_at: int) -> None:
+    """Mark an item completed at a fixed epoch second."""
+    with database.get_db() as conn:
+        conn.execute(
+            "UPDATE action_items SET completed_at = ? WHERE id = ?", (completed_at, item_id)
+        )
+
+
+class TestArchival:
+    """Tests for archiving completed items and reading history."""
+
+    NOW = 1_750_000_000
+    DAY = 86400
+
+    def _seed(self):
+        """Create two old completions, one recent completion and one pending item."""
+        old = [save_action_item(f"Old {n}", "John", None) for n in range(2)]
+        recent = save_action_item("Recent", "Sarah", None)
+        pending = save_action_item("Pending", "John", None)
+        _complete_at(old[0]["id"], self.NOW - 200 * self.DAY)
+        _complete_at(old[1]["id"], self.NOW - 100 * self.DAY)
+        _complete_at(recent["id"], self.NOW - 5 * self.DAY)
+        return old, recent, pending
+
+    def test_moves_only_old_completed_items(self, isolated_test_db):
+        """Test items completed before the cutoff move; everything else stays."""
+        old, recent, pending = self._seed()
+
+        archived = database.archive_completed_action_items(
+            older_than_days=90, batch_size=1, now=self.NOW
+        )
+
+        with database.get_db() as conn:
+            hot = {row[0] for row in conn.execute("SELECT id FROM action_items")}
+            cold = {row[0] for row in conn.execute("SELECT id FROM action_items_archive")}
+        assert archived == 2
+        assert hot == {recent["id"], pending["id"]}
+        assert cold == {item["id"] for item in old}
+        assert database.archive_completed_action_items(90, now=self.NOW) == 0
+
+    def test_archiving_keeps_analytics_and_rollups(self, isolated_test_db):
+        """Test counters, rollups and rebuilt counters ignore archiving."""
+        self._seed()
+        start, end = "2024-01-01", "2026-01-01"
+        before = (get_analytics_data(start, end), database.get_daily_completions(start, end))
+
+        database.archive_completed_action_items(older_than_days=90, now=self.NOW)
+        after = (get_analytics_data(start, end), database.get_daily_completions(start, end))
+        with database.get_db() as conn:
+            database.rebuild_analytics_counters(conn.cursor())
+        rebuilt = (get_analytics_data(start, end), database.get_daily_completions(start, end))
+
+        assert after == before
+        assert rebuilt == before
+
+    def test_history_merges_hot_and_archived_items(self, isolated_test_db):
+        """Test history pages through both tables, most recent first."""
+        old, recent, _ = self._seed()
+        database.archive_completed_action_items(older_than_days=90, now=self.NOW)
+
+        first = database.get_action_item_history(limit=2)
+        last = first[-1]
+        rest = database.get_action_item_history(limit=2, after=(last[6], last[0]))
+
+        assert [(row[0], row[-1]) for row in first + rest] == [
+            (recent["id"], 0), (old[1]["id"], 1), (old[0]["id"], 1)
+        ]
+
+    def test_history_filters(self, isolated_test_db):
+        """Test assignee and completion day filters apply to both tables."""
+        old, recent, _ = self._seed()
+        database.archive_completed_action_items(older_than_days=90, now=self.NOW)
+        from datetime import datetime, UTC
+
+        day = datetime.fromtimestamp(self.NOW - 100 * self.DAY, UTC).date().isoformat()
+
+        by_assignee = database.get_action_item_history(limit=10, assignee="Sarah")
+        by_day = database.get_action_item_history(limit=10, start=day, end=day)
+
+        assert [row[0] for row in by_assignee] == [recent["id"]]
+        assert [row[0] for row in by_day] == [old[1]["id"]]
+
+
+class TestAssigneeIds:
+    """Tests for assignee_id links between action items and team members."""
+
+    @staticmethod
+    def _assignee_ids() -> dict[str, int | None]:
+        """assignee_id of every live and archived item, keyed by title."""
+        with database.get_read_db() as conn:
+            rows = conn.execute(
+                "SELECT title, assignee_id FROM action_items "
+                "UNION ALL SELECT title, assignee_id FROM action_items_archive"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def test_names_resolve_to_members(self, isolated_test_db):
+        """Test saves and reassignments resolve names case-insensitively."""
+        john = save_action_item("Single", "john smith", None)
+        batch = save_action_items([{"title": "Batch", "assignee": "Sarah Lee"},
+                                   {"title": "Stranger", "assignee": "Nobody"}])
+
+        moved = update_action_items([{"id": john["id"], "assignee": "Muthu K"}])
+
+        assert john["assignee_id"] == 1
+        assert [row["assignee_id"] for row in batch] == [2, None]
+        assert moved[0]["assignee_id"] == 3
+        assert update_action_items([{"id": john["id"], "title": "Renamed"}])[0]["assignee_id"] == 3
+
+    def test_unresolved_names_keep_derived_initials(self, isolated_test_db):
+        """Test names not on the roster rank under their name, with no assignee_id."""
+        save_action_item("Known", "John Smith", None)
+        save_action_item("Stranger", "Nobody Special", None)
+
+        data = get_analytics_data()
+
+        assert data["pending_count"] == 2
+        assert data["active_members"] == 2
+        assert [(s["assignee_id"], s["assignee"], s["initials"]) for s in data["team_stats"]] == [
+            (1, "John Smith", "JS"), (None, "Nobody Special", "NS")
+        ]
+
+    def test_new_member_claims_items(self, isolated_test_db):
+        """Test adding a member links live items already assigned to the name."""
+        save_action_item("Early task", "Ada Lovelace", None)
+
+        member = create_team_member("Ada Lovelace", None, None, None, None)
+
+        data = get_analytics_data()
+        assert self._assignee_ids()["Early task"] == member["id"]
+        assert [(s["assignee"], s["initials"]) for s in data["team_stats"]] == [
+            ("Ada Lovelace", "AL")
+        ]
+
+    def test_rename_follows_into_history(self, isolated_test_db):
+        """Test renaming a member renames their live and archived items."""
+        old = save_action_item("Old", "John Smith", None)
+        save_action_item("Pending", "John Smith", None)
+        _complete_at(old["id"], 1_600_000_000)
+        database.archive_completed_action_items(older_than_days=1)
+
+        update_team_member(1, name="Jon Smith")
+
+        history = database.get_action_item_history(limit=10, assignee="Jon Smith")
+        assert [row[1] for row in history] == ["Old"]
+        assert [item["assignee"] for item in get_pending_action_items()] == ["Jon Smith"]
+        assert get_analytics_data()["team_stats"][0]["assignee"] == "Jon Smith"
+
+    def test_deleting_member_unlinks_items(self, isolated_test_db):
+        """Test deleting a member keeps the items, ranked by name, but drops the link."""
+        save_action_item("Orphan", "Sarah Lee", None, True, True)
+
+        delete_team_member(2)
+
+        data = get_analytics_data()
+        assert self._assignee_ids() == {"Orphan": None}
+        assert get_pending_action_items()[0]["assignee"] == "Sarah Lee"
+        assert (data["pending_count"], data["overdue_count"]) == (1, 1)
+        assert [(s["assignee_id"], s["assignee"], s["initials"]) for s in data["team_stats"]] == [
+            (None, "Sarah Lee", "SL")
+        ]
+
+    def test_leaderboard_joins_members_by_key(self, isolated_test_db):
+        """Test the leaderboard query looks members up by primary key."""
+        with database.get_read_db() as conn:
+            plan = " ".join(
+                row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT c.assignee_id, m.name FROM assignee_counters AS c "
+                    "LEFT JOIN team_members AS m ON m.id = c.assignee_id WHERE c.total > 0"
+                )
+            )
+
+        assert "USING INTEGER PRIMARY KEY" in plan
+
+    def test_id_keyed_counters_migrated(self, isolated_test_db):
+        """Test counters keyed by assignee_id alone are re-keyed and refilled."""
+        save_action_item("Known", "John Smith", None)
+        save_action_item("Stranger", "Nobody", None)
+        with database.get_db() as conn:
+            conn.executescript("""
+                DROP TABLE assignee_counters;
+                CREATE TABLE assignee_counters (
+                    assignee_id INTEGER PRIMARY KEY, total INTEGER, pending INTEGER, overdue INTEGER
+                );
+                DROP TABLE daily_completions;
+                CREATE TABLE daily_completions (
+                    day TEXT, assignee_id INTEGER, completed INTEGER, PRIMARY KEY (day, assignee_id)
+                ) WITHOUT ROWID;
+                PRAGMA user_version = 4;
+            """)
+
+        init_db()
+
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+        assert [s["assignee"] for s in get_analytics_data()["team_stats"]] == [
+            "John Smith", "Nobody"
+        ]
+
+    def test_name_keyed_database_migrated(self, isolated_test_db, tmp_path):
+        """Test init_db backfills assignee_id and re-keys name-keyed counters."""
+        import sqlite3
+
+        legacy_path = tmp_path / "names.db"
+        legacy = sqlite3.connect(legacy_path)
+        legacy.executescript(f"""
+            CREATE TABLE team_members (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL,
+                initials TEXT NOT NULL, slack_id TEXT, jira_account_id TEXT, email TEXT
+            );
+            INSERT INTO team_members (name, initials) VALUES ('John Smith', 'JS'), ('Sarah Lee', 'SL');
+            CREATE TABLE action_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, assignee TEXT,
+                due_date TEXT, due_on TEXT, selected INTEGER DEFAULT 1, overdue INTEGER DEFAULT 0,
+                ticket_key TEXT, created_at INTEGER NOT NULL DEFAULT ({database.NOW_EPOCH_SQL}),
+                completed_at INTEGER
+            );
+            CREATE TABLE action_items_archive (
+                id INTEGER PRIMARY KEY, title TEXT NOT NULL, assignee TEXT, due_date TEXT,
+                due_on TEXT, selected INTEGER DEFAULT 1, overdue INTEGER DEFAULT 0,
+                ticket_key TEXT, created_at INTEGER NOT NULL, completed_at INTEGER NOT NULL,
+                archived_at INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE analytics_counters (
+                id INTEGER PRIMARY KEY, total INTEGER, pending INTEGER, overdue INTEGER
+            );
+            INSERT INTO analytics_counters VALUES (1, 3, 2, 0);
+            CREATE TABLE assignee_counters (
+                assignee TEXT PRIMARY KEY, total INTEGER, pending INTEGER, overdue INTEGER
+            );
+            INSERT INTO assignee_counters VALUES ('John Smith', 2, 1, 0), ('Ghost', 1, 1, 0);
+            CREATE TABLE daily_completions (
+                day TEXT, assignee TEXT, completed INTEGER, PRIMARY KEY (day, assignee)
+            ) WITHOUT ROWID;
+            INSERT INTO action_items (title, assignee, created_at)
+                VALUES ('Live', 'JOHN SMITH', 1700000000), ('Ghostly', 'Ghost', 1700000000);
+            INSERT INTO action_items_archive (id, title, assignee, created_at, completed_at)
+                VALUES (10, 'Archived', 'Sarah Lee', 1600000000, 1600000000);
+        """)
+        legacy.commit()
+        legacy.close()
+
+        database.DB_PATH = legacy_path
+        init_db()
+
+        data = get_analytics_data("2020-09-13", "2020-09-13")
+        assert self._assignee_ids() == {"Live": 1, "Ghostly": None, "Archived": 2}
+        assert (data["pending_count"], data["active_members"]) == (2, 2)
+        assert [(s["assignee"], s["total"], s["completed_this_week"]) for s in data["team_stats"]] == [
+            ("Sarah Lee", 1, 1), ("Ghost", 1, 0), ("John Smith", 1, 0)
+        ]
+        with database.get_read_db() as conn:
+            assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+
+
+class TestSchemaMigrations:
+    """Tests for the user_version migration runner."""
+
+    def _null_due_dates(self, count: int) -> None:
+        """Save items, then roll them back to before the due_on migration."""
+        save_action_items([{"title": f"Task {n}", "due_date": "2025-01-15"} for n in range(count)])
+        with database.get_db() as conn:
+            conn.execute("UPDATE action_items SET due_on = NULL")
+            conn.execute("PRAGMA user_version = 1")
+
+    def test_new_database_starts_at_schema_version(self, isolated_test_db):
+        """Test a database created from scratch needs no migrations."""
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+        assert [m[0] for m in database.MIGRATIONS] == list(range(1, database.SCHEMA_VERSION + 1))
+
+    def test_applied_migrations_do_not_rerun(self, isolated_test_db):
+        """Test init_db on an up-to-date database skips the backfills."""
+        item = save_action_item("Task", "John", "2025-01-15")
+        with database.get_db() as conn:
+            conn.execute("UPDATE action_items SET due_on = NULL WHERE id = ?", (item["id"],))
+
+        init_db()
+
+        assert get_pending_action_items()[0]["due_on"] is None
+
+    def test_backfill_runs_in_batches(self, isolated_test_db, monkeypatch, caplog):
+        """Test a backfill commits one bounded id range at a time."""
+        monkeypatch.setattr(database.app_settings, "migration_batch_size", 2)
+        monkeypatch.setattr(database.app_settings, "migration_pause_ms", 0)
+        self._null_due_dates(5)
+
+        with caplog.at_level("INFO", logger="app.database"):
+            init_db()
+
+        assert "Backfilled 5 action_items rows in 3 batches" in caplog.text
+        assert {item["due_on"] for item in get_pending_action_items()} == {"2025-01-15"}
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+
+    def test_interrupted_backfill_resumes(self, isolated_test_db, monkeypatch):
+        """Test a failed backfill keeps finished batches and its version, then resumes."""
+        monkeypatch.setattr(database.app_settings, "migration_batch_size", 2)
+        monkeypatch.setattr(database.app_settings, "migration_pause_ms", 0)
+        self._null_due_dates(5)
+        parse = database.parse_due_date
+        calls = []
+
+        def failing_parse(text, today):
+            calls.append(text)
+            if len(calls) > 2:
+                raise RuntimeError("interrupted")
+            return parse(text, today)
+
+        monkeypatch.setattr(database, "parse_due_date", failing_parse)
+        with pytest.raises(RuntimeError):
+            init_db()
+        with database.get_read_db() as conn:
+            done = conn.execute("SELECT COUNT(*) FROM action_items WHERE due_on IS NOT NULL").fetchone()[0]
+        assert (done, database.get_schema_version()) == (2, 1)
+
+        monkeypatch.setattr(database, "parse_due_date", parse)
+        init_db()
+
+        assert {item["due_on"] for item in get_pending_action_items()} == {"2025-01-15"}
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+
+    def _claim(self, version: int, owner: str, age_seconds: float) -> None:
+        """Record another worker's claim on a migration, last renewed age_seconds ago."""
+        import time
+
+        with database.get_db() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO migration_claims (version, owner, heartbeat) VALUES (?, ?, ?)",
+                (version, owner, int(time.time() - age_seconds)),
+            )
+
+    def test_migration_claimed_by_another_worker_is_left_to_it(self, isolated_test_db):
+        """Test a live claim stops this worker before the backfill and later migrations."""
+        self._null_due_dates(2)
+        self._claim(2, "other-worker", age_seconds=0)
+
+        applied = database.run_migrations()
+
+        assert applied == []
+        assert database.get_schema_version() == 1
+        assert {item["due_on"] for item in get_pending_action_items()} == {None}
+
+    def test_expired_claim_is_taken_over(self, isolated_test_db):
+        """Test a claim its worker stopped renewing is taken over and completed."""
+        self._null_due_dates(2)
+        self._claim(2, "dead-worker", age_seconds=database.MIGRATION_CLAIM_TIMEOUT_SECONDS + 1)
+
+        applied = database.run_migrations()
+
+        assert applied == [2, 3, 4, 5, 6]
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+        with database.get_read_db() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM migration_claims").fetchone()[0] == 0
+
+    def test_migration_applied_meanwhile_is_not_rerun(self, isolated_test_db, monkeypatch):
+        """Test the claim re-checks user_version under the write lock."""
+        self._null_due_dates(2)
+        claim = database._claim_migration
+        backfills = []
+
+        def applied_by_another_worker(version, stop):
+            with database.get_db() as conn:
+                conn.execute(f"PRAGMA user_version = {database.SCHEMA_VERSION}")
+            return claim(version, stop)
+
+        monkeypatch.setattr(database, "_claim_migration", applied_by_another_worker)
+        monkeypatch.setattr(database, "_backfill_due_on", lambda c: backfills.append(c))
+
+        assert database.run_migrations() == []
+        assert backfills == []
+
+    def test_stop_keeps_finished_batches(self, isolated_test_db, monkeypatch):
+        """Test a stop ends the backfill after its batch, releases the claim and resumes later."""
+        import threading
+
+        monkeypatch.setattr(database.app_settings, "migration_batch_size", 2)
+        monkeypatch.setattr(database.app_settings, "migration_pause_ms", 0)
+        self._null_due_dates(5)
+        stop = threading.Event()
+        batch = database._backfill_due_on_batch
+
+        def stop_after_first_batch(cursor, after_id, last_id):
+            stop.set()
+            return batch(cursor, after_id, last_id)
+
+        monkeypatch.setattr(database, "_backfill_due_on_batch", stop_after_first_batch)
+        assert database.run_migrations(stop) == []
+        with database.get_read_db() as conn:
+            done = conn.execute("SELECT COUNT(*) FROM action_items WHERE due_on IS NOT NULL").fetchone()[0]
+            claims = conn.execute("SELECT COUNT(*) FROM migration_claims").fetchone()[0]
+        assert (done, claims, database.get_schema_version()) == (2, 0, 1)
+
+        assert database.run_migrations() == [2, 3, 4, 5, 6]
+        assert {item["due_on"] for item in get_pending_action_items()} == {"2025-01-15"}
+
+    def test_lost_claim_stops_backfill(self, isolated_test_db, monkeypatch):
+        """Test a worker whose claim was taken over stops without raising the version."""
+        monkeypatch.setattr(database.app_settings, "migration_batch_size", 2)
+        monkeypatch.setattr(database.app_settings, "migration_pause_ms", 0)
+        self._null_due_dates(5)
+        batch = database._backfill_due_on_batch
+
+        def taken_over(cursor, after_id, last_id):
+            cursor.execute("UPDATE migration_claims SET owner = 'other-worker'")
+            return batch(cursor, after_id, last_id)
+
+        monkeypatch.setattr(database, "_backfill_due_on_batch", taken_over)
+
+        assert database.run_migrations() == []
+        assert database.get_schema_version() == 1
+
+    def test_engine_init_leaves_backfills_to_migrate(self, isolated_test_db):
+        """Test the startup init runs no backfills; migrate() applies them."""
+        from app.storage.sqlite import SQLiteEngine
+
+        self._null_due_dates(2)
+        engine = SQLiteEngine()
+
+        engine.init()
+        assert database.get_schema_version() == 1
+
+        assert engine.migrate() == [2, 3, 4, 5, 6]
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+        assert {item["due_on"] for item in get_pending_action_items()} == {"2025-01-15"}
+
+    def test_legacy_database_reaches_schema_version(self, isolated_test_db, tmp_path):
+        """Test an unversioned database runs every migration and is stamped."""
+        import sqlite3
+
+        legacy_path = tmp_path / "unversioned.db"
+        legacy = sqlite3.connect(legacy_path)
+        legacy.execute("""
+            CREATE TABLE action_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, assignee TEXT,
+                due_date TEXT, selected INTEGER DEFAULT 1, overdue INTEGER DEFAULT 0,
+                ticket_key TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                completed_at TIMESTAMP
+            )
+        """)
+        legacy.execute("INSERT INTO action_items (title, assignee, due_date, created_at) "
+                       "VALUES ('Old', 'Sarah Lee', '2025-01-15', '2025-01-10 09:30:00')")
+        legacy.commit()
+        legacy.close()
+
+        database.DB_PATH = legacy_path
+        init_db()
+
+        with database.get_read_db() as conn:
+            item = conn.execute("SELECT due_on, assignee_id FROM action_items").fetchone()
+        assert database.get_schema_version() == database.SCHEMA_VERSION
+        assert tuple(item) == ("2025-01-15", 2)
+        assert get_analytics_data()["pending_count"] == 1
+
+
+class TestReadSessions:
+    """Tests for read sessions shared across database calls."""
+
+    def test_reads_share_one_snapshot(self, isolated_test_db):
+        """Test reads in a session do not see writes committed after its first read."""
+        with database.read_session() as session:
+            before = get_pending_action_items(session=session)
+            save_action_item("Late arrival", "John Smith", None)
+
+            during = get_pending_action_items(session=session)
+            analytics = get_analytics_data(session=session)
+
+        assert before == during == []
+        assert analytics["pending_count"] == 0
+        assert len(get_pending_action_items()) == 1
+
+    def test_close_returns_the_reader(self, isolated_test_db, monkeypatch):
+        """Test a session holds one reader until closed, and refuses use afterwards."""
+        monkeypatch.setattr(database.app_settings, "db_pool_readers", 1)
+        database.close_pool()
+
+        session = database.open_read_session()
+        database.get_all_team_members(session)
+        session.close()
+        session.close()
+
+        assert len(database.get_all_team_members()) == len(database.DEFAULT_TEAM_MEMBERS)
+        with pytest.raises(RuntimeError, match="closed"):
+            database.get_user_settings(session)
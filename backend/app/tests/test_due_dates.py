@@ -0,0 +1,36 @@
+"""Tests for due date normalization."""
+from datetime import date
+
+import pytest
+
+from app.due_dates import parse_due_date
+
+
+class TestParseDueDate:
+    """Tests for parse_due_date."""
+
+    @pytest.mark.parametrize(
+        "text",
+        ["Jan 15", "January 15", "jan 15th", "15 Jan", "1/15", "Jan 15, 2026", "2026-01-15"],
+    )
+    def test_recognized_formats(self, text):
+        """Test common formats normalize to the same date."""
+        assert parse_due_date(text, today=date(2026, 1, 10)) == date(2026, 1, 15)
+
+    def test_year_rolls_forward_near_year_end(self):
+        """Test a January date mentioned in December lands next year."""
+        assert parse_due_date("Jan 5", today=date(2025, 12, 20)) == date(2026, 1, 5)
+
+    def test_year_rolls_back_near_year_start(self):
+        """Test a December date mentioned in January stays in the past year."""
+        assert parse_due_date("Dec 28", today=date(2026, 1, 3)) == date(2025, 12, 28)
+
+    def test_feb_29_only_in_leap_years(self):
+        """Test Feb 29 resolves to the nearest leap year or not at all."""
+        assert parse_due_date("Feb 29", today=date(2028, 2, 1)) == date(2028, 2, 29)
+        assert parse_due_date("Feb 29", today=date(2026, 2, 1)) is None
+
+    @pytest.mark.parametrize("text", [None, "", "ASAP", "next week"])
+    def test_unrecognized_returns_none(self, text):
+        """Test empty and relative phrases are not guessed."""
+        assert parse_due_date(text, today=date(2026, 1, 10)) is None
@@ -57,6 +57,30 @@ class TestExtractionService:
         assert len(result) >= 1
         assert all(isinstance(item, ActionItem) for item in result)
 
+    @pytest.mark.asyncio
+    async def test_extract_from_text_normalizes_due_dates(self, service):
+        """Test extracted due dates get an ISO due_on."""
+        mock_response = MagicMock()
+        mock_response.content = [
+            MagicMock(
+                text=json.dumps(
+                    [
+                        {"title": "Task 1", "assignee": "John", "due_date": "2026-01-15"},
+                        {"title": "Task 2", "assignee": "Sarah", "due_date": "ASAP"},
+                    ]
+                )
+            )
+        ]
+
+        with patch.object(
+            service, "_call_claude", new_callable=AsyncMock, return_value=mock_response
+        ):
+            result = await service.extract_from_text("Meeting notes")
+
+        assert result[0].due_on.isoformat() == "2026-01-15"
+        assert result[0].due_date == "2026-01-15"
+        assert result[1].due_on is None
+
     @pytest.mark.asyncio
     async def test_extract_from_text_assigns_unique_ids(self, service):
         """Test that extracted items have unique IDs."""
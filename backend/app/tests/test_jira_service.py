@@ -3,10 +3,12 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
+from app.assignee_resolver import AssigneeResolver
 from app.models import (
     ActionItem,
     JiraConfig,
     CreatedTicket,
+    TeamMember,
 )
 from app.services.jira_service import (
     JiraService,
@@ -125,6 +127,65 @@ class TestJiraService:
         assert result.tickets[1].key == "SANAS-457"
         assert len(result.failed) == 0
 
+    @pytest.mark.asyncio
+    async def test_create_tickets_assigns_resolved_members(self, service, action_items):
+        """Test tickets are assigned to the Jira account of the resolved member."""
+        team_members = [
+            TeamMember(id=1, name="John Smith", initials="JS", jira_account_id="jira-js"),
+            TeamMember(id=2, name="Sarah Lee", initials="SL"),
+        ]
+        action_items[0].assignee = "J. Smith"
+
+        with patch.object(service, "_make_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"key": "SANAS-1"}
+            await service.create_tickets(
+                action_items, JiraConfig(), AssigneeResolver(team_members)
+            )
+
+        payloads = [call[1]["json_data"]["fields"] for call in mock_request.call_args_list]
+        assert payloads[0]["assignee"] == {"accountId": "jira-js"}
+        assert "assignee" not in payloads[1]
+
+    @staticmethod
+    def _jira_error(status: int, body: dict) -> httpx.HTTPStatusError:
+        """An error as raised by _make_request for a Jira error response."""
+        request = httpx.Request("POST", "https://test.atlassian.net/rest/api/3/issue")
+        response = httpx.Response(status, json=body, request=request)
+        return httpx.HTTPStatusError("Jira error", request=request, response=response)
+
+    @pytest.mark.asyncio
+    async def test_rejected_assignee_retries_unassigned(self, service, action_items, caplog):
+        """Test a ticket whose assignee Jira rejects is created unassigned and logged."""
+        member = TeamMember(id=1, name="John Smith", initials="JS", jira_account_id="gone")
+        rejection = self._jira_error(400, {"errors": {"assignee": "User 'gone' cannot be assigned"}})
+
+        with patch.object(service, "_make_request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = [rejection, {"key": "SANAS-7"}]
+            with caplog.at_level("WARNING", logger="app.services.jira_service"):
+                ticket = await service.create_ticket(action_items[0], JiraConfig(), member)
+
+        payloads = [call[1]["json_data"]["fields"] for call in mock_request.call_args_list]
+        assert ticket.key == "SANAS-7"
+        assert payloads[0]["assignee"] == {"accountId": "gone"}
+        assert "assignee" not in payloads[1]
+        assert "rejected assignee John Smith" in caplog.text
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, body", [
+        (400, {"errors": {"summary": "Summary is required"}}),
+        (401, {"errorMessages": ["Unauthorized"]}),
+    ])
+    async def test_other_errors_are_not_retried(self, service, action_items, status, body):
+        """Test failures unrelated to the assignee still fail the ticket."""
+        member = TeamMember(id=1, name="John Smith", initials="JS", jira_account_id="jira-js")
+
+        with patch.object(service, "_make_request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = self._jira_error(status, body)
+            with pytest.raises(httpx.HTTPStatusError):
+                await service.create_ticket(action_items[0], JiraConfig(), member)
+
+        assert mock_request.call_count == 1
+
     @pytest.mark.asyncio
     async def test_create_tickets_handles_partial_failure(self, service, action_items):
         """Test handling partial failures in batch creation."""
@@ -0,0 +1,185 @@
+"""Tests for scheduled SQLite maintenance."""
+import sqlite3
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database, maintenance, storage
+from app.config import settings as app_settings
+from app.main import app
+
+
+@pytest.fixture(autouse=True)
+def no_last_report(monkeypatch):
+    """Start every test with no maintenance report."""
+    monkeypatch.setattr(maintenance, "_last_report", None)
+
+
+def _free_pages(count: int) -> int:
+    """Insert and delete enough rows to leave free pages; returns freelist_count."""
+    database.save_action_items([{"title": "x" * 2000} for _ in range(count)])
+    with database.get_db() as conn:
+        conn.execute("DELETE FROM action_items")
+    with database.get_read_db() as conn:
+        return conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+
+def _steps(report: dict) -> dict:
+    """Report steps keyed by name."""
+    return {step["name"]: step for step in report["steps"]}
+
+
+class TestRunMaintenance:
+    """Tests for run_maintenance."""
+
+    def test_new_databases_use_incremental_vacuum(self):
+        """Test databases created by init_db start with auto_vacuum=INCREMENTAL."""
+        with database.get_read_db() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    def test_runs_every_step_and_frees_pages(self, monkeypatch):
+        """Test a run analyzes, optimizes and returns free pages in small steps."""
+        monkeypatch.setattr(app_settings, "maintenance_vacuum_step_pages", 16)
+        freed_before = _free_pages(200)
+
+        report = maintenance.run_maintenance(budget_ms=10_000)
+
+        steps = _steps(report)
+        assert freed_before > app_settings.maintenance_vacuum_step_pages
+        assert report["auto_vacuum"] == "incremental"
+        assert (report["freelist_pages_before"], report["freelist_pages_after"]) == (freed_before, 0)
+        assert all(step["ran"] and not step["interrupted"] for step in steps.values())
+        assert steps["incremental_vacuum"]["transactions"] > 1
+        assert steps["incremental_vacuum"]["detail"].endswith(" pages freed")
+        assert steps["incremental_vacuum"]["lock_held_ms"] <= steps["incremental_vacuum"]["duration_ms"]
+        assert maintenance.get_last_report() is report
+
+    def test_analyze_only_until_statistics_exist(self):
+        """Test the full ANALYZE is skipped once sqlite_stat1 exists."""
+        maintenance.run_maintenance(budget_ms=10_000)
+
+        steps = _steps(maintenance.run_maintenance(budget_ms=10_000))
+
+        assert not steps["analyze"]["ran"]
+        assert steps["optimize"]["ran"]
+
+    def test_spent_budget_interrupts_statements(self):
+        """Test a statement still running at the deadline is interrupted."""
+        _free_pages(50)
+        database.save_action_items([{"title": f"Task {n}"} for n in range(2000)])
+
+        steps = _steps(maintenance.run_maintenance(budget_ms=0))
+
+        assert steps["analyze"]["interrupted"] and not steps["analyze"]["ran"]
+        assert steps["incremental_vacuum"]["interrupted"]
+        assert steps["incremental_vacuum"]["transactions"] == 0
+        with database.get_read_db() as conn:
+            assert conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone() is None
+
+    def test_vacuum_skipped_without_incremental_mode(self, tmp_path):
+        """Test legacy databases are told how to switch modes, then switch."""
+        database.close_pool()
+        legacy = tmp_path / "legacy.db"
+        conn = sqlite3.connect(legacy)
+        conn.execute("CREATE TABLE t (x)")
+        conn.commit()
+        conn.close()
+        database.DB_PATH = legacy
+
+        skipped = _steps(maintenance.run_maintenance())["incremental_vacuum"]
+        switched = maintenance.enable_incremental_vacuum()
+
+        assert not skipped["ran"]
+        assert "--enable-incremental-vacuum" in skipped["detail"]
+        assert (switched["before"], switched["after"]) == ("none", "incremental")
+
+    def test_concurrent_run_rejected(self):
+        """Test only one run may be in progress."""
+        with maintenance._maintenance_lock:
+            with pytest.raises(maintenance.MaintenanceInProgressError):
+                maintenance.run_maintenance()
+
+
+class TestSchedule:
+    """Tests for the maintenance window and scheduled runs."""
+
+    @pytest.mark.parametrize("start, end, hour, expected", [
+        (2, 5, 2, True),
+        (2, 5, 5, False),
+        (22, 3, 23, True),
+        (22, 3, 1, True),
+        (22, 3, 12, False),
+        (0, 0, 12, True),
+    ])
+    def test_window(self, monkeypatch, start, end, hour, expected):
+        """Test the window is half-open, may wrap midnight and equal hours mean always."""
+        monkeypatch.setattr(app_settings, "maintenance_window_start_hour", start)
+        monkeypatch.setattr(app_settings, "maintenance_window_end_hour", end)
+
+        now = datetime(2025, 1, 15, hour, 30, tzinfo=UTC)
+
+        assert maintenance.in_maintenance_window(now) is expected
+
+    def test_scheduled_run_respects_window(self, monkeypatch):
+        """Test the scheduled job only runs inside the window."""
+        monkeypatch.setattr(maintenance, "in_maintenance_window", lambda now=None: False)
+        assert maintenance.run_scheduled_maintenance() is None
+
+        monkeypatch.setattr(maintenance, "in_maintenance_window", lambda now=None: True)
+        assert maintenance.run_scheduled_maintenance()["auto_vacuum"] == "incremental"
+
+    def test_scheduled_run_skips_memory_engine(self, monkeypatch):
+        """Test nothing runs on the in-memory engine."""
+        monkeypatch.setattr(app_settings, "storage_engine", "memory")
+        monkeypatch.setattr(maintenance, "in_maintenance_window", lambda now=None: True)
+        storage.reset_engine()
+
+        report = maintenance.run_scheduled_maintenance()
+
+        storage.reset_engine()
+        assert report is None
+
+
+class TestMaintenanceEndpoints:
+    """Tests for /api/admin/maintenance."""
+
+    @pytest.fixture
+    def client(self):
+        """Test client for the app."""
+        return TestClient(app)
+
+    def test_no_report_yet(self, client):
+        """Test GET is 404 before any run."""
+        assert client.get("/api/admin/maintenance").status_code == 404
+
+    def test_run_then_fetch_report(self, client):
+        """Test POST runs maintenance and GET returns the same report."""
+        response = client.post("/api/admin/maintenance", json={"budget_ms": 5000})
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["budget_ms"] == 5000
+        assert [step["name"] for step in data["steps"]] == [
+            "analyze", "optimize", "incremental_vacuum"
+        ]
+        assert client.get("/api/admin/maintenance").json() == data
+
+    def test_run_rejected_while_in_progress(self, client):
+        """Test POST is 409 while another run holds the lock."""
+        with maintenance._maintenance_lock:
+            response = client.post("/api/admin/maintenance")
+
+        assert response.status_code == 409
+
+    def test_run_requires_sqlite(self, client, monkeypatch):
+        """Test POST is 409 on the in-memory engine."""
+        monkeypatch.setattr(app_settings, "storage_engine", "memory")
+        storage.reset_engine()
+
+        response = client.post("/api/admin/maintenance")
+
+        storage.reset_engine()
+        assert response.status_code == 409
@@ -0,0 +1,71 @@
+"""Tests for the team member prefix index."""
+import pytest
+
+from app.models import TeamMember
+from app.prefix_index import TeamPrefixIndex
+
+
+@pytest.fixture
+def index():
+    """An index over a small roster."""
+    return TeamPrefixIndex([
+        TeamMember(id=1, name="John Smith", initials="JS", slack_id="@jsmith"),
+        TeamMember(id=2, name="Sarah Lee", initials="SL", slack_id="U234567"),
+        TeamMember(id=3, name="Anita Johnson", initials="AJ"),
+        TeamMember(id=4, name="Zoë Müller", initials="ZM"),
+    ])
+
+
+def _ids(members: list[TeamMember]) -> list[int]:
+    """Member IDs in result order."""
+    return [member.id for member in members]
+
+
+class TestTeamPrefixIndex:
+    """Tests for TeamPrefixIndex."""
+
+    @pytest.mark.parametrize("prefix, expected", [
+        ("jo", [1, 3]),
+        ("JOHN S", [1]),
+        ("lee", [2]),
+        ("sl", [2]),
+        ("@jsm", [1]),
+        ("zoe m", [4]),
+        ("x", []),
+        ("  ", []),
+    ])
+    def test_suggest(self, index, prefix, expected):
+        """Test names, later name parts, initials and handles match, full names first."""
+        assert _ids(index.suggest(prefix)) == expected
+
+    def test_limit(self, index):
+        """Test at most limit distinct members are returned."""
+        assert _ids(index.suggest("j", limit=1)) == [1]
+        assert index.suggest("j", limit=0) == []
+
+    def test_slack_ids_are_not_handles(self, index):
+        """Test a bare Slack user ID is not suggested."""
+        assert index.suggest("u234") == []
+
+    def test_add_rename_and_remove(self, index):
+        """Test incremental changes leave no stale keys behind."""
+        index.add(TeamMember(id=5, name="Johanna Berg", initials="JB"))
+        index.add(TeamMember(id=1, name="Jack Smith", initials="JS"))
+        index.remove(3)
+        index.remove(99)
+
+        assert _ids(index.suggest("jo")) == [5]
+        assert _ids(index.suggest("smi")) == [1]
+        assert len(index) == 4
+
+    def test_incremental_matches_rebuild(self, index):
+        """Test an index built one member at a time equals one built at once."""
+        members = [index.suggest("john smith")[0], *index.suggest("s"), *index.suggest("a")]
+        incremental = TeamPrefixIndex()
+        for member in members:
+            incremental.add(member)
+
+        rebuilt = TeamPrefixIndex(members)
+
+        for prefix in ("j", "s", "a", "l", "@"):
+            assert _ids(incremental.suggest(prefix)) == _ids(rebuilt.suggest(prefix))
@@ -0,0 +1,245 @@
+"""Tests for SQL instrumentation."""
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database, storage
+from app.config import settings as app_settings
+from app.main import app
+from app.query_stats import (
+    InstrumentedConnection,
+    LatencyHistogram,
+    explain_query_plan,
+    normalize_sql,
+    query_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    """Start every test with empty statistics."""
+    query_stats.reset()
+    yield
+    query_stats.reset()
+
+
+def _entry(sql_prefix: str) -> dict:
+    """The recorded statement whose normalized SQL starts with sql_prefix."""
+    matches = [q for q in query_stats.snapshot(500)["queries"] if q["sql"].startswith(sql_prefix)]
+    assert len(matches) == 1, matches
+    return matches[0]
+
+
+class TestNormalizeSql:
+    """Tests for normalize_sql."""
+
+    def test_replaces_literals_and_whitespace(self):
+        """Test literals become placeholders and whitespace collapses."""
+        sql = "SELECT *\n   FROM t WHERE name = 'O''Brien' AND n > -12.5 LIMIT 10"
+
+        assert normalize_sql(sql) == "SELECT * FROM t WHERE name = ? AND n > ? LIMIT ?"
+
+    def test_collapses_in_lists_and_keeps_identifiers(self):
+        """Test IN lists of any length share a shape; digits in names stay."""
+        short = normalize_sql("DELETE FROM t2 WHERE id IN (?, ?)")
+        long = normalize_sql("DELETE FROM t2 WHERE id IN (?,?,?,?)")
+
+        assert short == long == "DELETE FROM t2 WHERE id IN (?)"
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_use_bucket_bounds(self):
+        """Test percentiles report bucket upper bounds, capped by the maximum."""
+        histogram = LatencyHistogram()
+        for elapsed_ms in [0.05] * 90 + [3.0] * 9 + [40.0]:
+            histogram.record(elapsed_ms)
+
+        summary = histogram.as_dict()
+        assert (summary["count"], summary["max_ms"]) == (100, 40.0)
+        assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (0.1, 5, 5)
+        assert histogram.percentile(1.0) == 40.0
+        assert summary["histogram"] == [
+            {"le_ms": 0.1, "count": 90},
+            {"le_ms": 5, "count": 9},
+            {"le_ms": 50, "count": 1},
+        ]
+
+    def test_overflow_bucket(self):
+        """Test latencies beyond the last bound land in the open bucket."""
+        histogram = LatencyHistogram()
+        histogram.record(9000.0)
+
+        assert histogram.as_dict()["histogram"] == [{"le_ms": None, "count": 1}]
+        assert histogram.percentile(0.5) == 9000.0
+
+
+class TestInstrumentation:
+    """Tests for statement timing on database connections."""
+
+    def test_connections_are_instrumented(self):
+        """Test pooled connections record statements, commits and pool waits."""
+        database.save_action_items([{"title": "A"}, {"title": "B"}])
+        database.get_pending_action_items()
+
+        snapshot = query_stats.snapshot(500)
+        insert = _entry("INSERT INTO action_items")
+        assert isinstance(database.get_connection(), InstrumentedConnection)
+        assert insert["count"] == 1
+        assert _entry("COMMIT")["count"] >= 1
+        assert {"writer", "reader"} <= set(snapshot["waits"])
+
+    def test_same_shape_shares_histogram(self):
+        """Test repeated calls with different values accumulate in one entry."""
+        for member_id in (1, 2, 3):
+            database.get_team_member_by_id(member_id)
+
+        assert _entry("SELECT * FROM team_members WHERE id")["count"] == 3
+
+    def test_errors_are_counted(self):
+        """Test failing statements are recorded with an error count."""
+        with pytest.raises(sqlite3.OperationalError):
+            with database.get_db() as conn:
+                conn.execute("SELECT * FROM no_such_table WHERE id = 7")
+
+        assert _entry("SELECT * FROM no_such_table")["errors"] == 1
+
+    def test_cursor_factory_override(self):
+        """Test an explicit cursor factory bypasses instrumentation."""
+        conn = database.get_connection()
+        conn.cursor(sqlite3.Cursor).execute("SELECT 42")
+
+        assert not any(q["sql"] == "SELECT ?" for q in query_stats.snapshot(500)["queries"])
+        conn.close()
+
+    def test_disabled_uses_plain_connections(self, monkeypatch):
+        """Test turning stats off opens uninstrumented connections."""
+        monkeypatch.setattr(app_settings, "sql_stats_enabled", False)
+
+        conn = database.get_connection()
+
+        assert type(conn) is sqlite3.Connection
+        conn.close()
+
+
+class TestSlowQueryLog:
+    """Tests for the slow-query log."""
+
+    def test_slow_queries_capture_plan(self, monkeypatch, caplog):
+        """Test statements over the threshold are logged with their query plan."""
+        monkeypatch.setattr(app_settings, "slow_query_ms", 0)
+        database.save_action_item("Review budget", "John", None)
+        query_stats.reset()
+
+        database.search_action_item_rows("budget", assignee="John")
+
+        search = next(
+            entry for entry in query_stats.snapshot()["slow_queries"]
+            if "action_items_fts MATCH" in entry["sql"]
+        )
+        assert search["plan"][:3] == [
+            "SCAN action_items_fts VIRTUAL TABLE INDEX 0:M1",
+            "SEARCH live USING INTEGER PRIMARY KEY (rowid=?) LEFT-JOIN",
+            "SEARCH archived USING INTEGER PRIMARY KEY (rowid=?) LEFT-JOIN",
+        ]
+        assert "Slow query" in caplog.text
+
+    def test_plan_nests_children(self):
+        """Test plan lines are indented under their parent step."""
+        with database.get_read_db() as conn:
+            plan = explain_query_plan(
+                conn,
+                "SELECT id FROM action_items UNION ALL SELECT id FROM action_items_archive",
+                (),
+            )
+
+        assert plan[0] == "COMPOUND QUERY"
+        assert plan[1].startswith("  LEFT-MOST SUBQUERY")
+        assert plan[2].startswith("    SCAN")
+
+    def test_fast_queries_not_logged(self):
+        """Test statements under the threshold stay out of the slow log."""
+        database.get_user_settings()
+
+        assert query_stats.snapshot()["slow_queries"] == []
+
+    def test_non_explainable_statements_have_no_plan(self, monkeypatch):
+        """Test pragmas are logged without a plan."""
+        monkeypatch.setattr(app_settings, "slow_query_ms", 0)
+
+        with database.get_read_db() as conn:
+            conn.execute("PRAGMA page_count")
+
+        entries = [e for e in query_stats.snapshot()["slow_queries"] if e["sql"] == "PRAGMA page_count"]
+        assert entries[0]["plan"] == []
+
+    def test_log_is_bounded(self, monkeypatch):
+        """Test only the most recent slow queries are kept."""
+        monkeypatch.setattr(app_settings, "slow_query_ms", 0)
+        monkeypatch.setattr(app_settings, "slow_query_log_size", 3)
+        query_stats.reset()
+
+        for member_id in range(10):
+            database.get_team_member_by_id(member_id)
+
+        assert len(query_stats.snapshot()["slow_queries"]) == 3
+
+
+class TestDatabaseStatsEndpoint:
+    """Tests for /api/admin/db/stats."""
+
+    @pytest.fixture
+    def client(self):
+        """Test client for the app."""
+        return TestClient(app)
+
+    def test_reports_queries_and_sqlite_internals(self, client):
+        """Test the endpoint returns statement latencies and WAL figures."""
+        database.save_action_item("Task", None, None)
+
+        response = client.get("/api/admin/db/stats")
+
+        data = response.json()
+        assert response.status_code == 200
+        assert any(q["sql"].startswith("INSERT INTO action_items") for q in data["queries"])
+        assert data["sqlite"]["journal_mode"] == "wal"
+        assert data["sqlite"]["wal_size_bytes"] > 0
+        assert data["sqlite"]["wal_frames"] > 0
+        assert data["sqlite"]["database_size_bytes"] == (
+            data["sqlite"]["page_size"] * data["sqlite"]["page_count"]
+        )
+
+    def test_limit_and_ordering(self, client):
+        """Test queries are limited and ordered by total time."""
+        for title in ("A", "B", "C"):
+            database.save_action_item(title, None, None)
+
+        queries = client.get("/api/admin/db/stats", params={"limit": 2}).json()["queries"]
+
+        assert len(queries) == 2
+        assert queries[0]["total_ms"] >= queries[1]["total_ms"]
+
+    def test_reset(self, client):
+        """Test DELETE clears the recorded statistics."""
+        database.save_action_item("Task", None, None)
+
+        response = client.delete("/api/admin/db/stats")
+
+        assert response.status_code == 204
+        assert not any(
+            q["sql"].startswith("INSERT INTO action_items")
+            for q in client.get("/api/admin/db/stats").json()["queries"]
+        )
+
+    def test_memory_engine_has_no_sqlite_section(self, client, monkeypatch):
+        """Test SQLite figures are omitted when the in-memory engine is used."""
+        monkeypatch.setattr(app_settings, "storage_engine", "memory")
+        storage.reset_engine()
+
+        response = client.get("/api/admin/db/stats")
+
+        storage.reset_engine()
+        assert response.status_code == 200
+        assert response.json()["sqlite"] is None
@@ -0,0 +1,91 @@
+"""Tests for the row mapping layer."""
+import pytest
+
+from app.models import TeamMember, PendingActionItem
+from app.row_mapping import (
+    RowMapper,
+    TEAM_MEMBER_MAPPER,
+    PENDING_ITEM_MAPPER,
+    SEARCH_RESULT_MAPPER,
+    HISTORY_ITEM_MAPPER,
+)
+from app.database import get_team_member_rows, get_pending_action_item_rows, save_action_item
+
+
+class TestRowMapper:
+    """Tests for RowMapper."""
+
+    def test_mapped_model_equals_validated_model(self):
+        """Test mapping produces the same model as validation would."""
+        row = (1, "John Smith", "JS", "U123", None, "john@example.com")
+
+        mapped = TEAM_MEMBER_MAPPER.from_row(row)
+
+        assert mapped == TeamMember(**dict(zip(TEAM_MEMBER_MAPPER.columns, row)))
+        assert mapped.model_dump()["email"] == "john@example.com"
+
+    def test_converters_applied(self):
+        """Test SQLite integer flags become bools."""
+        item = PENDING_ITEM_MAPPER.from_row((7, "Task", None, None, 1))
+
+        assert item.overdue is True
+        assert item.model_dump_json()
+
+    def test_extra_trailing_columns_ignored(self):
+        """Test pagination keys after the mapped columns are skipped."""
+        item = PENDING_ITEM_MAPPER.from_row((7, "Task", "John", None, 0, "2025-01-01 00:00:00"))
+
+        assert item == PendingActionItem(id=7, title="Task", assignee="John", overdue=False)
+
+    @pytest.mark.parametrize(
+        "mapper, row",
+        [
+            (TEAM_MEMBER_MAPPER, (1, "John Smith", "JS", "U123", None, "john@example.com")),
+            (PENDING_ITEM_MAPPER, (7, "Task", "John", "2025-01-01", 1)),
+            (SEARCH_RESULT_MAPPER, (7, "Task", None, None, 0, None, -1.5)),
+            (
+                HISTORY_ITEM_MAPPER,
+                (7, "Task", "John", None, "PROJ-1", 1735689600, 1735776000, 1),
+            ),
+        ],
+    )
+    def test_mapped_models_round_trip(self, mapper, row):
+        """Test every mapped model dumps, copies and revalidates like a validated one."""
+        mapped = mapper.from_row(row)
+
+        dumped = mapped.model_dump()
+        assert mapper.model.model_validate(dumped) == mapped
+        assert mapped.model_fields_set == set(mapper.columns)
+
+        copied = mapped.model_copy(update={"id": 99})
+        assert copied.id == 99
+        assert mapped.id == row[0]
+        assert copied.model_dump() == {**dumped, "id": 99}
+        assert mapper.model.model_validate_json(mapped.model_dump_json()) == mapped
+
+    def test_columns_must_match_model(self):
+        """Test a mapper rejects columns that do not cover the model."""
+        with pytest.raises(ValueError):
+            RowMapper(TeamMember, ("id", "name"))
+
+
+class TestMappedQueries:
+    """Tests for tuple-returning database reads."""
+
+    def test_team_member_rows_map_to_models(self):
+        """Test team member tuples map onto TeamMember."""
+        members = TEAM_MEMBER_MAPPER.map_rows(get_team_member_rows())
+
+        assert members
+        assert all(isinstance(m, TeamMember) for m in members)
+        assert [m.name for m in members] == sorted(m.name for m in members)
+
+    def test_pending_rows_carry_keyset_column(self):
+        """Test pending tuples end with created_at for cursors."""
+        saved = save_action_item("Task", "John", None, True, True)
+
+        rows = get_pending_action_item_rows()
+
+        assert rows[0][0] == saved["id"]
+        assert rows[0][-1] == saved["created_at"]
+        assert PENDING_ITEM_MAPPER.from_row(rows[0]).overdue is True
@@ -36,25 +36,25 @@ class TestSettingsService:
         """Test service initializes with defaults."""
         assert service is not None
 
-    def test_get_settings_returns_user_settings(self, service):
+    async def test_get_settings_returns_user_settings(self, service):
         """Test getting settings returns UserSettings object."""
-        settings = service.get_settings()
+        settings = await service.get_settings()
 
         assert isinstance(settings, UserSettings)
         assert isinstance(settings.reminders, ReminderSettings)
         assert isinstance(settings.notifications, NotificationSettings)
         assert isinstance(settings.defaults, DefaultSettings)
 
-    def test_get_settings_default_values(self, service):
+    async def test_get_settings_default_values(self, service):
         """Test default settings values."""
-        settings = service.get_settings()
+        settings = await service.get_settings()
 
         assert settings.reminders.enabled is True
         assert settings.reminders.frequency == "Weekly"
         assert settings.notifications.on_create is True
         assert settings.defaults.project == "SANAS"
 
-    def test_update_reminder_settings(self, service):
+    async def test_update_reminder_settings(self, service):
         """Test updating reminder settings."""
         new_reminders = ReminderSettings(
             enabled=False,
@@ -63,7 +63,7 @@ class TestSettingsService:
             time="10:00 AM",
         )
 
-        service.update_settings(
+        await service.update_settings(
             UserSettings(
                 reminders=new_reminders,
                 notifications=NotificationSettings(),
@@ -71,18 +71,18 @@ class TestSettingsService:
             )
         )
 
-        settings = service.get_settings()
+        settings = await service.get_settings()
         assert settings.reminders.enabled is False
         assert settings.reminders.frequency == "Daily"
 
-    def test_update_notification_settings(self, service):
+    async def test_update_notification_settings(self, service):
         """Test updating notification settings."""
         new_notifications = NotificationSettings(
             on_create=False,
             overdue_warnings=False,
         )
 
-        service.update_settings(
+        await service.update_settings(
             UserSettings(
                 reminders=ReminderSettings(),
                 notifications=new_notifications,
@@ -90,18 +90,18 @@ class TestSettingsService:
             )
         )
 
-        settings = service.get_settings()
+        settings = await service.get_settings()
         assert settings.notifications.on_create is False
         assert settings.notifications.overdue_warnings is False
 
-    def test_update_default_settings(self, service):
+    async def test_update_default_settings(self, service):
         """Test updating default settings."""
         new_defaults = DefaultSettings(
             project="INFRA",
             issue_type="Bug",
         )
 
-        service.update_settings(
+        await service.update_settings(
             UserSettings(
                 reminders=ReminderSettings(),
                 notifications=NotificationSettings(),
@@ -109,7 +109,7 @@ class TestSettingsService:
             )
         )
 
-        settings = service.get_settings()
+        settings = await service.get_settings()
         assert settings.defaults.project == "INFRA"
         assert settings.defaults.issue_type == "Bug"
 
@@ -122,14 +122,28 @@ class TestTeamMemberManagement:
         """Create a SettingsService instance."""
         return SettingsService()
 
-    def test_get_team_members_returns_seeded_data(self, service):
+    async def test_get_team_members_returns_seeded_data(self, service):
         """Test getting team members returns default seeded data."""
-        members = service.get_team_members()
+        members = await service.get_team_members()
         # Database seeds 4 default team members
         assert len(members) >= 4
         assert all(isinstance(m, TeamMember) for m in members)
 
-    def test_add_team_member(self, service):
+    async def test_reads_join_a_read_session(self, service):
+        """Test reads given a session see its snapshot, not later changes."""
+        from app.async_database import read_session
+
+        async with read_session() as session:
+            before = await service.get_team_members(session)
+            await service.add_team_member(TeamMemberCreate(name="Ada Lovelace"))
+            during = await service.get_team_members(session)
+            settings = await service.get_settings(session)
+
+        assert [m.name for m in during] == [m.name for m in before]
+        assert settings.defaults is not None
+        assert len(await service.get_team_members()) == len(before) + 1
+
+    async def test_add_team_member(self, service):
         """Test adding a new team member."""
         new_member = TeamMemberCreate(
             name="John Smith",
@@ -139,47 +153,47 @@ class TestTeamMemberManagement:
             email="john@example.com",
         )
 
-        member = service.add_team_member(new_member)
+        member = await service.add_team_member(new_member)
 
         assert member.name == "John Smith"
         assert member.initials == "JS"
         assert member.id is not None
 
-    def test_add_team_member_auto_generates_initials(self, service):
+    async def test_add_team_member_auto_generates_initials(self, service):
         """Test adding member auto-generates initials if not provided."""
         new_member = TeamMemberCreate(
             name="John Smith",
         )
 
-        member = service.add_team_member(new_member)
+        member = await service.add_team_member(new_member)
 
         assert member.initials == "JS"
 
-    def test_add_team_member_generates_unique_id(self, service):
+    async def test_add_team_member_generates_unique_id(self, service):
         """Test adding members generates unique IDs."""
-        member1 = service.add_team_member(TeamMemberCreate(name="John Smith"))
-        member2 = service.add_team_member(TeamMemberCreate(name="Sarah Lee"))
+        member1 = await service.add_team_member(TeamMemberCreate(name="John Smith"))
+        member2 = await service.add_team_member(TeamMemberCreate(name="Sarah Lee"))
 
         assert member1.id != member2.id
 
-    def test_get_team_member_by_id(self, service):
+    async def test_get_team_member_by_id(self, service):
         """Test getting a team member by ID."""
-        created = service.add_team_member(TeamMemberCreate(name="John Smith"))
-        member = service.get_team_member(created.id)
+        created = await service.add_team_member(TeamMemberCreate(name="John Smith"))
+        member = await service.get_team_member(created.id)
 
         assert member is not None
         assert member.name == "John Smith"
 
-    def test_get_team_member_not_found(self, service):
+    async def test_get_team_member_not_found(self, service):
         """Test getting non-existent member returns None."""
-        member = service.get_team_member(999)
+        member = await service.get_team_member(999)
         assert member is None
 
-    def test_update_team_member(self, service):
+    async def test_update_team_member(self, service):
         """Test updating a team member."""
-        created = service.add_team_member(TeamMemberCreate(name="John Smith"))
+        created = await service.add_team_member(TeamMemberCreate(name="John Smith"))
 
-        updated = service.update_team_member(
+        updated = await service.update_team_member(
             created.id, TeamMemberUpdate(name="John Doe", slack_id="U999")
         )
 
@@ -187,13 +201,13 @@ class TestTeamMemberManagement:
         assert updated.name == "John Doe"
         assert updated.slack_id == "U999"
 
-    def test_update_team_member_partial(self, service):
+    async def test_update_team_member_partial(self, service):
         """Test partial update only changes specified fields."""
-        created = service.add_team_member(
+        created = await service.add_team_member(
             TeamMemberCreate(name="John Smith", slack_id="U123")
         )
 
-        updated = service.update_team_member(
+        updated = await service.update_team_member(
             created.id, TeamMemberUpdate(email="john@example.com")
         )
 
@@ -201,28 +215,28 @@ class TestTeamMemberManagement:
         assert updated.slack_id == "U123"  # Unchanged
         assert updated.email == "john@example.com"  # Changed
 
-    def test_update_team_member_not_found(self, service):
+    async def test_update_team_member_not_found(self, service):
         """Test updating non-existent member returns None."""
-        result = service.update_team_member(999, TeamMemberUpdate(name="Test"))
+        result = await service.update_team_member(999, TeamMemberUpdate(name="Test"))
         assert result is None
 
-    def test_delete_team_member(self, service):
+    async def test_delete_team_member(self, service):
         """Test deleting a team member."""
-        created = service.add_team_member(TeamMemberCreate(name="John Smith"))
+        created = await service.add_team_member(TeamMemberCreate(name="John Smith"))
 
-        result = service.delete_team_member(created.id)
+        result = await service.delete_team_member(created.id)
 
         assert result is True
-        assert service.get_team_member(created.id) is None
+        assert await service.get_team_member(created.id) is None
 
-    def test_delete_team_member_not_found(self, service):
+    async def test_delete_team_member_not_found(self, service):
         """Test deleting non-existent member returns False."""
-        result = service.delete_team_member(999)
+        result = await service.delete_team_member(999)
         assert result is False
 
-    def test_update_preserves_unset_fields(self, service):
+    async def test_update_preserves_unset_fields(self, service):
         """Test update only changes fields that are explicitly set."""
-        created = service.add_team_member(
+        created = await service.add_team_member(
             TeamMemberCreate(
                 name="John Smith",
                 initials="JS",
@@ -232,7 +246,7 @@ class TestTeamMemberManagement:
         )
 
         # Only update name, leave others unchanged
-        updated = service.update_team_member(
+        updated = await service.update_team_member(
             created.id, TeamMemberUpdate(name="John Doe")
         )
 
@@ -242,6 +256,193 @@ class TestTeamMemberManagement:
         assert updated.email == "john@example.com"
 
 
+class TestReadThroughCaching:
+    """Tests for the settings and roster caches."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a SettingsService instance."""
+        return SettingsService()
+
+    def _stats(self, service) -> dict:
+        """Cache counters keyed by cache name."""
+        return {stats["name"]: stats for stats in service.cache_stats()}
+
+    async def test_repeat_reads_hit_the_cache(self, service):
+        """Test repeat reads only check the data versions."""
+        from app.query_stats import query_stats
+
+        await service.get_settings()
+        await service.get_team_members()
+        query_stats.reset()
+
+        await service.get_settings()
+        await service.get_team_members()
+        member = (await service.get_team_members())[0]
+        assert await service.get_team_member(member.id) == member
+
+        stats = self._stats(service)
+        assert [query["sql"] for query in query_stats.snapshot()["queries"]] == [
+            "SELECT name, version FROM data_versions"
+        ]
+        assert (stats["settings"]["hits"], stats["settings"]["misses"]) == (1, 1)
+        assert (stats["team_members"]["hits"], stats["team_members"]["misses"]) == (3, 1)
+        assert await service.get_team_member(999999) is None
+
+    async def test_writes_invalidate(self, service):
+        """Test every write path makes the next read see the change."""
+        await service.get_team_members()
+        created = await service.add_team_member(TeamMemberCreate(name="Ada Lovelace"))
+        assert await service.get_team_member(created.id) == created
+
+        await service.update_team_member(created.id, TeamMemberUpdate(initials="AL"))
+        assert (await service.get_team_member(created.id)).initials == "AL"
+
+        await service.delete_team_member(created.id)
+        assert await service.get_team_member(created.id) is None
+
+        await service.get_settings()
+        new_settings = UserSettings(
+            reminders=ReminderSettings(enabled=False),
+            notifications=NotificationSettings(),
+            defaults=DefaultSettings(),
+        )
+        await service.update_settings(new_settings)
+        assert (await service.get_settings()).reminders.enabled is False
+
+        stats = self._stats(service)
+        assert stats["team_members"]["invalidations"] == 3
+        assert stats["settings"]["invalidations"] == 1
+
+    async def test_load_racing_a_write_is_not_stored(self, service):
+        """Test a roster read that overlaps a write is not cached."""
+        import asyncio
+
+        read = asyncio.create_task(service.get_team_members())
+        await asyncio.sleep(0)
+        await service.add_team_member(TeamMemberCreate(name="Ada Lovelace"))
+        await read
+
+        assert "Ada Lovelace" in [m.name for m in await service.get_team_members()]
+
+    async def test_writes_by_other_processes_invalidate(self, service):
+        """Test a write on a connection outside the pool drops the cache."""
+        import sqlite3
+        from app import database
+
+        await service.get_settings()
+        await service.get_team_members()
+        other_worker = sqlite3.connect(database.DB_PATH)
+        with other_worker:
+            other_worker.execute(
+                "INSERT INTO team_members (name, initials) VALUES ('Ada Lovelace', 'AL')"
+            )
+        other_worker.close()
+
+        members = await service.get_team_members()
+        await service.get_settings()
+
+        stats = self._stats(service)
+        assert "Ada Lovelace" in [m.name for m in members]
+        assert stats["team_members"]["invalidations"] == 1
+        assert stats["settings"]["invalidations"] == 0
+        assert stats["settings"]["hits"] == 1
+
+    async def test_assignee_resolver_rebuilt_only_on_roster_change(self, service):
+        """Test the resolver is reused until a member is added."""
+        first = await service.get_assignee_resolver()
+        assert await service.get_assignee_resolver() is first
+
+        await service.add_team_member(TeamMemberCreate(name="Ada Lovelace"))
+        rebuilt = await service.get_assignee_resolver()
+
+        assert rebuilt is not first
+        assert rebuilt.resolve("ada").name == "Ada Lovelace"
+
+    async def test_assignee_resolver_found_by_version(self, service, monkeypatch):
+        """Test a current resolver is returned without re-reading the roster's members."""
+        from app.services import settings_service
+
+        first = await service.get_assignee_resolver()
+        builds = []
+        original = settings_service.AssigneeResolver
+        monkeypatch.setattr(
+            settings_service, "AssigneeResolver",
+            lambda members: builds.append(1) or original(members),
+        )
+
+        for _ in range(3):
+            assert await service.get_assignee_resolver() is first
+        assert builds == []
+
+    async def test_assignee_resolver_follows_other_workers(self, service):
+        """Test a roster write by another process rebuilds the resolver."""
+        import sqlite3
+        from app import database
+
+        first = await service.get_assignee_resolver()
+        other_worker = sqlite3.connect(database.DB_PATH)
+        with other_worker:
+            other_worker.execute(
+                "INSERT INTO team_members (name, initials) VALUES ('Ada Lovelace', 'AL')"
+            )
+        other_worker.close()
+
+        rebuilt = await service.get_assignee_resolver()
+
+        assert rebuilt is not first
+        assert rebuilt.resolve("Ada Lovelace").name == "Ada Lovelace"
+
+    async def test_suggest_index_follows_local_writes(self, service, monkeypatch):
+        """Test local adds, renames and deletes update the index without a rebuild."""
+        from app.services import settings_service
+
+        await service.suggest_team_members("j")
+        builds = []
+        original = settings_service.TeamPrefixIndex
+        monkeypatch.setattr(
+            settings_service, "TeamPrefixIndex",
+            lambda members=(): builds.append(1) or original(members),
+        )
+
+        created = await service.add_team_member(TeamMemberCreate(name="Ada Lovelace"))
+        assert [m.name for m in await service.suggest_team_members("ada")] == ["Ada Lovelace"]
+        await service.update_team_member(created.id, TeamMemberUpdate(name="Ada King"))
+        assert [m.name for m in await service.suggest_team_members("king")] == ["Ada King"]
+        assert await service.suggest_team_members("lovel") == []
+        await service.delete_team_member(created.id)
+
+        assert await service.suggest_team_members("ada") == []
+        assert builds == []
+
+    async def test_suggest_index_rebuilt_after_foreign_write(self, service):
+        """Test a write by another process forces a rebuild."""
+        import sqlite3
+        from app import database
+
+        await service.suggest_team_members("j")
+        other_worker = sqlite3.connect(database.DB_PATH)
+        with other_worker:
+            other_worker.execute(
+                "INSERT INTO team_members (name, initials) VALUES ('Ada Lovelace', 'AL')"
+            )
+        other_worker.close()
+
+        assert [m.name for m in await service.suggest_team_members("ada")] == ["Ada Lovelace"]
+
+    async def test_session_reads_bypass_the_cache(self, service):
+        """Test reads in a session neither use nor fill the cache."""
+        from app.async_database import read_session
+
+        async with read_session() as session:
+            await service.get_team_members(session)
+            await service.get_settings(session)
+
+        assert all(
+            stats["hits"] == stats["misses"] == 0 for stats in service.cache_stats()
+        )
+
+
 class TestIntegrationStatus:
     """Tests for integration status."""
 
@@ -338,12 +539,12 @@ class TestSettingsModels:
 class TestHelperFunctions:
     """Tests for helper functions."""
 
-    def test_get_settings_helper(self):
+    async def test_get_settings_helper(self):
         """Test get_settings helper function."""
-        settings = get_settings()
+        settings = await get_settings()
         assert isinstance(settings, UserSettings)
 
-    def test_update_settings_helper(self):
+    async def test_update_settings_helper(self):
         """Test update_settings helper function."""
         new_settings = UserSettings(
             reminders=ReminderSettings(enabled=False),
@@ -351,12 +552,12 @@ class TestHelperFunctions:
             defaults=DefaultSettings(),
         )
 
-        result = update_settings(new_settings)
+        result = await update_settings(new_settings)
         assert result.reminders.enabled is False
 
-    def test_get_team_members_helper(self):
+    async def test_get_team_members_helper(self):
         """Test get_team_members helper function."""
-        members = get_team_members()
+        members = await get_team_members()
         assert isinstance(members, list)
 
     def test_get_integration_status_helper(self):
@@ -2,6 +2,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from app.assignee_resolver import AssigneeResolver
 from app.models import (
     SlackNotificationRequest,
     ReminderRequest,
@@ -112,19 +113,35 @@ class TestSlackService:
             result = await service.send_notification(
                 assignee="John Smith",
                 message="You have a new task!",
-                team_members=team_members,
+                resolver=AssigneeResolver(team_members),
             )
 
         assert result.success is True
         assert "John Smith" in result.recipients
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("assignee", ["john", "J. Smith", "JS", "Jon Smith"])
+    async def test_send_notification_resolves_extracted_names(
+        self, service, team_members, assignee
+    ):
+        """Test partial, abbreviated and misspelled names reach the right member."""
+        with patch.object(
+            service, "_make_request", new_callable=AsyncMock, return_value={"ok": True}
+        ) as mock_request:
+            result = await service.send_notification(
+                assignee=assignee, message="Hello", resolver=AssigneeResolver(team_members)
+            )
+
+        assert result.success is True
+        assert mock_request.call_args[1]["json_data"]["channel"] == "U123456"
+
     @pytest.mark.asyncio
     async def test_send_notification_user_not_found(self, service, team_members):
         """Test sending notification when user not found in team."""
         result = await service.send_notification(
             assignee="Unknown Person",
             message="Hello",
-            team_members=team_members,
+            resolver=AssigneeResolver(team_members),
         )
 
         assert result.success is False
@@ -146,7 +163,7 @@ class TestSlackService:
         result = await service.send_notification(
             assignee="John Smith",
             message="Hello",
-            team_members=team_members,
+            resolver=AssigneeResolver(team_members),
         )
 
         assert result.success is False
@@ -163,7 +180,7 @@ class TestSlackService:
             result = await service.send_bulk_notifications(
                 assignees=["John Smith", "Sarah Lee"],
                 message="Team reminder!",
-                team_members=team_members,
+                resolver=AssigneeResolver(team_members),
             )
 
         assert result.total_sent == 2
@@ -185,7 +202,7 @@ class TestSlackService:
             result = await service.send_bulk_notifications(
                 assignees=["John Smith", "Sarah Lee"],
                 message="Reminder",
-                team_members=team_members,
+                resolver=AssigneeResolver(team_members),
             )
 
         assert result.total_sent == 1
@@ -197,7 +214,7 @@ class TestSlackService:
         result = await service.send_bulk_notifications(
             assignees=[],
             message="Hello",
-            team_members=team_members,
+            resolver=AssigneeResolver(team_members),
         )
 
         assert result.total_sent == 0
@@ -215,7 +232,7 @@ class TestSlackService:
                 assignee="John Smith",
                 ticket_key="SANAS-456",
                 ticket_url="https://jira.example.com/SANAS-456",
-                team_members=team_members,
+                resolver=AssigneeResolver(team_members),
             )
 
         assert result.success is True
@@ -253,7 +270,7 @@ class TestSlackNotificationHelpers:
             result = await send_slack_notification(
                 assignee="John Smith",
                 message="Hello",
-                team_members=team_members,
+                resolver=AssigneeResolver(team_members),
             )
 
             mock_instance.send_notification.assert_called_once()
@@ -276,7 +293,7 @@ class TestSlackNotificationHelpers:
             result = await send_reminders(
                 assignees=["John Smith"],
                 message="Reminder",
-                team_members=team_members,
+                resolver=AssigneeResolver(team_members),
             )
 
             mock_instance.send_bulk_notifications.assert_called_once()
@@ -0,0 +1,175 @@
+"""Tests for online database snapshots."""
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database, snapshots, storage
+from app.config import settings as app_settings
+from app.main import app
+from app.snapshots import SnapshotInProgressError, create_snapshot
+
+
+def _titles(path) -> list[str]:
+    """Titles of every action item in a database file."""
+    conn = sqlite3.connect(str(path))
+    try:
+        return [row[0] for row in conn.execute("SELECT title FROM action_items ORDER BY id")]
+    finally:
+        conn.close()
+
+
+class TestCreateSnapshot:
+    """Tests for create_snapshot."""
+
+    def test_copies_database(self, tmp_path):
+        """Test the snapshot holds the saved rows and reports its size."""
+        database.save_action_items([{"title": f"Task {n}"} for n in range(3)])
+        destination = tmp_path / "snap.db"
+
+        result = create_snapshot(destination, pages_per_step=1, pause_ms=0)
+
+        assert _titles(destination) == ["Task 0", "Task 1", "Task 2"]
+        assert result["path"] == str(destination)
+        assert result["steps"] == result["pages"] > 1
+        assert result["size_bytes"] == destination.stat().st_size
+        assert not (tmp_path / "snap.db.partial").exists()
+
+    def test_pauses_between_steps(self, tmp_path, monkeypatch):
+        """Test a nonzero pause sleeps after every step but the last."""
+        from app import snapshots
+
+        sleeps = []
+        monkeypatch.setattr(snapshots.time, "sleep", sleeps.append)
+
+        result = create_snapshot(tmp_path / "snap.db", pages_per_step=1, pause_ms=5)
+
+        assert result["steps"] > 1
+        assert sleeps == [0.005] * (result["steps"] - 1)
+
+    def test_pause_slows_the_copy(self, tmp_path):
+        """Test the pause really throttles the copy."""
+        result = create_snapshot(tmp_path / "snap.db", pages_per_step=1, pause_ms=10)
+
+        assert result["duration_ms"] >= (result["steps"] - 1) * 10
+
+    def test_consistent_while_writes_continue(self, tmp_path):
+        """Test writes made during the copy succeed but stay out of the snapshot."""
+        database.save_action_items([{"title": f"Task {n}"} for n in range(200)])
+        destination = tmp_path / "snap.db"
+        written = []
+
+        def write_during_copy(copied: int, total: int) -> None:
+            written.append(database.save_action_item(f"Late {copied}", None, None)["id"])
+
+        create_snapshot(destination, pages_per_step=1, pause_ms=0, progress=write_during_copy)
+
+        titles = _titles(destination)
+        assert len(written) > 1
+        assert len(database.get_pending_action_items()) == 200 + len(written)
+        assert len(titles) == 200
+        assert not any(title.startswith("Late") for title in titles)
+
+    def test_snapshot_passes_integrity_check(self, tmp_path):
+        """Test the snapshot is a valid database with the search index intact."""
+        database.save_action_item("Review budget", None, None)
+        destination = tmp_path / "snap.db"
+
+        create_snapshot(destination, pause_ms=0)
+
+        conn = sqlite3.connect(str(destination))
+        try:
+            assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+            assert conn.execute(
+                "SELECT rowid FROM action_items_fts WHERE action_items_fts MATCH 'budget'"
+            ).fetchall() == [(1,)]
+        finally:
+            conn.close()
+
+    def test_default_path_uses_setting(self, tmp_path, monkeypatch):
+        """Test snapshots land in the configured directory by default."""
+        monkeypatch.setattr(app_settings, "snapshot_dir", str(tmp_path / "snaps"))
+
+        result = create_snapshot(pause_ms=0)
+
+        assert result["path"].startswith(str(tmp_path / "snaps" / "sanas-"))
+
+    def test_one_snapshot_at_a_time(self, tmp_path):
+        """Test a second snapshot is refused while one is running."""
+        errors = []
+
+        def nested(copied: int, total: int) -> None:
+            if not errors:
+                with pytest.raises(SnapshotInProgressError) as exc:
+                    create_snapshot(tmp_path / "second.db")
+                errors.append(exc.value)
+
+        create_snapshot(tmp_path / "first.db", pages_per_step=1, pause_ms=0, progress=nested)
+
+        assert len(errors) == 1
+        assert not (tmp_path / "second.db").exists()
+        assert create_snapshot(tmp_path / "third.db", pause_ms=0)["pages"] > 0
+
+    def test_cli_reports_result(self, tmp_path, capsys):
+        """Test the command line entry point writes the snapshot and prints a summary."""
+        destination = tmp_path / "cli.db"
+
+        snapshots.main([str(destination), "--pages", "2", "--pause-ms", "0"])
+
+        output = capsys.readouterr().out
+        assert destination.exists()
+        assert f"Snapshot {destination}" in output
+        assert "pages (100%)" in output
+
+
+class TestSnapshotEndpoint:
+    """Tests for POST /api/admin/snapshots."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Test client writing snapshots under the test's temp directory."""
+        monkeypatch.setattr(app_settings, "snapshot_dir", str(tmp_path / "snaps"))
+        return TestClient(app)
+
+    def test_takes_snapshot(self, client, tmp_path):
+        """Test the endpoint writes a snapshot and returns its details."""
+        database.save_action_item("Task", None, None)
+
+        response = client.post("/api/admin/snapshots", json={"pages_per_step": 4, "pause_ms": 0})
+
+        data = response.json()
+        assert response.status_code == 201
+        assert data["path"].startswith(str(tmp_path / "snaps"))
+        assert data["steps"] >= data["pages"] // 4
+        assert _titles(data["path"]) == ["Task"]
+
+    def test_body_is_optional(self, client):
+        """Test the endpoint falls back to the configured step settings."""
+        response = client.post("/api/admin/snapshots")
+
+        assert response.status_code == 201
+
+    def test_conflict_while_running(self, client):
+        """Test a snapshot request during another snapshot returns 409."""
+        with snapshots._snapshot_lock:
+            response = client.post("/api/admin/snapshots")
+
+        assert response.status_code == 409
+        assert "in progress" in response.json()["detail"]
+
+    def test_requires_sqlite_engine(self, client, monkeypatch):
+        """Test snapshots are refused when the in-memory engine is selected."""
+        monkeypatch.setattr(app_settings, "storage_engine", "memory")
+        storage.reset_engine()
+
+        response = client.post("/api/admin/snapshots")
+
+        storage.reset_engine()
+        assert response.status_code == 409
+        assert "sqlite" in response.json()["detail"]
+
+    def test_rejects_invalid_step_size(self, client):
+        """Test a zero page step is rejected."""
+        response = client.post("/api/admin/snapshots", json={"pages_per_step": 0})
+
+        assert response.status_code == 422
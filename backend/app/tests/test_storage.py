@@ -0,0 +1,338 @@
+"""Tests for the pluggable storage engines.
+
+The contract tests run against every engine, so the in-memory engine is
+held to the behavior of the SQLite engine.
+"""
+import time
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import storage
+from app.config import settings as app_settings
+from app.database import DEFAULT_TEAM_MEMBERS, DEFAULT_SETTINGS
+from app.main import app
+from app.row_mapping import HISTORY_ITEM_COLUMNS
+from app.storage import SQLiteEngine, MemoryEngine
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def engine(request, isolated_test_db):
+    """Each storage engine, empty apart from the default seed data."""
+    if request.param == "sqlite":
+        return SQLiteEngine()
+    return MemoryEngine()
+
+
+@pytest.fixture
+def memory_backend(monkeypatch):
+    """Select the in-memory engine for the duration of a test."""
+    monkeypatch.setattr(app_settings, "storage_engine", "memory")
+    storage.reset_engine()
+    yield storage.get_engine()
+    storage.reset_engine()
+
+
+def _complete_at(engine, item_id: int, completed_at: int) -> None:
+    """Complete an item and move its completion time to a fixed epoch second."""
+    if isinstance(engine, MemoryEngine):
+        engine._replace(item_id, completed_at=completed_at)
+        return
+    from app import database
+
+    with database.get_db() as conn:
+        conn.execute(
+            "UPDATE action_items SET completed_at = ? WHERE id = ?", (completed_at, item_id)
+        )
+
+
+class TestStorageContract:
+    """Behavior every storage engine must share."""
+
+    def test_seeded_defaults(self, engine):
+        """Test engines start with the default roster and settings."""
+        names = [member["name"] for member in engine.get_all_team_members()]
+
+        assert names == sorted(member[0] for member in DEFAULT_TEAM_MEMBERS)
+        assert engine.get_user_settings() == DEFAULT_SETTINGS
+        assert len(engine.get_team_member_rows()[0]) == 6
+
+    def test_team_member_crud(self, engine):
+        """Test create derives initials, update skips None and delete reports."""
+        member = engine.create_team_member("Ada Lovelace", None, None, None, None)
+
+        updated = engine.update_team_member(member["id"], email="ada@example.com", name=None)
+
+        assert member["initials"] == "AL"
+        assert updated["email"] == "ada@example.com"
+        assert updated["name"] == "Ada Lovelace"
+        assert engine.update_team_member(9999, name="Nobody") is None
+        assert engine.delete_team_member(member["id"]) is True
+        assert engine.get_team_member_by_id(member["id"]) is None
+
+    def test_settings_round_trip(self, engine):
+        """Test saved settings are returned as saved."""
+        saved = {**DEFAULT_SETTINGS, "defaults": {"project": "OPS", "issue_type": "Bug"}}
+
+        engine.save_user_settings(saved)
+
+        assert engine.get_user_settings() == saved
+
+    def test_writes_bump_data_versions(self, engine):
+        """Test each roster and settings write raises only its own counter."""
+        before = engine.get_data_versions()
+
+        member = engine.create_team_member("Ada Lovelace", None, None, None, None)
+        engine.update_team_member(member["id"], email="ada@example.com")
+        engine.delete_team_member(member["id"])
+        after_roster = engine.get_data_versions()
+        engine.save_user_settings(DEFAULT_SETTINGS)
+        after_settings = engine.get_data_versions()
+
+        assert set(before) == {"settings", "team_members"}
+        assert after_roster["team_members"] == before["team_members"] + 3
+        assert after_roster["settings"] == before["settings"]
+        assert after_settings["settings"] == before["settings"] + 1
+        assert after_settings["team_members"] == after_roster["team_members"]
+
+    def test_saved_rows_have_sqlite_shape(self, engine):
+        """Test saved rows carry every column with SQLite-style values."""
+        row = engine.save_action_item("Task", "John", "2025-01-15", overdue=True)
+
+        assert set(row) == {
+            "id", "title", "assignee", "assignee_id", "due_date", "due_on", "selected",
+            "overdue", "ticket_key", "created_at", "completed_at",
+        }
+        assert (row["due_on"], row["selected"], row["overdue"]) == ("2025-01-15", 1, 1)
+        assert row["completed_at"] is None
+
+    def test_batch_update_complete_delete(self, engine):
+        """Test batch operations report only the IDs that exist."""
+        rows = engine.save_action_items([{"title": "A"}, {"title": "B"}, {"title": "C"}])
+        ids = [row["id"] for row in rows]
+
+        updated = engine.update_action_items([
+            {"id": ids[0], "title": "A2", "due_date": "2025-02-01"},
+            {"id": 9999, "title": "Missing"},
+        ])
+        completed = engine.complete_action_items([(ids[1], "SANAS-1"), (9999, None)])
+        deleted = engine.delete_action_items([ids[2], 9999])
+
+        assert [(r["id"], r["title"], r["due_on"]) for r in updated] == [
+            (ids[0], "A2", "2025-02-01")
+        ]
+        assert completed == [ids[1]]
+        assert deleted == [ids[2]]
+        assert [item["id"] for item in engine.get_pending_action_items()] == [ids[0]]
+
+    def test_batch_update_merges_duplicate_ids(self, engine):
+        """Test repeated IDs apply in order, later fields winning, and return one row."""
+        item = engine.save_action_item("A", None, None)
+
+        updated = engine.update_action_items([
+            {"id": item["id"], "title": "First", "due_date": "2025-02-01"},
+            {"id": item["id"], "title": "Second", "selected": False},
+            {"id": item["id"], "title": None},
+        ])
+
+        assert [(r["id"], r["title"], r["due_on"], r["selected"]) for r in updated] == [
+            (item["id"], "Second", "2025-02-01", 0)
+        ]
+
+    def test_batch_complete_keeps_last_ticket_key(self, engine):
+        """Test a repeated ID is completed once, with the last ticket key given."""
+        item = engine.save_action_item("A", None, None)
+
+        completed = engine.complete_action_items([
+            (item["id"], "SANAS-3"), (item["id"], "SANAS-1"), (item["id"], "SANAS-2"),
+        ])
+
+        history = engine.get_action_item_history(limit=10)
+        ticket_key = HISTORY_ITEM_COLUMNS.index("ticket_key")
+        assert completed == [item["id"]]
+        assert [(row[0], row[ticket_key]) for row in history] == [(item["id"], "SANAS-2")]
+
+    def test_pending_keyset_pagination(self, engine):
+        """Test pending pages follow (created_at, id) keyset order."""
+        engine.save_action_items([{"title": f"Task {n}"} for n in range(5)])
+
+        first = engine.get_pending_action_item_rows(limit=2)
+        rest = engine.get_pending_action_item_rows(after=(first[-1][-1], first[-1][0]))
+
+        ids = [row[0] for row in first + rest]
+        assert ids == sorted(ids, reverse=True)
+        assert len(ids) == 5
+
+    def test_overdue_sweep_and_counters(self, engine):
+        """Test the sweep flags past-due pending items and counters follow."""
+        late = engine.save_action_item("Late", "John", "2025-01-10")
+        engine.save_action_item("Future", "John", "2025-03-01")
+        done = engine.save_action_item("Done", "Sarah", "2025-01-05")
+        engine.mark_action_item_completed(done["id"])
+
+        flagged = engine.sweep_overdue_action_items(today=date(2025, 2, 1))
+
+        data = engine.get_analytics_data()
+        assert flagged == 1
+        assert [p["id"] for p in engine.get_pending_action_items() if p["overdue"]] == [late["id"]]
+        assert (data["pending_count"], data["overdue_count"]) == (2, 1)
+        assert data["active_members"] == 1
+        assert data["completed_this_week"] == 1
+
+    @pytest.mark.parametrize("zone", ["Etc/GMT-14", "Etc/GMT+12"])
+    def test_overdue_defaults_to_utc_day(self, engine, zone, monkeypatch):
+        """Test the sweep and batch update judge overdue by the UTC day, not the local one."""
+        today = datetime.now(UTC).date()
+        late = engine.save_action_item("Late", "John", (today - timedelta(days=1)).isoformat())
+        due = engine.save_action_item("Due", "John", today.isoformat())
+        monkeypatch.setenv("TZ", zone)
+        time.tzset()
+        try:
+            flagged = engine.sweep_overdue_action_items()
+            rows = engine.update_action_items([{"id": due["id"], "due_date": today.isoformat()}])
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert flagged == 1
+        assert [p["id"] for p in engine.get_pending_action_items() if p["overdue"]] == [late["id"]]
+        assert rows[0]["overdue"] == 0
+
+    def test_due_date_update_recomputes_overdue(self, engine):
+        """Test a new due date clears or sets overdue, and the counters follow."""
+        today = date(2025, 2, 1)
+        moved = engine.save_action_item("Moved", "John Smith", "2025-01-10")
+        vague = engine.save_action_item("Vague", "John Smith", "2025-01-12")
+        slipped = engine.save_action_item("Slipped", "Sarah Lee", "2025-03-01")
+        done = engine.save_action_item("Done", "Sarah Lee", "2025-01-05")
+        engine.mark_action_item_completed(done["id"])
+        engine.sweep_overdue_action_items(today=today)
+
+        rows = engine.update_action_items([
+            {"id": moved["id"], "due_date": "2025-02-01"},
+            {"id": vague["id"], "due_date": "sometime"},
+            {"id": slipped["id"], "due_date": "2025-01-20"},
+            {"id": done["id"], "due_date": "2025-03-01"},
+        ], today=today)
+
+        overdue = {row["id"]: row["overdue"] for row in rows}
+        data = engine.get_analytics_data()
+        assert overdue == {moved["id"]: 0, vague["id"]: 0, slipped["id"]: 1, done["id"]: 0}
+        assert (data["pending_count"], data["overdue_count"]) == (3, 1)
+        assert engine.sweep_overdue_action_items(today=today) == 0
+
+    def test_search_ranking_and_filters(self, engine):
+        """Test search matches prefixes, ranks denser titles first and filters."""
+        weak = engine.save_action_item("Review budget draft for the offsite", "John", None)
+        strong = engine.save_action_item("Budget budget", "Sarah", None)
+        engine.save_action_item("Café menu", "John", None)
+        engine.mark_action_item_completed(strong["id"])
+
+        ranked = engine.search_action_item_rows("BUDG")
+        pending = engine.search_action_item_rows("budget", status="pending")
+        johns = engine.search_action_item_rows("cafe", assignee="John")
+
+        assert [row[0] for row in ranked] == [strong["id"], weak["id"]]
+        assert [row[0] for row in pending] == [weak["id"]]
+        assert [row[1] for row in johns] == ["Café menu"]
+        assert engine.search_action_item_rows("?!") == []
+
+    def test_archiving_keeps_analytics_and_history(self, engine):
+        """Test archived items leave the live set but not analytics, history or search."""
+        now = 1_750_000_000
+        old = engine.save_action_item("Old", "John", None)
+        recent = engine.save_action_item("Recent", "John", None)
+        _complete_at(engine, old["id"], now - 200 * 86400)
+        _complete_at(engine, recent["id"], now - 86400)
+        window = ("2024-01-01", "2026-01-01")
+        before = engine.get_analytics_data(*window), engine.get_daily_completions(*window)
+
+        archived = engine.archive_completed_action_items_batch(now - 90 * 86400, 10)
+
+        history = engine.get_action_item_history(limit=10)
+        assert archived == 1
+        assert (engine.get_analytics_data(*window), engine.get_daily_completions(*window)) == before
+        assert [(row[0], row[-1]) for row in history] == [(recent["id"], 0), (old["id"], 1)]
+        assert [(row[0], row[-2]) for row in engine.search_action_item_rows("old")] == [
+            (old["id"], now - 200 * 86400)
+        ]
+
+    def test_assignees_follow_the_roster(self, engine):
+        """Test assignee ids resolve, follow renames and unlink on deletion."""
+        known = engine.save_action_item("Known", "sarah lee", None)
+        early = engine.save_action_item("Early", "Ada Lovelace", None)
+        ada = engine.create_team_member("Ada Lovelace", None, None, None, None)
+
+        engine.update_team_member(ada["id"], name="Ada King")
+        engine.delete_team_member(2)
+
+        items = {item["title"]: item for item in engine.get_pending_action_items()}
+        stats = engine.get_analytics_data()["team_stats"]
+        assert known["assignee_id"] == 2
+        assert early["assignee_id"] is None
+        assert (items["Early"]["assignee"], items["Early"]["assignee_id"]) == ("Ada King", ada["id"])
+        assert (items["Known"]["assignee"], items["Known"]["assignee_id"]) == ("sarah lee", None)
+        assert [(s["assignee_id"], s["assignee"], s["initials"]) for s in stats] == [
+            (ada["id"], "Ada King", "AL"), (None, "sarah lee", "SL")
+        ]
+
+    def test_write_batch_isolates_failures(self, engine):
+        """Test a failing call in a write batch does not undo the others."""
+        outcomes = engine.run_write_batch([
+            lambda: engine.save_action_item("Kept", None, None),
+            lambda: engine.save_action_item(None, None, None),
+        ])
+
+        assert [succeeded for succeeded, _ in outcomes] == [True, False]
+        assert [item["title"] for item in engine.get_pending_action_items()] == ["Kept"]
+
+
+class TestEngineSelection:
+    """Tests for choosing the engine through settings."""
+
+    def test_default_engine_is_sqlite(self):
+        """Test the SQLite engine is used unless configured otherwise."""
+        storage.reset_engine()
+
+        assert storage.get_engine().name == "sqlite"
+
+    def test_unknown_engine_rejected(self, monkeypatch):
+        """Test an unknown engine name fails loudly."""
+        monkeypatch.setattr(app_settings, "storage_engine", "postgres")
+        storage.reset_engine()
+
+        with pytest.raises(ValueError, match="postgres"):
+            storage.get_engine()
+        storage.reset_engine()
+
+    def test_api_runs_on_memory_engine(self, memory_backend):
+        """Test API routes read and write through the configured engine."""
+        client = TestClient(app)
+
+        created = client.post(
+            "/api/actions/items/batch",
+            json={"items": [{"title": "In memory", "assignee": "John Smith"}]},
+        )
+        page = client.get("/api/actions/pending").json()
+
+        assert created.status_code == 201
+        assert [item["title"] for item in page["items"]] == ["In memory"]
+        assert memory_backend.get_analytics_data()["pending_count"] == 1
+
+    def test_lifespan_runs_migrations_in_background(self, monkeypatch):
+        """Test startup hands pending backfills to the engine's migrate()."""
+        import threading
+
+        calls = []
+        migrated = threading.Event()
+        monkeypatch.setattr(storage, "_engine", SQLiteEngine())
+        monkeypatch.setattr(SQLiteEngine, "migrate",
+                            lambda self, stop=None: calls.append(stop) or migrated.set() or [])
+
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+            assert migrated.wait(5)
+
+        assert isinstance(calls[0], threading.Event)
+        assert calls[0].is_set()
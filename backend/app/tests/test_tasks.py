@@ -0,0 +1,48 @@
+"""Tests for background periodic tasks."""
+import asyncio
+
+from app.tasks import PeriodicTask
+
+
+class TestPeriodicTask:
+    """Tests for PeriodicTask."""
+
+    async def test_runs_job_repeatedly(self):
+        """Test the job runs on every interval until stopped."""
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        task = PeriodicTask("test", 0.01, job)
+        task.start()
+        await asyncio.sleep(0.05)
+        await task.stop()
+
+        assert len(calls) >= 2
+        assert task.running is False
+
+    async def test_failures_do_not_stop_schedule(self):
+        """Test a failing run is logged and the loop continues."""
+        calls = []
+
+        async def job():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        task = PeriodicTask("test", 0.01, job)
+        task.start()
+        await asyncio.sleep(0.05)
+        await task.stop()
+
+        assert len(calls) >= 2
+
+    async def test_zero_interval_disables(self):
+        """Test an interval of zero never starts the loop."""
+        async def job():
+            raise AssertionError("should not run")
+
+        task = PeriodicTask("test", 0, job)
+        task.start()
+
+        assert task.running is False
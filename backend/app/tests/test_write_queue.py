@@ -0,0 +1,107 @@
+"""Tests for the group-commit write queue."""
+import asyncio
+import sqlite3
+
+from app import database
+from app.async_database import run_db
+from app.write_queue import GroupCommitQueue
+
+
+def _queue(max_batch_size: int = 64, max_latency_ms: float = 5) -> GroupCommitQueue:
+    """Build a queue committing through the real database batch runner."""
+    return GroupCommitQueue(
+        max_batch_size=max_batch_size,
+        max_latency_ms=max_latency_ms,
+        run_batch=lambda calls: run_db(database.run_write_batch, calls),
+    )
+
+
+class TestGroupCommitQueue:
+    """Tests for GroupCommitQueue batching and result delivery."""
+
+    async def test_concurrent_writes_share_one_commit(self):
+        """Test concurrent submits are committed together and get their own rows."""
+        queue = _queue()
+
+        rows = await asyncio.gather(*(
+            queue.submit(database.save_action_item, f"Task {n}", None, None)
+            for n in range(10)
+        ))
+
+        assert [row["title"] for row in rows] == [f"Task {n}" for n in range(10)]
+        assert len({row["id"] for row in rows}) == 10
+        assert (queue.batches, queue.writes) == (1, 10)
+        assert len(database.get_pending_action_items()) == 10
+
+    async def test_batches_are_capped_at_max_size(self):
+        """Test a burst larger than the cap is split into several commits."""
+        queue = _queue(max_batch_size=2)
+
+        await asyncio.gather(*(
+            queue.submit(database.save_action_item, f"Task {n}", None, None)
+            for n in range(5)
+        ))
+
+        assert (queue.batches, queue.writes) == (3, 5)
+
+    async def test_failing_write_does_not_affect_others(self):
+        """Test a failed write raises for its caller while the batch commits."""
+        queue = _queue()
+
+        results = await asyncio.gather(
+            queue.submit(database.save_action_item, "Good", None, None),
+            queue.submit(database.save_action_item, None, None, None),
+            queue.submit(database.save_action_item, "Also good", None, None),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        titles = {item["title"] for item in database.get_pending_action_items()}
+        assert titles == {"Good", "Also good"}
+        assert queue.batches == 1
+
+    async def test_batch_failure_reaches_every_caller(self):
+        """Test an error running the batch itself is raised to all its callers."""
+        async def broken(calls):
+            raise RuntimeError("disk full")
+
+        queue = GroupCommitQueue(max_batch_size=8, max_latency_ms=5, run_batch=broken)
+
+        results = await asyncio.gather(
+            queue.submit(database.save_action_item, "A", None, None),
+            queue.submit(database.save_action_item, "B", None, None),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestRunWriteBatch:
+    """Tests for database.run_write_batch savepoint isolation."""
+
+    def test_failed_call_is_rolled_back_alone(self):
+        """Test partial work of a failing call is undone; other calls commit."""
+        def insert_then_fail():
+            with database.get_db() as conn:
+                conn.execute("INSERT INTO action_items (title) VALUES ('Half done')")
+                raise ValueError("boom")
+
+        outcomes = database.run_write_batch([
+            lambda: database.save_action_item("Kept", None, None),
+            insert_then_fail,
+        ])
+
+        assert outcomes[0][0] is True
+        assert outcomes[1][0] is False and isinstance(outcomes[1][1], ValueError)
+        titles = [item["title"] for item in database.get_pending_action_items()]
+        assert titles == ["Kept"]
+        assert database.get_analytics_data()["pending_count"] == 1
+
+    def test_writer_outside_batch_still_commits_per_block(self):
+        """Test get_db() keeps committing on exit when no batch is active."""
+        database.save_action_item("Solo", None, None)
+
+        with database.get_read_db() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM action_items").fetchone()[0]
+
+        assert count == 1
@@ -0,0 +1,110 @@
+"""Group commit for concurrent database writes.
+
+Each write through get_db() is its own transaction, so a burst of
+concurrent requests pays one commit (and one WAL sync) per write. The
+queue here collects writes submitted by concurrent requests and runs them
+together through database.run_write_batch: one transaction and one commit
+per batch, with each write isolated in a savepoint so that callers still
+get their own results and errors.
+"""
+import asyncio
+import functools
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class GroupCommitQueue:
+    """Batches write operations into shared transactions.
+
+    A batch is flushed when it reaches max_batch_size or when its first
+    write has waited max_latency_ms, whichever comes first. The flushing
+    task only runs while there are writes to process.
+    """
+
+    def __init__(self, max_batch_size: int, max_latency_ms: float,
+                 run_batch: Callable[[list[Callable[[], Any]]], Any]):
+        """Configure the queue.
+
+        Args:
+            max_batch_size: Most writes committed in one transaction.
+            max_latency_ms: Longest a write waits for others to join its batch.
+            run_batch: Async callable running a list of write calls as one
+                batch and returning (succeeded, result or exception) per call.
+        """
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_latency = max(max_latency_ms, 0) / 1000
+        self._run_batch = run_batch
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._flusher: asyncio.Task | None = None
+        self.batches = 0
+        self.writes = 0
+
+    async def submit(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Queue a write and wait for the batch containing it to commit.
+
+        Args:
+            func: Blocking database write function, e.g. database.save_action_item.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Whatever func returned.
+
+        Raises:
+            Exception: Whatever func raised; other writes in the batch still commit.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._flusher = None
+
+        future = loop.create_future()
+        self._queue.put_nowait((functools.partial(func, *args, **kwargs), future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_until_idle())
+        return await future
+
+    async def _flush_until_idle(self) -> None:
+        """Flush batches until the queue is empty."""
+        queue = self._queue
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            deadline = self._loop.time() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - self._loop.time()
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple[Callable[[], Any], asyncio.Future]]) -> None:
+        """Run one batch and hand each caller its result or error."""
+        try:
+            outcomes = await self._run_batch([call for call, _ in batch])
+        except Exception as exc:
+            # The batch transaction itself failed; nothing was committed
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self.batches += 1
+        self.writes += len(batch)
+        for (_, future), (succeeded, value) in zip(batch, outcomes):
+            if future.done():
+                continue
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
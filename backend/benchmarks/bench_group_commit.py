@@ -0,0 +1,52 @@
+"""Benchmark concurrent action item writes with and without group commit.
+
+Usage:
+    uv run python -m benchmarks.bench_group_commit [writes]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import app.database as database
+from app.async_database import run_db, shutdown_executor
+from app.write_queue import GroupCommitQueue
+
+BATCH_SIZES = (1, 8, 64)
+
+
+async def _burst(submit, writes: int) -> float:
+    """Submit concurrent single-item saves; return writes per second."""
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        submit(database.save_action_item, f"Task {n}", "Member", None)
+        for n in range(writes)
+    ))
+    return writes / (time.perf_counter() - start)
+
+
+async def main(writes: int) -> None:
+    """Compare one commit per write against group commit at several batch sizes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "bench.db"
+        database.init_db()
+
+        print(f"{writes} concurrent writes")
+        rate = await _burst(run_db, writes)
+        print(f"  commit per write          {rate:10.0f} writes/s")
+        for size in BATCH_SIZES:
+            queue = GroupCommitQueue(
+                max_batch_size=size,
+                max_latency_ms=2,
+                run_batch=lambda calls: run_db(database.run_write_batch, calls),
+            )
+            rate = await _burst(queue.submit, writes)
+            print(f"  group commit, batch {size:<4} {rate:10.0f} writes/s   {queue.batches} commits")
+
+        shutdown_executor()
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000))
@@ -0,0 +1,78 @@
+"""Benchmark row mapping against the sqlite3.Row -> dict -> model path.
+
+Usage:
+    uv run python -m benchmarks.bench_row_mapping [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import app.database as database
+from app.models import TeamMember, PendingActionItem
+from app.row_mapping import TEAM_MEMBER_MAPPER, PENDING_ITEM_MAPPER
+
+REPEATS = 5
+
+
+def _best_of(func) -> float:
+    """Return the best wall time of several runs, in milliseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def _seed(rows: int) -> None:
+    """Fill the database with team members and pending action items."""
+    with database.get_db() as conn:
+        conn.executemany(
+            "INSERT INTO team_members (name, initials, slack_id, jira_account_id, email) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(f"Member {i}", "MB", f"@m{i}", f"J-{i}", f"m{i}@example.com") for i in range(rows)],
+        )
+    database.save_action_items(
+        [{"title": f"Task {i}", "assignee": f"Member {i}", "overdue": i % 3 == 0} for i in range(rows)]
+    )
+
+
+def main(rows: int) -> None:
+    """Run both paths on the same data and print the timings."""
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "bench.db"
+        database.init_db()
+        _seed(rows)
+
+        cases = {
+            "team members": (
+                lambda: [TeamMember(**row) for row in database.get_all_team_members()],
+                lambda: TEAM_MEMBER_MAPPER.map_rows(database.get_team_member_rows()),
+            ),
+            "pending items": (
+                lambda: [
+                    PendingActionItem(
+                        id=item["id"],
+                        title=item["title"],
+                        assignee=item["assignee"],
+                        due_date=item["due_date"],
+                        overdue=bool(item["overdue"]),
+                    )
+                    for item in database.get_pending_action_items()
+                ],
+                lambda: PENDING_ITEM_MAPPER.map_rows(database.get_pending_action_item_rows()),
+            ),
+        }
+
+        print(f"{rows} rows, best of {REPEATS}")
+        for name, (baseline, mapped) in cases.items():
+            before = _best_of(baseline)
+            after = _best_of(mapped)
+            print(f"  {name:<14} dict+validate {before:8.2f} ms   mapped {after:8.2f} ms   {before / after:4.1f}x")
+
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -133,6 +133,11 @@ export const settingsApi = {
     return fetchApi('/api/team')
   },
 
+  async suggestTeamMembers(prefix, limit = 10) {
+    const params = new URLSearchParams({ prefix, limit: String(limit) })
+    return fetchApi(`/api/team/suggest?${params}`)
+  },
+
   async addTeamMember(member) {
     return fetchApi('/api/team', {
       method: 'POST',